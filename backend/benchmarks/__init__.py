@@ -0,0 +1,9 @@
+# =============================================================================
+# PRISM Writer Backend - Offline Benchmarks
+# =============================================================================
+# 디렉토리: backend/benchmarks/
+# 역할: 외부 서비스(Supabase, LLM) 없이 API 핫패스 부하 측정
+# 실행:
+#   cd backend && python -m benchmarks.run --concurrency 32 --requests 2000 --output bench.json
+#   python -m benchmarks.run --baseline bench.json        # 이전 결과와 비교
+# =============================================================================
@@ -0,0 +1,98 @@
+# =============================================================================
+# PRISM Writer Backend - Benchmark Synthetic Data
+# =============================================================================
+# 파일: backend/benchmarks/corpus.py
+# 역할: 합성 참고 문서 코퍼스 / 글(draft) + 참조 생성 (시드 고정 → 실행 간 동일 데이터)
+# =============================================================================
+
+import random
+import uuid
+
+WORDS = (
+    "글쓰기 문장 구조 논리 근거 주장 사례 독자 목적 요약 결론 서론 본론 단락 "
+    "writing structure evidence claim example reader purpose summary outline draft"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)) + "."
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def make_corpus(documents: int = 50, chunks_per_document: int = 40, seed: int = 0) -> list[dict]:
+    """
+    합성 청크 코퍼스
+
+    Returns:
+        [{"id", "document_id", "chunk_index", "content", "metadata", "similarity", "title"}]
+        (헤더 청크는 metadata.header/header_level 포함)
+    """
+    rng = random.Random(seed)
+    chunks = []
+    for d in range(documents):
+        document_id = _uuid(rng)
+        title = f"참고 문서 {d + 1}"
+        for i in range(chunks_per_document):
+            metadata = {"page": i // 4 + 1, "token_count": 0}
+            if i % 5 == 0:
+                metadata.update({"header": f"{d + 1}.{i // 5 + 1} {_sentence(rng, 3)[:-1]}",
+                                 "header_level": 1 + (i // 5) % 2})
+            content = " ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(3, 8)))
+            chunks.append({
+                "id": _uuid(rng),
+                "document_id": document_id,
+                "chunk_index": i,
+                "content": content,
+                "metadata": metadata,
+                "similarity": round(rng.uniform(0.5, 0.95), 4),
+                "title": title,
+            })
+    return chunks
+
+
+def make_drafts(
+    chunks: list[dict],
+    drafts: int = 20,
+    references_per_draft: int = 50,
+    seed: int = 1
+) -> dict[str, list[dict]]:
+    """
+    글별 참조 생성 요청 (문단/청크 조합 중복 없음)
+
+    Returns:
+        {draft_id: [{"chunk_id", "paragraph_index", "reference_type"}]}
+    """
+    rng = random.Random(seed)
+    result = {}
+    for _ in range(drafts):
+        slots = set()
+        items = []
+        while len(items) < references_per_draft:
+            slot = (rng.choice(chunks)["id"], rng.randint(0, references_per_draft))
+            if slot in slots:
+                continue
+            slots.add(slot)
+            items.append({
+                "chunk_id": slot[0],
+                "paragraph_index": slot[1],
+                "reference_type": rng.choice(("citation", "summary", "quote")),
+            })
+        result[_uuid(rng)] = items
+    return result
+
+
+def chunk_table(chunks: list[dict], user_id: str) -> dict[str, dict]:
+    """FakeSupabaseClient용 rag_chunks 행 (rag_documents(title, user_id) 임베디드 조인 형태, 전부 user_id 소유)"""
+    return {
+        chunk["id"]: {
+            "id": chunk["id"],
+            "document_id": chunk["document_id"],
+            "content": chunk["content"],
+            "metadata": chunk["metadata"],
+            "rag_documents": {"title": chunk["title"], "user_id": user_id},
+        }
+        for chunk in chunks
+    }
@@ -0,0 +1,251 @@
+# =============================================================================
+# PRISM Writer Backend - Benchmark Stand-ins
+# =============================================================================
+# 파일: backend/benchmarks/fakes.py
+# 역할: 지연시간 분포를 설정할 수 있는 가짜 LLM / 검색기 / Supabase 클라이언트
+#       + 단계별 소요 시간 기록기
+# =============================================================================
+
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Optional
+import asyncio
+import json
+import random
+import time
+
+
+# =============================================================================
+# Latency Model
+# =============================================================================
+class LatencyModel:
+    """
+    지연시간 분포 (밀리초)
+
+    사양 문자열: "const:20", "uniform:5-30", "lognormal:40,0.5" (중앙값 40ms, sigma 0.5), "0"
+    """
+
+    def __init__(self, kind: str = "const", a: float = 0.0, b: float = 0.0, seed: Optional[int] = None):
+        if kind not in ("const", "uniform", "lognormal"):
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {kind}")
+        self.kind = kind
+        self.a = a
+        self.b = b
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def parse(cls, spec: str, seed: Optional[int] = None) -> "LatencyModel":
+        kind, _, args = spec.partition(":")
+        if not args:
+            return cls("const", float(kind), seed=seed)
+        if kind == "uniform":
+            low, high = args.split("-")
+            return cls(kind, float(low), float(high), seed=seed)
+        if kind == "lognormal":
+            median, sigma = args.split(",")
+            return cls(kind, float(median), float(sigma), seed=seed)
+        return cls(kind, float(args), seed=seed)
+
+    def sample_ms(self) -> float:
+        if self.kind == "uniform":
+            return self._rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return self.a * self._rng.lognormvariate(0.0, self.b)
+        return self.a
+
+    async def sleep(self) -> None:
+        delay = self.sample_ms()
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "a": self.a, "b": self.b}
+
+
+# =============================================================================
+# Stage Recorder
+# =============================================================================
+class StageRecorder:
+    """파이프라인 단계별 소요 시간(ms) 수집"""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        self.samples[stage].append(elapsed_ms)
+
+    @asynccontextmanager
+    async def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def clear(self) -> None:
+        self.samples.clear()
+
+
+class TimedProxy:
+    """대상 객체의 비동기 메서드 호출 시간을 "{prefix}.{메서드}" 단계로 기록하는 프록시"""
+
+    def __init__(self, target, recorder: StageRecorder, prefix: str):
+        self._target = target
+        self._recorder = recorder
+        self._prefix = prefix
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+
+        async def timed(*args, **kwargs):
+            async with self._recorder.stage(f"{self._prefix}.{name}"):
+                return await attr(*args, **kwargs)
+
+        return timed
+
+
+# =============================================================================
+# Fake LLM (OpenAI 호환 chat.completions.create)
+# =============================================================================
+class FakeChatClient:
+    """
+    목차 JSON을 생성하는 가짜 LLM
+
+    - 첫 토큰까지 first_token 지연, 이후 조각마다 per_token 지연
+    - stream=True면 OpenAI 스트리밍 청크 형태로 반환
+    """
+
+    def __init__(
+        self,
+        first_token: LatencyModel,
+        per_token: LatencyModel,
+        recorder: Optional[StageRecorder] = None,
+        items: int = 10,
+        piece_chars: int = 24
+    ):
+        self.first_token = first_token
+        self.per_token = per_token
+        self.recorder = recorder or StageRecorder()
+        self.items = items
+        self.piece_chars = piece_chars
+        self.prompt_chars: list[int] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _outline_json(self, messages: list[dict]) -> str:
+        self.prompt_chars.append(sum(len(message.get("content") or "") for message in messages))
+        outline = [
+            {"title": f"섹션 {i + 1}", "depth": 1 if i % 3 == 0 else 2}
+            for i in range(self.items)
+        ]
+        return json.dumps(outline, ensure_ascii=False)
+
+    def _pieces(self, text: str) -> list[str]:
+        return [text[i:i + self.piece_chars] for i in range(0, len(text), self.piece_chars)]
+
+    async def _create(self, model: str, messages: list[dict], stream: bool = False, **kwargs):
+        text = self._outline_json(messages)
+        if stream:
+            return self._stream(text)
+
+        started = time.perf_counter()
+        await self.first_token.sleep()
+        for _ in self._pieces(text)[1:]:
+            await self.per_token.sleep()
+        self.recorder.record("llm.total", (time.perf_counter() - started) * 1000)
+        message = SimpleNamespace(content=text)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def _stream(self, text: str):
+        started = time.perf_counter()
+        await self.first_token.sleep()
+        self.recorder.record("llm.first_token", (time.perf_counter() - started) * 1000)
+        for i, piece in enumerate(self._pieces(text)):
+            if i:
+                await self.per_token.sleep()
+            delta = SimpleNamespace(content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+        self.recorder.record("llm.total", (time.perf_counter() - started) * 1000)
+
+
+# =============================================================================
+# Fake Retriever
+# =============================================================================
+class FakeRetriever:
+    """합성 코퍼스에서 문서별 구조 청크를 돌려주는 가짜 ChunkRetriever"""
+
+    def __init__(self, chunks: list[dict], latency: LatencyModel, recorder: StageRecorder):
+        self.latency = latency
+        self.recorder = recorder
+        self.by_document: dict[str, list[dict]] = defaultdict(list)
+        for chunk in chunks:
+            self.by_document[chunk["document_id"]].append(chunk)
+
+    async def retrieve_structure_chunks(
+        self,
+        topic: str,
+        doc_ids: Optional[list[str]] = None,
+        top_k: int = 50,
+        user_id: Optional[str] = None
+    ) -> list[dict]:
+        async with self.recorder.stage("retriever.structure"):
+            await self.latency.sleep()
+            chunks = [chunk for doc_id in doc_ids or () for chunk in self.by_document.get(doc_id, ())]
+            return [dict(chunk) for chunk in chunks[:top_k]]
+
+
+# =============================================================================
+# Fake Supabase (ChunkContentLoader용 rag_chunks 조회)
+# =============================================================================
+class _FakeQuery:
+    def __init__(self, client: "FakeSupabaseClient", table: str):
+        self.client = client
+        self.table_name = table
+        self.ids: Optional[list[str]] = None
+        self.filters: dict[str, str] = {}
+
+    def select(self, columns: str) -> "_FakeQuery":
+        return self
+
+    def in_(self, column: str, values: list[str]) -> "_FakeQuery":
+        self.ids = list(values)
+        return self
+
+    def eq(self, column: str, value: str) -> "_FakeQuery":
+        self.filters[column] = value
+        return self
+
+    def _matches(self, row: dict) -> bool:
+        # "rag_documents.user_id" → 임베디드 조인 행의 컬럼
+        for column, value in self.filters.items():
+            current = row
+            for part in column.split("."):
+                current = (current or {}).get(part)
+            if current != value:
+                return False
+        return True
+
+    async def execute(self):
+        async with self.client.recorder.stage(f"supabase.{self.table_name}"):
+            await self.client.latency.sleep()
+            rows = self.client.tables.get(self.table_name, {})
+            ids = self.ids if self.ids is not None else list(rows)
+            return SimpleNamespace(data=[rows[i] for i in ids if i in rows and self._matches(rows[i])])
+
+
+class FakeSupabaseClient:
+    """table().select().in_().eq().execute()만 지원하는 가짜 Supabase 클라이언트"""
+
+    def __init__(self, tables: dict[str, dict[str, dict]], latency: LatencyModel, recorder: StageRecorder):
+        """
+        Args:
+            tables: {테이블명: {id: 행}}
+        """
+        self.tables = tables
+        self.latency = latency
+        self.recorder = recorder
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(self, name)
@@ -0,0 +1,352 @@
+# =============================================================================
+# PRISM Writer Backend - Benchmark Runner
+# =============================================================================
+# 파일: backend/benchmarks/run.py
+# 역할: main.py 앱을 ASGI 레벨에서 직접 호출하는 부하 드라이버
+#       (의존성은 가짜 검색기/LLM/Supabase로 교체, 네트워크 없음)
+# 출력: 엔드포인트별 처리량 + p50/p95/p99, 단계별 p50/p95/p99 → JSON
+# 실행:
+#   cd backend && python -m benchmarks.run --concurrency 32 --requests 2000 --output bench.json
+#   python -m benchmarks.run --output new.json --baseline bench.json
+# =============================================================================
+
+from datetime import datetime, timezone
+from typing import Callable, Optional
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import uuid
+
+from benchmarks.corpus import chunk_table, make_corpus, make_drafts
+from benchmarks.fakes import (
+    FakeChatClient,
+    FakeRetriever,
+    FakeSupabaseClient,
+    LatencyModel,
+    StageRecorder,
+    TimedProxy,
+)
+
+SCENARIOS = (
+    "outline.generate",
+    "outline.generate_stream",
+    "references.get",
+    "references.batch_create",
+    "references.shift",
+)
+
+BENCHMARK_INTERNAL_TOKEN = "benchmark-internal-token"
+# 합성 코퍼스 문서 소유자 = 벤치마크 요청자 (참조 조회 시 청크 내용이 채워지도록)
+BENCHMARK_USER_ID = "00000000-0000-4000-8000-000000000001"
+
+# 시나리오가 실제 경로를 지났는지 확인하는 필수 단계 (주입한 가짜 의존성이 호출되지 않으면
+# 더미 핸들러를 측정한 것이므로 결과를 버림)
+REQUIRED_STAGES = {
+    "outline.generate": "llm.total",
+    "outline.generate_stream": "llm.total",
+}
+
+
+# =============================================================================
+# Statistics
+# =============================================================================
+def percentile(sorted_values: list[float], q: float) -> float:
+    """nearest-rank 백분위수 (sorted_values는 오름차순)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: list[float]) -> dict:
+    values = sorted(samples)
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3) if values else 0.0,
+    }
+
+
+# =============================================================================
+# Harness
+# =============================================================================
+class BenchmarkHarness:
+    """앱 의존성 교체 + 시나리오별 요청 생성"""
+
+    def __init__(self, args: argparse.Namespace):
+        # DATABASE_URL이 있으면 startup에서 실제 풀을 만들므로 제거 후 앱 import
+        os.environ.pop("DATABASE_URL", None)
+        # 벤치마크 클라이언트 = 신뢰된 프론트엔드 서버 (--tier 헤더가 적용되도록)
+        os.environ["PRISM_INTERNAL_TOKEN"] = BENCHMARK_INTERNAL_TOKEN
+        from main import app
+        from src.application.use_cases.generate_outline import GenerateOutlineUseCase
+        from src.infrastructure.chunk_content import ChunkContentLoader
+        from src.infrastructure.llm_gateway import LLMGateway
+        from src.infrastructure.references_repository import InMemoryReferencesRepository
+        from src.presentation.api import outline, references
+
+        self.app = app
+        self.args = args
+        self.recorder = StageRecorder()
+        recorder = self.recorder
+
+        self.chunks = make_corpus(args.documents, args.chunks_per_document, seed=args.seed)
+        self.document_ids = sorted({chunk["document_id"] for chunk in self.chunks})
+        self.drafts = make_drafts(self.chunks, args.drafts, args.references_per_draft, seed=args.seed + 1)
+        self.draft_ids = list(self.drafts)
+
+        self.llm_client = FakeChatClient(
+            LatencyModel.parse(args.llm_first_token, seed=args.seed),
+            LatencyModel.parse(args.llm_per_token, seed=args.seed + 1),
+            recorder=recorder,
+        )
+        # 속도 제한은 측정 대상이 아니므로 사실상 해제 (동시성 상한만 유지)
+        self.llm_gateway = LLMGateway(
+            self.llm_client,
+            max_concurrency=args.llm_concurrency,
+            tier_limits={tier: (1e6, 10 ** 6) for tier in range(5)},
+        )
+        retriever = FakeRetriever(
+            self.chunks, LatencyModel.parse(args.retriever_latency, seed=args.seed + 2), recorder
+        )
+
+        class TimedOutlineUseCase(GenerateOutlineUseCase):
+            def _format_chunks_for_prompt(self, chunks: list[dict]) -> str:
+                started = time.perf_counter()
+                try:
+                    return super()._format_chunks_for_prompt(chunks)
+                finally:
+                    recorder.record("outline.pack_context", (time.perf_counter() - started) * 1000)
+
+        packer = outline._context_packer
+        gateway = self.llm_gateway
+        app.dependency_overrides[outline.get_generate_outline_use_case] = lambda: TimedOutlineUseCase(
+            retriever=retriever, llm_gateway=gateway, context_packer=packer
+        )
+
+        self.repository = InMemoryReferencesRepository()
+        supabase = FakeSupabaseClient(
+            {"rag_chunks": chunk_table(self.chunks, BENCHMARK_USER_ID)},
+            LatencyModel.parse(args.supabase_latency, seed=args.seed + 3),
+            recorder,
+        )
+        loader = ChunkContentLoader(supabase, cache_size=args.chunk_cache_size)
+        timed_repository = TimedProxy(self.repository, recorder, "repository")
+        timed_loader = TimedProxy(loader, recorder, "chunk_loader")
+        app.dependency_overrides[references.get_references_repository] = lambda: timed_repository
+        app.dependency_overrides[references.get_chunk_content_loader] = lambda: timed_loader
+
+    async def seed(self) -> None:
+        for draft_id, items in self.drafts.items():
+            await self.repository.create_many(draft_id, items)
+
+    # -------------------------------------------------------------------------
+    # Requests (시나리오별 i번째 요청: (method, path, json body))
+    # -------------------------------------------------------------------------
+    def request_factory(self, scenario: str) -> Callable[[int], tuple[str, str, Optional[dict]]]:
+        docs = self.document_ids
+
+        def outline_body(i: int) -> dict:
+            start = (i * 3) % len(docs)
+            return {
+                "topic": f"벤치마크 주제 {i}",
+                "document_ids": [docs[(start + k) % len(docs)] for k in range(3)],
+                "max_depth": 3,
+            }
+
+        if scenario == "outline.generate":
+            return lambda i: ("POST", "/v1/outline/generate", outline_body(i))
+        if scenario == "outline.generate_stream":
+            return lambda i: ("POST", "/v1/outline/generate/stream", outline_body(i))
+        if scenario == "references.get":
+            return lambda i: ("GET", f"/v1/drafts/{self.draft_ids[i % len(self.draft_ids)]}/references", None)
+        if scenario == "references.batch_create":
+            items = next(iter(self.drafts.values()))
+            return lambda i: (
+                "POST", f"/v1/drafts/{uuid.uuid4()}/references/batch", {"references": items}
+            )
+        if scenario == "references.shift":
+            # 삽입 후 같은 위치 삭제를 번갈아 → 데이터 크기 일정
+            return lambda i: (
+                "POST",
+                f"/v1/drafts/{self.draft_ids[(i // 2) % len(self.draft_ids)]}/references/shift",
+                {"start_index": 5, "insert_count": 1} if i % 2 == 0
+                else {"start_index": 5, "delete_count": 1},
+            )
+        raise ValueError(f"알 수 없는 시나리오입니다: {scenario}")
+
+    # -------------------------------------------------------------------------
+    # Load Driver
+    # -------------------------------------------------------------------------
+    async def run_scenario(self, client, scenario: str, total: int, concurrency: int) -> dict:
+        make_request = self.request_factory(scenario)
+        latencies: list[float] = []
+        statuses: dict[int, int] = {}
+        counter = iter(range(total))
+
+        async def worker() -> None:
+            for i in counter:
+                method, path, body = make_request(i)
+                started = time.perf_counter()
+                response = await client.request(method, path, json=body)
+                await response.aread()
+                latencies.append((time.perf_counter() - started) * 1000)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        self.recorder.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+        required = REQUIRED_STAGES.get(scenario)
+        if required and required not in self.recorder.samples:
+            raise RuntimeError(
+                f"{scenario}: '{required}' 단계가 기록되지 않음 "
+                f"(엔드포인트가 주입한 의존성을 사용하지 않음, 측정 결과 무효)"
+            )
+
+        return {
+            "requests": total,
+            "concurrency": concurrency,
+            "errors": sum(count for status, count in statuses.items() if status >= 400),
+            "status_codes": {str(status): count for status, count in sorted(statuses.items())},
+            "throughput_rps": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+            "latency": summarize(latencies),
+            "stages": {stage: summarize(samples) for stage, samples in sorted(self.recorder.samples.items())},
+        }
+
+    async def run(self) -> dict:
+        import httpx
+
+        await self.seed()
+        transport = httpx.ASGITransport(app=self.app)
+        results = {}
+        headers = {
+            "X-User-Tier": str(self.args.tier),
+            "X-User-Id": BENCHMARK_USER_ID,
+            "X-Prism-Internal-Token": BENCHMARK_INTERNAL_TOKEN,
+        }
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+            for scenario in self.args.scenarios:
+                if self.args.warmup:
+                    await self.run_scenario(client, scenario, self.args.warmup, self.args.concurrency)
+                results[scenario] = await self.run_scenario(
+                    client, scenario, self.args.requests, self.args.concurrency
+                )
+                logging.getLogger(__name__).warning(
+                    f"{scenario}: {results[scenario]['throughput_rps']} req/s, "
+                    f"p50={results[scenario]['latency']['p50_ms']}ms, "
+                    f"p99={results[scenario]['latency']['p99_ms']}ms"
+                )
+        prompt_chars = self.llm_client.prompt_chars
+        return {
+            "meta": run_metadata(self.args),
+            "endpoints": results,
+            "llm": {
+                "calls": len(prompt_chars),
+                "avg_prompt_chars": round(sum(prompt_chars) / len(prompt_chars), 1) if prompt_chars else 0.0,
+                "gateway": self.llm_gateway.metrics.to_dict(),
+            },
+        }
+
+
+# =============================================================================
+# Output
+# =============================================================================
+def run_metadata(args: argparse.Namespace) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    config = {key: value for key, value in vars(args).items() if key not in ("output", "baseline")}
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "config": config,
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """엔드포인트별 처리량/지연 변화율 (%) 요약 줄"""
+    lines = [f"baseline={baseline['meta'].get('commit')} current={current['meta'].get('commit')}"]
+    for scenario, result in current["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(scenario)
+        if not before:
+            continue
+
+        def delta(new: float, old: float) -> str:
+            return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+        lines.append(
+            f"{scenario}: rps {delta(result['throughput_rps'], before['throughput_rps'])}, "
+            f"p50 {delta(result['latency']['p50_ms'], before['latency']['p50_ms'])}, "
+            f"p95 {delta(result['latency']['p95_ms'], before['latency']['p95_ms'])}, "
+            f"p99 {delta(result['latency']['p99_ms'], before['latency']['p99_ms'])}"
+        )
+    return lines
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="PRISM Writer API 오프라인 벤치마크")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="쉼표로 구분한 시나리오")
+    parser.add_argument("--requests", type=int, default=500, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="시나리오당 측정 제외 요청 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tier", type=int, default=4, help="X-User-Tier 헤더 (입장 제어 tier 레인)")
+    parser.add_argument("--documents", type=int, default=50)
+    parser.add_argument("--chunks-per-document", type=int, default=40)
+    parser.add_argument("--drafts", type=int, default=20)
+    parser.add_argument("--references-per-draft", type=int, default=50)
+    parser.add_argument("--chunk-cache-size", type=int, default=4096, help="ChunkContentLoader 캐시 크기")
+    parser.add_argument("--llm-first-token", default="lognormal:300,0.4", help="LLM 첫 토큰 지연 (ms)")
+    parser.add_argument("--llm-per-token", default="const:2", help="LLM 조각당 지연 (ms)")
+    parser.add_argument("--llm-concurrency", type=int, default=64, help="LLMGateway 동시 호출 상한")
+    parser.add_argument("--retriever-latency", default="lognormal:30,0.3", help="구조 검색 지연 (ms)")
+    parser.add_argument("--supabase-latency", default="lognormal:15,0.3", help="Supabase 조회 지연 (ms)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (없으면 stdout)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> dict:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    result = asyncio.run(BenchmarkHarness(args).run())
+    payload = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for line in compare(result, baseline):
+            print(line, file=sys.stderr)
+    return result
+
+
+if __name__ == "__main__":
+    main()
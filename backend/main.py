@@ -8,8 +8,13 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 import os
 
+from src.infrastructure.admission import AdmissionController, AdmissionMiddleware
+from src.infrastructure.telemetry import telemetry
+from src.infrastructure.warmup import BackgroundWarmup
+
 # =============================================================================
 # Application Instance
 # =============================================================================
@@ -21,6 +26,16 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# =============================================================================
+# Admission Control (라우트 등급 × 사용자 등급별 동시 처리 제한)
+# =============================================================================
+# CORS보다 먼저 등록 → CORS가 바깥에서 감싸므로 429/503 응답에도 CORS 헤더 포함
+# tier / user_id 헤더는 프론트엔드 서버 공유 비밀(PRISM_INTERNAL_TOKEN)이 있을 때만 신뢰
+admission = AdmissionController()
+app.add_middleware(
+    AdmissionMiddleware, controller=admission, trusted_token=os.getenv("PRISM_INTERNAL_TOKEN") or None
+)
+
 # =============================================================================
 # CORS Middleware Configuration
 # =============================================================================
@@ -40,6 +55,72 @@ app.add_middleware(
 )
 
 
+# =============================================================================
+# Lifecycle Events (DB 커넥션 풀)
+# =============================================================================
+# DATABASE_URL이 설정된 경우에만 asyncpg 풀 생성 (없으면 Supabase HTTP 경로 사용)
+app.state.pg_pool = None
+app.state.vector_store = None
+
+
+@app.on_event("startup")
+async def startup_pg_pool():
+    """애플리케이션 수명용 PostgreSQL 커넥션 풀 생성"""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        return
+
+    from src.infrastructure.pg_vector_store import AsyncpgVectorStore, create_pg_pool
+    app.state.pg_pool = await create_pg_pool(
+        database_url,
+        min_size=int(os.getenv("PG_POOL_MIN_SIZE", "2")),
+        max_size=int(os.getenv("PG_POOL_MAX_SIZE", "10"))
+    )
+    # 목차 라우터의 ChunkRetriever(vector_store=...)에 주입할 검색 백엔드 (outline.get_retriever)
+    app.state.vector_store = AsyncpgVectorStore(app.state.pg_pool)
+
+
+@app.on_event("startup")
+async def startup_references_backend():
+    """참조 저장소 설정 확인 (REFERENCES_BACKEND=supabase인데 Supabase 설정이 없으면 기동 실패)"""
+    from src.presentation.api.references import check_references_backend
+    check_references_backend()
+
+
+# 무거운 의존성은 사용 시점에 import (main.py import 예산: tests/test_import_budget.py)
+# → 서버가 먼저 /health에 응답하고, 그 사이 백그라운드 스레드에서 미리 로드
+warmup = BackgroundWarmup()
+
+
+@app.on_event("startup")
+async def startup_warmup():
+    """백그라운드 예열 시작 (기동을 기다리지 않음, PRISM_WARMUP=0이면 생략)"""
+    if os.getenv("PRISM_WARMUP", "1") != "0":
+        warmup.start()
+
+
+@app.on_event("startup")
+async def startup_telemetry():
+    """span 일괄 저장 태스크 시작 (asyncpg 풀이 있을 때만 telemetry_logs에 저장)"""
+    # 핸들러는 등록 순서대로 실행 → startup_pg_pool 이후라 app.state.pg_pool 사용 가능
+    telemetry.start(pool=app.state.pg_pool)
+
+
+@app.on_event("shutdown")
+async def shutdown_telemetry():
+    """남은 span flush (shutdown_pg_pool보다 먼저 등록 → 풀 종료 전에 실행)"""
+    await telemetry.stop()
+
+
+@app.on_event("shutdown")
+async def shutdown_pg_pool():
+    """커넥션 풀 정리"""
+    if app.state.pg_pool is not None:
+        await app.state.pg_pool.close()
+        app.state.pg_pool = None
+        app.state.vector_store = None
+
+
 # =============================================================================
 # Health Check Endpoint
 # =============================================================================
@@ -47,15 +128,40 @@ app.add_middleware(
 async def health_check():
     """
     시스템 상태 확인 엔드포인트
-    - DB 연결, LLM 가용성 등을 점검하여 반환
+    - status: ok / degraded (대기열 발생 또는 상한 도달) / saturated (최근 요청 거절)
+    - admission: 라우트 등급 / tier별 처리 중·대기 요청 수와 거절 수
+    - outline_semantic_cache: 유사 주제 목차 캐시 적중률 / 유사도 분포 (비활성이면 null)
     """
+    from src.presentation.api.outline import semantic_cache_stats
+
+    saturation = admission.snapshot()
     return {
-        "status": "ok",
+        "status": saturation["status"],
         "service": "prism-writer-api",
-        "version": "0.1.0"
+        "version": "0.1.0",
+        "admission": saturation["route_classes"],
+        "telemetry": telemetry.stats(),
+        "warmup": warmup.to_dict(),
+        "outline_semantic_cache": semantic_cache_stats()
     }
 
 
+# =============================================================================
+# Metrics Endpoint (Prometheus)
+# =============================================================================
+@app.get("/metrics", tags=["System"], response_class=PlainTextResponse)
+async def metrics():
+    """
+    단계별 지연시간 히스토그램 (Prometheus 텍스트 포맷)
+    - http.* (라우터 핸들러), outline.* (목차 생성 단계), 저장기 카운터
+    - prism_outline_semantic_cache_* (OUTLINE_SEMANTIC_CACHE=1 일 때)
+    """
+    return PlainTextResponse(
+        telemetry.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 # =============================================================================
 # Root Endpoint
 # =============================================================================
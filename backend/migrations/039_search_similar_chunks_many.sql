@@ -0,0 +1,74 @@
+-- =============================================================================
+-- PRISM Writer - Batched Similarity Search Function
+-- =============================================================================
+-- 파일: backend/migrations/039_search_similar_chunks_many.sql
+-- 역할: 여러 쿼리 임베딩을 한 번의 호출로 검색하는 set-returning 함수 추가
+-- 목적: 목차 생성 시 (주제 + 후보 섹션 제목) 다중 검색을 단일 DB 왕복으로 처리
+-- =============================================================================
+
+-- =============================================================================
+-- 1. 다중 쿼리 유사도 검색 함수: search_similar_chunks_many
+-- =============================================================================
+-- 주석(시니어 개발자): 기존 search_similar_chunks는 그대로 유지 (하위 호환성)
+-- 쿼리별 top-k는 LATERAL 서브쿼리로 처리하여 HNSW 인덱스를 그대로 활용
+-- query_index는 입력 배열 순서 (0부터 시작)
+
+CREATE OR REPLACE FUNCTION public.search_similar_chunks_many(
+    query_embeddings vector(1536)[],
+    user_id_param UUID,
+    match_count INTEGER DEFAULT 5,
+    doc_ids_param UUID[] DEFAULT NULL,      -- NULL이면 사용자 전체 문서
+    match_threshold FLOAT DEFAULT 0.0
+)
+RETURNS TABLE (
+    query_index INTEGER,
+    chunk_id UUID,
+    document_id UUID,
+    content TEXT,
+    similarity FLOAT,
+    metadata JSONB
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        (q.ord - 1)::INTEGER AS query_index,
+        m.chunk_id,
+        m.document_id,
+        m.content,
+        m.similarity,
+        m.metadata
+    FROM unnest(query_embeddings) WITH ORDINALITY AS q(embedding, ord)
+    CROSS JOIN LATERAL (
+        SELECT
+            c.id AS chunk_id,
+            c.document_id,
+            c.content,
+            1 - (c.embedding <=> q.embedding) AS similarity,
+            c.metadata
+        FROM public.rag_chunks c
+        INNER JOIN public.rag_documents d ON c.document_id = d.id
+        WHERE d.user_id = user_id_param
+          AND (doc_ids_param IS NULL OR c.document_id = ANY(doc_ids_param))
+          AND 1 - (c.embedding <=> q.embedding) >= match_threshold
+        ORDER BY c.embedding <=> q.embedding
+        LIMIT match_count
+    ) m
+    ORDER BY q.ord, m.similarity DESC;
+END;
+$$;
+
+COMMENT ON FUNCTION public.search_similar_chunks_many IS
+    '다중 쿼리 벡터 유사도 검색 함수 (쿼리별 top-k, query_index로 그룹핑)';
+
+-- =============================================================================
+-- ==================== 롤백 스크립트 (ROLLBACK SECTION) =======================
+-- =============================================================================
+/*
+DROP FUNCTION IF EXISTS public.search_similar_chunks_many(vector(1536)[], UUID, INTEGER, UUID[], FLOAT);
+*/
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- =============================================================================
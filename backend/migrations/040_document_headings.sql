@@ -0,0 +1,106 @@
+-- =============================================================================
+-- PRISM Writer - Document Heading Index
+-- =============================================================================
+-- 파일: backend/migrations/040_document_headings.sql
+-- 역할: 문서별 헤딩(목차) 트리를 수집 시점에 미리 계산하여 저장하는 테이블 생성
+-- 목적: 목차 생성(/v1/outline/generate) 시 벡터 검색 50건 과다 조회 대신
+--       doc_id 키 조회 + 헤딩 대상 경량 재정렬로 구조 정보 확보
+-- =============================================================================
+
+-- =============================================================================
+-- 1. 테이블 생성: rag_document_headings
+-- =============================================================================
+-- 주석(시니어 개발자): 헤딩만 저장하므로 문서당 수십 행 수준 (청크 대비 매우 작음)
+-- position: 문서 내 헤딩 순서 (0부터 시작)
+-- parent_position: 상위 헤딩의 position (최상위는 NULL) → 트리 복원용
+
+CREATE TABLE IF NOT EXISTS public.rag_document_headings (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    document_id UUID NOT NULL REFERENCES public.rag_documents(id) ON DELETE CASCADE,
+    chunk_id UUID REFERENCES public.rag_chunks(id) ON DELETE SET NULL,
+
+    title TEXT NOT NULL,
+    level SMALLINT NOT NULL CHECK (level BETWEEN 1 AND 6),
+    position INTEGER NOT NULL CHECK (position >= 0),
+    parent_position INTEGER,
+
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT unique_heading_per_document UNIQUE(document_id, position)
+);
+
+-- =============================================================================
+-- 2. 인덱스
+-- =============================================================================
+-- UNIQUE(document_id, position)가 document_id = ANY(...) ORDER BY position 조회를 커버
+
+-- =============================================================================
+-- 3. RLS (Row Level Security)
+-- =============================================================================
+
+ALTER TABLE public.rag_document_headings ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own document headings"
+    ON public.rag_document_headings
+    FOR SELECT
+    USING (
+        EXISTS (
+            SELECT 1 FROM public.rag_documents
+            WHERE rag_documents.id = rag_document_headings.document_id
+            AND rag_documents.user_id = auth.uid()
+        )
+    );
+
+CREATE POLICY "Users can insert own document headings"
+    ON public.rag_document_headings
+    FOR INSERT
+    WITH CHECK (
+        EXISTS (
+            SELECT 1 FROM public.rag_documents
+            WHERE rag_documents.id = rag_document_headings.document_id
+            AND rag_documents.user_id = auth.uid()
+        )
+    );
+
+CREATE POLICY "Users can delete own document headings"
+    ON public.rag_document_headings
+    FOR DELETE
+    USING (
+        EXISTS (
+            SELECT 1 FROM public.rag_documents
+            WHERE rag_documents.id = rag_document_headings.document_id
+            AND rag_documents.user_id = auth.uid()
+        )
+    );
+
+-- =============================================================================
+-- 4. 기존 데이터 백필 (헤더 메타데이터가 있는 청크 기준)
+-- =============================================================================
+-- 주석(주니어 개발자): 신규 문서는 수집 파이프라인이 직접 채움
+-- parent_position은 백필에서 계산하지 않음 (재수집 시 채워짐)
+
+INSERT INTO public.rag_document_headings (document_id, chunk_id, title, level, position)
+SELECT
+    c.document_id,
+    c.id,
+    c.metadata->>'header',
+    LEAST(GREATEST((c.metadata->>'header_level')::INT, 1), 6),
+    (ROW_NUMBER() OVER (PARTITION BY c.document_id ORDER BY c.chunk_index) - 1)::INT
+FROM public.rag_chunks c
+WHERE c.metadata ? 'header_level'
+  AND COALESCE(c.metadata->>'header', '') <> ''
+ON CONFLICT (document_id, position) DO NOTHING;
+
+COMMENT ON TABLE public.rag_document_headings IS
+    '문서별 헤딩 트리 (제목, 레벨, 청크 ID, 순서) - 목차 생성용 구조 인덱스';
+
+-- =============================================================================
+-- ==================== 롤백 스크립트 (ROLLBACK SECTION) =======================
+-- =============================================================================
+/*
+DROP TABLE IF EXISTS public.rag_document_headings;
+*/
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- =============================================================================
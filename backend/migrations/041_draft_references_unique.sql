@@ -0,0 +1,38 @@
+-- =============================================================================
+-- PRISM Writer - Draft References Unique Slot Index
+-- =============================================================================
+-- 파일: backend/migrations/041_draft_references_unique.sql
+-- 역할: draft_references에 (draft_id, chunk_id, paragraph_index) 유니크 인덱스 추가
+-- 목적: 중복 참조 검사를 애플리케이션 전체 스캔 대신 인덱스로 처리
+--       일괄 INSERT 시 중복이 있으면 unique_violation(23505)으로 전체 롤백
+-- =============================================================================
+
+-- =============================================================================
+-- 1. 기존 중복 행 정리 (가장 먼저 생성된 행만 유지)
+-- =============================================================================
+
+DELETE FROM draft_references r
+USING draft_references dup
+WHERE r.draft_id = dup.draft_id
+  AND r.chunk_id = dup.chunk_id
+  AND r.paragraph_index = dup.paragraph_index
+  AND (r.created_at, r.id) > (dup.created_at, dup.id);
+
+-- =============================================================================
+-- 2. 유니크 인덱스 생성
+-- =============================================================================
+-- 주석(시니어 개발자): draft_id 선두 컬럼이므로 글 단위 조회/일괄 삭제에도 사용됨
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_draft_references_slot
+    ON draft_references(draft_id, chunk_id, paragraph_index);
+
+-- =============================================================================
+-- ==================== 롤백 스크립트 (ROLLBACK SECTION) =======================
+-- =============================================================================
+/*
+DROP INDEX IF EXISTS idx_draft_references_slot;
+*/
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- =============================================================================
@@ -0,0 +1,93 @@
+-- =============================================================================
+-- PRISM Writer - Draft Paragraph Shift Function
+-- =============================================================================
+-- 파일: backend/migrations/042_shift_draft_paragraphs.sql
+-- 역할: 글 편집(문단 삽입/삭제) 시 참조의 paragraph_index를 한 번에 재배치
+-- 목적: 클라이언트의 참조 개별 삭제/재생성 반복 제거
+--       영향 범위는 (draft_id, paragraph_index) 인덱스 범위 UPDATE 1회로 처리
+-- =============================================================================
+
+-- =============================================================================
+-- 1. 슬롯 유니크 인덱스 → DEFERRABLE 제약 조건으로 교체
+-- =============================================================================
+-- 주석(시니어 개발자): 범위 UPDATE 도중 (예: 3→4, 4→5) 일시적으로 같은 슬롯이
+-- 생길 수 있으므로 함수 안에서만 검사를 커밋 시점으로 미룸 (기본은 IMMEDIATE)
+
+DROP INDEX IF EXISTS idx_draft_references_slot;
+
+ALTER TABLE draft_references
+    ADD CONSTRAINT draft_references_slot_key
+    UNIQUE (draft_id, chunk_id, paragraph_index)
+    DEFERRABLE INITIALLY IMMEDIATE;
+
+-- 범위 UPDATE/DELETE용 인덱스
+CREATE INDEX IF NOT EXISTS idx_draft_references_paragraph
+    ON draft_references(draft_id, paragraph_index);
+
+-- =============================================================================
+-- 2. 문단 이동 함수: shift_draft_paragraphs
+-- =============================================================================
+-- start_index 위치에서 delete_count개 문단을 삭제하고 insert_count개 문단을 삽입한 편집
+--   - [start_index, start_index + delete_count) 범위 참조는 삭제
+--   - start_index + delete_count 이후 참조는 (insert_count - delete_count)만큼 이동
+
+CREATE OR REPLACE FUNCTION public.shift_draft_paragraphs(
+    draft_id_param UUID,
+    start_index INTEGER,
+    delete_count INTEGER DEFAULT 0,
+    insert_count INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    deleted_count INTEGER,
+    shifted_count INTEGER
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_deleted INTEGER := 0;
+    v_shifted INTEGER := 0;
+    v_delta INTEGER := insert_count - delete_count;
+BEGIN
+    IF start_index < 0 OR delete_count < 0 OR insert_count < 0 THEN
+        RAISE EXCEPTION 'start_index, delete_count, insert_count는 0 이상이어야 합니다.';
+    END IF;
+
+    SET CONSTRAINTS draft_references_slot_key DEFERRED;
+
+    IF delete_count > 0 THEN
+        DELETE FROM draft_references
+        WHERE draft_id = draft_id_param
+          AND paragraph_index >= start_index
+          AND paragraph_index < start_index + delete_count;
+        GET DIAGNOSTICS v_deleted = ROW_COUNT;
+    END IF;
+
+    IF v_delta <> 0 THEN
+        UPDATE draft_references
+        SET paragraph_index = paragraph_index + v_delta
+        WHERE draft_id = draft_id_param
+          AND paragraph_index >= start_index + delete_count;
+        GET DIAGNOSTICS v_shifted = ROW_COUNT;
+    END IF;
+
+    RETURN QUERY SELECT v_deleted, v_shifted;
+END;
+$$;
+
+COMMENT ON FUNCTION public.shift_draft_paragraphs IS
+    '문단 삽입/삭제 편집에 맞춰 글 참조의 paragraph_index 일괄 재배치';
+
+-- =============================================================================
+-- ==================== 롤백 스크립트 (ROLLBACK SECTION) =======================
+-- =============================================================================
+/*
+DROP FUNCTION IF EXISTS public.shift_draft_paragraphs(UUID, INTEGER, INTEGER, INTEGER);
+DROP INDEX IF EXISTS idx_draft_references_paragraph;
+ALTER TABLE draft_references DROP CONSTRAINT IF EXISTS draft_references_slot_key;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_draft_references_slot
+    ON draft_references(draft_id, chunk_id, paragraph_index);
+*/
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- =============================================================================
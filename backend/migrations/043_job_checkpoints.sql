@@ -0,0 +1,49 @@
+-- =============================================================================
+-- PRISM Writer - Background Job Checkpoints
+-- =============================================================================
+-- 파일: backend/migrations/043_job_checkpoints.sql
+-- 역할: 장시간 백그라운드 작업(백필, 재임베딩 등)의 진행 위치 저장 테이블
+-- 목적: 작업이 중단되어도 마지막 처리 키부터 재개
+--       배치 UPDATE와 같은 트랜잭션에서 갱신하여 중복/누락 없이 재개
+-- =============================================================================
+
+-- =============================================================================
+-- 1. 테이블 생성: job_checkpoints
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.job_checkpoints (
+    job_name TEXT PRIMARY KEY,
+
+    -- keyset 페이지네이션 위치 (마지막으로 처리한 키, 텍스트로 저장)
+    last_key TEXT,
+
+    -- 진행 통계
+    processed BIGINT NOT NULL DEFAULT 0,   -- 조회한 행 수
+    updated BIGINT NOT NULL DEFAULT 0,     -- 실제 변경한 행 수
+    state JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    completed_at TIMESTAMPTZ
+);
+
+-- =============================================================================
+-- 2. RLS (Row Level Security)
+-- =============================================================================
+-- 주석(시니어 개발자): 서비스 역할(직접 연결) 전용 테이블 - 사용자 정책 없음
+
+ALTER TABLE public.job_checkpoints ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE public.job_checkpoints IS
+    '백그라운드 작업 진행 위치 (chunk_type 백필, 재임베딩 등)';
+
+-- =============================================================================
+-- ==================== 롤백 스크립트 (ROLLBACK SECTION) =======================
+-- =============================================================================
+/*
+DROP TABLE IF EXISTS public.job_checkpoints;
+*/
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- =============================================================================
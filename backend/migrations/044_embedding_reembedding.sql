@@ -0,0 +1,142 @@
+-- =============================================================================
+-- PRISM Writer - Embedding Re-embedding (Shadow Column + Cutover)
+-- =============================================================================
+-- 파일: backend/migrations/044_embedding_reembedding.sql
+-- 역할: 임베딩 모델 교체를 위한 그림자(shadow) 컬럼, 활성 모델 테이블, 전환 함수
+-- 목적: 서비스 중단 없이 백그라운드로 전체 청크 재임베딩 후 한 번에 전환
+-- 절차:
+--   1. 재임베딩 워커가 embedding_next / embedding_next_model_id를 배치로 채움
+--      (검색은 계속 embedding + 활성 모델 사용 = dual-read)
+--   2. 남은 청크가 0이 되면 embedding_next에 HNSW 인덱스 생성 (CONCURRENTLY)
+--   3. cutover_embedding_next(): 컬럼 이름 교환 + 활성 모델 갱신 (카탈로그 변경만, 재작성 없음)
+--   4. 롤백 보존 기간이 지나면 이전 벡터 인덱스 정리:
+--      DROP INDEX CONCURRENTLY idx_rag_chunks_embedding_next_hnsw;
+-- 주의: embedding_next 차원은 vector(1536) - 차원이 다른 모델로 교체할 때는
+--       워커 실행 전에 ALTER COLUMN embedding_next TYPE vector(N) 필요
+-- =============================================================================
+
+-- =============================================================================
+-- 1. 그림자 컬럼 추가
+-- =============================================================================
+
+ALTER TABLE public.rag_chunks
+  ADD COLUMN IF NOT EXISTS embedding_next vector(1536),
+  ADD COLUMN IF NOT EXISTS embedding_next_model_id TEXT,
+  ADD COLUMN IF NOT EXISTS embedding_next_at TIMESTAMPTZ;
+
+COMMENT ON COLUMN public.rag_chunks.embedding_next IS
+    '재임베딩 진행 중인 다음 모델의 벡터 (전환 전까지 검색에 사용하지 않음)';
+
+-- =============================================================================
+-- 2. 활성 임베딩 모델 (단일 행)
+-- =============================================================================
+-- 주석(시니어 개발자): 검색 시 쿼리 임베딩 모델을 이 값으로 결정 (ChunkRetriever dual-read)
+-- embedding 컬럼의 벡터와 항상 같은 모델이어야 하므로 전환 함수 안에서만 변경
+
+CREATE TABLE IF NOT EXISTS public.embedding_active_model (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    model_id TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    activated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO public.embedding_active_model (model_id, dim)
+VALUES ('text-embedding-3-small', 1536)
+ON CONFLICT (id) DO NOTHING;
+
+ALTER TABLE public.embedding_active_model ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Anyone can read active embedding model"
+    ON public.embedding_active_model
+    FOR SELECT
+    USING (true);
+
+-- =============================================================================
+-- 3. 전환 함수: cutover_embedding_next
+-- =============================================================================
+-- embedding ↔ embedding_next (모델 ID, 생성 시각 포함) 컬럼 이름 교환
+-- 교환 후 embedding_next에는 이전 벡터가 남으므로 다시 호출하면 롤백
+
+CREATE OR REPLACE FUNCTION public.cutover_embedding_next(target_model_id TEXT)
+RETURNS BIGINT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_stale BIGINT;
+    v_dim INTEGER;
+BEGIN
+    -- 전환 중 신규 INSERT/UPDATE 차단 (읽기는 허용)
+    LOCK TABLE public.rag_chunks IN SHARE ROW EXCLUSIVE MODE;
+
+    SELECT COUNT(*) INTO v_stale
+    FROM public.rag_chunks
+    WHERE embedding_next IS NULL
+       OR embedding_next_model_id IS DISTINCT FROM target_model_id;
+
+    IF v_stale > 0 THEN
+        RAISE EXCEPTION '재임베딩되지 않은 청크가 %개 남아 있습니다.', v_stale;
+    END IF;
+
+    SELECT vector_dims(embedding_next) INTO v_dim
+    FROM public.rag_chunks
+    LIMIT 1;
+
+    ALTER TABLE public.rag_chunks RENAME COLUMN embedding TO embedding_swap;
+    ALTER TABLE public.rag_chunks RENAME COLUMN embedding_next TO embedding;
+    ALTER TABLE public.rag_chunks RENAME COLUMN embedding_swap TO embedding_next;
+
+    ALTER TABLE public.rag_chunks RENAME COLUMN embedding_model_id TO embedding_model_id_swap;
+    ALTER TABLE public.rag_chunks RENAME COLUMN embedding_next_model_id TO embedding_model_id;
+    ALTER TABLE public.rag_chunks RENAME COLUMN embedding_model_id_swap TO embedding_next_model_id;
+
+    ALTER TABLE public.rag_chunks RENAME COLUMN embedded_at TO embedded_at_swap;
+    ALTER TABLE public.rag_chunks RENAME COLUMN embedding_next_at TO embedded_at;
+    ALTER TABLE public.rag_chunks RENAME COLUMN embedded_at_swap TO embedding_next_at;
+
+    -- 기본값/NULL 허용 정리 (SET NOT NULL은 전체 스캔이 필요하므로 생략, 수집기는 항상 명시)
+    ALTER TABLE public.rag_chunks
+        ALTER COLUMN embedded_at SET DEFAULT NOW(),
+        ALTER COLUMN embedding_next_model_id DROP NOT NULL,
+        ALTER COLUMN embedding_next_model_id DROP DEFAULT,
+        ALTER COLUMN embedding_next_at DROP NOT NULL,
+        ALTER COLUMN embedding_next_at DROP DEFAULT;
+    EXECUTE format(
+        'ALTER TABLE public.rag_chunks ALTER COLUMN embedding_model_id SET DEFAULT %L',
+        target_model_id
+    );
+
+    -- 인덱스 이름도 교환 (idx_rag_chunks_embedding이 항상 검색용 컬럼을 가리키도록)
+    ALTER INDEX IF EXISTS public.idx_rag_chunks_embedding RENAME TO idx_rag_chunks_embedding_swap;
+    ALTER INDEX IF EXISTS public.idx_rag_chunks_embedding_next_hnsw RENAME TO idx_rag_chunks_embedding;
+    ALTER INDEX IF EXISTS public.idx_rag_chunks_embedding_swap RENAME TO idx_rag_chunks_embedding_next_hnsw;
+
+    UPDATE public.embedding_active_model
+    SET model_id = target_model_id,
+        dim = COALESCE(v_dim, dim),
+        activated_at = NOW();
+
+    RETURN (SELECT COUNT(*) FROM public.rag_chunks);
+END;
+$$;
+
+COMMENT ON FUNCTION public.cutover_embedding_next IS
+    '재임베딩 완료 후 embedding ↔ embedding_next 컬럼 교환 및 활성 모델 전환';
+
+-- =============================================================================
+-- ==================== 롤백 스크립트 (ROLLBACK SECTION) =======================
+-- =============================================================================
+/*
+-- 전환 이후라면 먼저 이전 모델로 다시 전환:
+-- SELECT public.cutover_embedding_next('<이전 모델 ID>');
+DROP FUNCTION IF EXISTS public.cutover_embedding_next(TEXT);
+DROP TABLE IF EXISTS public.embedding_active_model;
+DROP INDEX IF EXISTS public.idx_rag_chunks_embedding_next_hnsw;
+ALTER TABLE public.rag_chunks
+  DROP COLUMN IF EXISTS embedding_next,
+  DROP COLUMN IF EXISTS embedding_next_model_id,
+  DROP COLUMN IF EXISTS embedding_next_at;
+*/
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- =============================================================================
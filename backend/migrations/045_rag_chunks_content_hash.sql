@@ -0,0 +1,49 @@
+-- =============================================================================
+-- PRISM Writer - Incremental Re-ingestion (Chunk Content Hash)
+-- =============================================================================
+-- 파일: backend/migrations/045_rag_chunks_content_hash.sql
+-- 역할: rag_chunks에 내용 해시 컬럼 추가, chunk_index 유니크 제약을 DEFERRABLE로 교체
+-- 목적: 문서 재업로드 시 내용이 같은 청크는 기존 행(id, 임베딩)을 그대로 두고
+--       chunk_index/metadata만 제자리 갱신, 새로 생기거나 바뀐 청크만 임베딩
+-- 주의: 기존 행은 content_hash가 NULL - 조회 시 COALESCE(content_hash, md5(content)) 사용
+--       (재수집되는 문서부터 자연스럽게 채워짐)
+-- =============================================================================
+
+-- =============================================================================
+-- 1. 내용 해시 컬럼
+-- =============================================================================
+-- 주석(시니어 개발자): 해시는 md5(content) (UTF-8 hex) - 파이썬 hashlib.md5와 SQL md5()가 동일 값
+
+ALTER TABLE public.rag_chunks
+  ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+COMMENT ON COLUMN public.rag_chunks.content_hash IS
+    '청크 내용 md5 (증분 재수집 시 변경 여부 판단, NULL이면 md5(content)로 계산)';
+
+-- =============================================================================
+-- 2. chunk_index 유니크 제약 → DEFERRABLE
+-- =============================================================================
+-- 재사용 청크의 chunk_index를 제자리에서 밀고 당기는 동안 (예: 3→4, 4→5)
+-- 일시적으로 같은 인덱스가 생길 수 있으므로 수집 트랜잭션 안에서만 커밋 시점으로 미룸
+
+ALTER TABLE public.rag_chunks
+    DROP CONSTRAINT IF EXISTS unique_chunk_per_document;
+
+ALTER TABLE public.rag_chunks
+    ADD CONSTRAINT unique_chunk_per_document
+    UNIQUE (document_id, chunk_index)
+    DEFERRABLE INITIALLY IMMEDIATE;
+
+-- =============================================================================
+-- ==================== 롤백 스크립트 (ROLLBACK SECTION) =======================
+-- =============================================================================
+/*
+ALTER TABLE public.rag_chunks DROP CONSTRAINT IF EXISTS unique_chunk_per_document;
+ALTER TABLE public.rag_chunks
+    ADD CONSTRAINT unique_chunk_per_document UNIQUE (document_id, chunk_index);
+ALTER TABLE public.rag_chunks DROP COLUMN IF EXISTS content_hash;
+*/
+
+-- =============================================================================
+-- 마이그레이션 완료
+-- =============================================================================
@@ -5,7 +5,7 @@
 # 역할: 목차 생성 비즈니스 로직 (RAG + LLM)
 # =============================================================================
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 import json
 import logging
 
@@ -25,6 +25,71 @@ class OutlineItem:
         return {"title": self.title, "depth": self.depth}
 
 
+# =============================================================================
+# Incremental JSON Parser
+# =============================================================================
+class IncrementalOutlineParser:
+    """
+    스트리밍 LLM 출력에서 JSON 배열의 객체를 닫히는 즉시 추출하는 파서
+
+    - '[' 이전의 텍스트(마크다운 코드블록 등)는 무시
+    - 문자열 내부의 중괄호/이스케이프 처리
+    - feed()마다 새로 완성된 객체(dict) 리스트 반환
+    """
+
+    def __init__(self):
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._buffer: list[str] = []
+
+    def feed(self, text: str) -> list[dict]:
+        """토큰 조각 입력, 완성된 최상위 객체 반환"""
+        completed = []
+        for ch in text:
+            if self._done:
+                break
+            if not self._in_array:
+                if ch == "[":
+                    self._in_array = True
+                continue
+
+            if self._depth == 0:
+                # 배열 최상위: 객체 시작 또는 배열 종료만 의미 있음
+                if ch == "{":
+                    self._depth = 1
+                    self._buffer = [ch]
+                elif ch == "]":
+                    self._done = True
+                continue
+
+            self._buffer.append(ch)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        item = json.loads("".join(self._buffer))
+                        if isinstance(item, dict):
+                            completed.append(item)
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"스트리밍 JSON 객체 파싱 실패: {e}")
+                    self._buffer = []
+        return completed
+
+
 # =============================================================================
 # Use Case
 # =============================================================================
@@ -37,21 +102,55 @@ class GenerateOutlineUseCase:
     3. JSON 파싱 및 검증
     """
     
-    def __init__(self, retriever=None, llm_client=None):
+    def __init__(
+        self,
+        retriever=None,
+        llm_client=None,
+        llm_model: str = "gpt-4o-mini",
+        result_cache=None,
+        document_versions=None,
+        llm_gateway=None,
+        context_packer=None,
+        telemetry=None,
+        semantic_cache=None
+    ):
         """
         Args:
             retriever: ChunkRetriever 인스턴스
             llm_client: LLM 클라이언트 (OpenAI 등)
+            llm_model: 목차 생성에 사용할 모델 ID
+            result_cache: OutlineResultCache 인스턴스 (동일 요청 결과 재사용 + 동시 요청 병합)
+            document_versions: DocumentVersionLookup 인스턴스 (캐시 키의 문서 버전)
+            llm_gateway: 공유 LLMGateway (동시성/속도 제한/백오프 재시도)
+                         없고 llm_client만 있으면 인스턴스 전용 게이트웨이 생성
+            context_packer: 참고 자료 토큰 예산 패커 (ContextPacker, 없으면 기본 예산으로 생성)
+            telemetry: 단계별 span 수집기 (없으면 프로세스 공유 인스턴스)
+            semantic_cache: SemanticOutlineCache 인스턴스 (유사 주제 결과 재사용, opt-in)
+                            주제 임베딩에 retriever가 필요하며 LLM 생성 결과만 저장
         """
+        from src.infrastructure.context_packer import ContextPacker
+        from src.infrastructure.llm_gateway import LLMGateway
+        from src.infrastructure.telemetry import telemetry as shared_telemetry
+
         self.retriever = retriever
-        self.llm_client = llm_client
-        self.max_retries = 2
+        self.llm_client = llm_client if llm_client is not None else getattr(llm_gateway, "client", None)
+        self.llm_model = llm_model
+        self.result_cache = result_cache
+        self.document_versions = document_versions
+        if llm_gateway is None and llm_client is not None:
+            llm_gateway = LLMGateway(llm_client)
+        self.llm_gateway = llm_gateway
+        self.context_packer = context_packer or ContextPacker()
+        self.telemetry = telemetry or shared_telemetry
+        self.semantic_cache = semantic_cache
     
     async def execute(
         self,
         topic: str,
         doc_ids: Optional[list[str]] = None,
-        max_depth: int = 3
+        max_depth: int = 3,
+        tier: int = 1,
+        user_id: Optional[str] = None
     ) -> list[OutlineItem]:
         """
         목차 생성 실행
@@ -60,33 +159,113 @@ class GenerateOutlineUseCase:
             topic: 글 주제
             doc_ids: 참조할 문서 ID 리스트
             max_depth: 최대 목차 깊이
+            tier: 사용자 등급 (LLM 속도 제한용, profiles.tier)
+            user_id: 요청 사용자 ID (본인 문서만 참조, 캐시 키에 포함)
             
         Returns:
             OutlineItem 리스트
         """
+        if self.result_cache is None and self.semantic_cache is None:
+            return await self._execute_uncached(topic, doc_ids, max_depth, tier, user_id)
+
+        from src.infrastructure.prompts.outline_prompt import PROMPT_TEMPLATE_VERSION
+
+        doc_versions = {}
+        if self.document_versions is not None and doc_ids:
+            doc_versions = await self.document_versions.get_versions(doc_ids)
+
+        # 정확 일치 캐시 미스일 때만 시맨틱 캐시 조회 (동시 동일 요청은 get_or_compute가 병합)
+        async def compute() -> tuple:
+            return await self._execute_semantic_cached(
+                topic, doc_ids, doc_versions, max_depth, tier, user_id
+            )
+
+        if self.result_cache is None:
+            cached = await compute()
+        else:
+            key = self.result_cache.make_key(
+                topic=topic,
+                doc_ids=doc_ids,
+                doc_versions=doc_versions,
+                max_depth=max_depth,
+                prompt_version=PROMPT_TEMPLATE_VERSION,
+                user_id=user_id
+            )
+            cached = await self.result_cache.get_or_compute(
+                key, compute, doc_ids=doc_ids, should_cache=self._is_cacheable
+            )
+        return [OutlineItem(**data) for data in cached]
+
+    def _is_cacheable(self, result: tuple) -> bool:
+        """LLM이 만든 비어 있지 않은 목차만 캐시 (빈 결과 = 파싱 실패, LLM 없으면 기본 목차)"""
+        return bool(result) and self.llm_gateway is not None
+
+    async def _execute_semantic_cached(
+        self,
+        topic: str,
+        doc_ids: Optional[list[str]],
+        doc_versions: dict,
+        max_depth: int,
+        tier: int = 1,
+        user_id: Optional[str] = None
+    ) -> tuple:
+        """유사 주제 캐시 조회 → 미스면 생성 후 저장 (결과는 불변 tuple[dict])"""
+        from src.infrastructure.prompts.outline_prompt import PROMPT_TEMPLATE_VERSION
+
+        embedded = None
+        # 주석(시니어 개발자): LLM 없는 기본 목차는 생성 비용이 없으므로 캐시하지 않음
+        if self.semantic_cache is not None and self.retriever is not None and self.llm_gateway:
+            try:
+                with self.telemetry.span("outline.semantic_lookup"):
+                    embedded = await self.retriever.embed_query(topic)
+                    if embedded is not None:
+                        model_id, vector = embedded
+                        partition = self.semantic_cache.partition_key(
+                            doc_ids, doc_versions, max_depth, PROMPT_TEMPLATE_VERSION, model_id, user_id
+                        )
+                        cached = self.semantic_cache.lookup(partition, vector, topic=topic)
+                        if cached is not None:
+                            return cached
+            except Exception as e:
+                # 임베딩 실패는 캐시 없이 생성 (목차 생성 자체를 실패시키지 않음)
+                logger.warning(f"시맨틱 캐시 조회 실패, 캐시 없이 생성: {e}")
+                embedded = None
+
+        items = await self._execute_uncached(topic, doc_ids, max_depth, tier, user_id)
+        result = tuple(item.to_dict() for item in items)
+        if embedded is not None and self._is_cacheable(result):
+            self.semantic_cache.store(partition, vector, result, topic=topic, doc_ids=doc_ids)
+        return result
+
+    async def _execute_uncached(
+        self,
+        topic: str,
+        doc_ids: Optional[list[str]],
+        max_depth: int,
+        tier: int = 1,
+        user_id: Optional[str] = None
+    ) -> list[OutlineItem]:
+        """목차 생성 실행 (캐시 미사용)"""
         logger.info(f"목차 생성 시작: topic='{topic}'")
         
         # ---------------------------------------------------------------------
         # Step 1: 참조 문서에서 구조 검색
         # ---------------------------------------------------------------------
-        context = ""
-        if self.retriever and doc_ids:
-            structure_chunks = await self.retriever.retrieve_structure_chunks(
-                topic=topic,
-                doc_ids=doc_ids
-            )
-            context = self._format_chunks_for_prompt(structure_chunks)
+        context = await self._retrieve_context(topic, doc_ids, user_id)
         
         # ---------------------------------------------------------------------
         # Step 2: LLM 호출로 목차 생성
         # ---------------------------------------------------------------------
-        if self.llm_client:
-            outline_json = await self._generate_with_llm(
-                topic=topic,
-                context=context,
-                max_depth=max_depth
-            )
-            outline_items = self._parse_outline_json(outline_json)
+        if self.llm_gateway:
+            with self.telemetry.span("outline.llm", model_id=self.llm_model):
+                outline_json = await self._generate_with_llm(
+                    topic=topic,
+                    context=context,
+                    max_depth=max_depth,
+                    tier=tier
+                )
+            with self.telemetry.span("outline.parse"):
+                outline_items = self._parse_outline_json(outline_json)
         else:
             # LLM 없으면 기본 목차 반환
             outline_items = self._get_default_outline(topic, max_depth)
@@ -94,50 +273,124 @@ class GenerateOutlineUseCase:
         logger.info(f"목차 생성 완료: {len(outline_items)}개 항목")
         return outline_items
     
+    async def execute_stream(
+        self,
+        topic: str,
+        doc_ids: Optional[list[str]] = None,
+        max_depth: int = 3,
+        tier: int = 1,
+        user_id: Optional[str] = None
+    ) -> AsyncIterator[OutlineItem]:
+        """
+        목차 생성 스트리밍 실행 (항목이 완성되는 즉시 yield)
+
+        Args:
+            topic: 글 주제
+            doc_ids: 참조할 문서 ID 리스트
+            max_depth: 최대 목차 깊이
+            tier: 사용자 등급 (LLM 속도 제한용)
+            user_id: 요청 사용자 ID (본인 문서만 참조)
+
+        Yields:
+            max_depth 이하의 OutlineItem (생성 순서대로)
+        """
+        logger.info(f"목차 스트리밍 생성 시작: topic='{topic}'")
+
+        context = await self._retrieve_context(topic, doc_ids, user_id)
+
+        if not self.llm_gateway:
+            for item in self._get_default_outline(topic, max_depth):
+                yield item
+            return
+
+        # 스트리밍은 LLM 호출과 증분 파싱이 겹치므로 전체를 outline.llm 한 구간으로 측정
+        parser = IncrementalOutlineParser()
+        with self.telemetry.span("outline.llm", model_id=self.llm_model):
+            async for token in self._stream_with_llm(
+                topic=topic, context=context, max_depth=max_depth, tier=tier
+            ):
+                for data in parser.feed(token):
+                    item = self._to_outline_item(data)
+                    if item is not None and item.depth <= max_depth:
+                        yield item
+
+    async def _retrieve_context(
+        self,
+        topic: str,
+        doc_ids: Optional[list[str]],
+        user_id: Optional[str] = None
+    ) -> str:
+        """구조 청크 검색 + 프롬프트용 참고 자료 구성 (outline.retrieve / outline.format span)"""
+        if not (self.retriever and doc_ids):
+            return ""
+        with self.telemetry.span("outline.retrieve"):
+            structure_chunks = await self.retriever.retrieve_structure_chunks(
+                topic=topic,
+                doc_ids=doc_ids,
+                user_id=user_id
+            )
+        with self.telemetry.span("outline.format"):
+            return self._format_chunks_for_prompt(structure_chunks)
+
     def _format_chunks_for_prompt(self, chunks: list[dict]) -> str:
-        """청크 리스트를 프롬프트용 문자열로 변환"""
-        if not chunks:
-            return "참고 자료 없음"
-        
-        formatted = []
-        for i, chunk in enumerate(chunks[:10], 1):  # 최대 10개
-            header = chunk.get("metadata", {}).get("header", "")
-            content = chunk.get("content", "")[:200]  # 200자 제한
-            formatted.append(f"{i}. {header}: {content}...")
-        
-        return "\n".join(formatted)
+        """청크 리스트를 프롬프트용 문자열로 변환 (토큰 예산 안에서 관련도 순 선택/문장 단위 절단)"""
+        packed = self.context_packer.pack(chunks)
+        logger.debug(
+            f"참고 자료 패킹: {len(packed.chunk_ids)}/{len(chunks)}개 청크, {packed.tokens} 토큰 "
+            f"(절단 {packed.trimmed}, 제외 {packed.dropped})"
+        )
+        return packed.text
     
     async def _generate_with_llm(
         self,
         topic: str,
         context: str,
-        max_depth: int
+        max_depth: int,
+        tier: int = 1
     ) -> str:
-        """LLM을 통한 목차 생성 (재시도 포함)"""
-        from src.infrastructure.prompts.outline_prompt import OUTLINE_GENERATION_PROMPT
+        """LLM을 통한 목차 생성 (재시도/백오프는 LLMGateway가 담당)"""
+        from src.infrastructure.prompts.outline_prompt import build_outline_messages
         
-        prompt = OUTLINE_GENERATION_PROMPT.format(
-            topic=topic,
-            context=context or "참고 자료 없음",
-            max_depth=max_depth
+        content = await self.llm_gateway.chat(
+            messages=build_outline_messages(topic, context or "참고 자료 없음", max_depth),
+            model=self.llm_model,
+            tier=tier
         )
-        
-        for attempt in range(self.max_retries + 1):
-            try:
-                # TODO: 실제 LLM 호출 구현
-                # response = await self.llm_client.chat.completions.create(...)
-                # return response.choices[0].message.content
-                
-                # 현재는 기본 JSON 반환
-                return self._get_default_outline_json(topic)
-                
-            except Exception as e:
-                logger.warning(f"LLM 호출 실패 (시도 {attempt + 1}): {e}")
-                if attempt == self.max_retries:
-                    raise
-        
-        return "[]"
+        return content or "[]"
     
+    async def _stream_with_llm(
+        self,
+        topic: str,
+        context: str,
+        max_depth: int,
+        tier: int = 1
+    ) -> AsyncIterator[str]:
+        """LLM 스트리밍 호출 (토큰 조각 단위 yield, 게이트웨이 슬롯 점유)"""
+        from src.infrastructure.prompts.outline_prompt import build_outline_messages
+
+        messages = build_outline_messages(topic, context or "참고 자료 없음", max_depth)
+
+        # 스트리밍은 중간 재시도가 불가능하므로 속도 제한/동시성 슬롯만 사용
+        async with self.llm_gateway.slot(tier):
+            stream = await self.llm_gateway.client.chat.completions.create(
+                model=self.llm_model,
+                messages=messages,
+                stream=True
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    @staticmethod
+    def _to_outline_item(data: dict) -> Optional[OutlineItem]:
+        """파싱된 dict를 OutlineItem으로 변환 (필수 키 없으면 None)"""
+        if "title" not in data or not isinstance(data.get("depth"), int) or data["depth"] < 1:
+            return None
+        return OutlineItem(title=data["title"], depth=data["depth"])
+
     def _parse_outline_json(self, json_str: str) -> list[OutlineItem]:
         """JSON 문자열을 OutlineItem 리스트로 파싱"""
         try:
@@ -172,15 +425,3 @@ class GenerateOutlineUseCase:
             OutlineItem("요약 및 제언", 2),
         ]
         return [item for item in items if item.depth <= max_depth]
-    
-    def _get_default_outline_json(self, topic: str) -> str:
-        """기본 목차 JSON 반환"""
-        return json.dumps([
-            {"title": "서론", "depth": 1},
-            {"title": "배경 및 목적", "depth": 2},
-            {"title": "본론", "depth": 1},
-            {"title": f"{topic}의 핵심 개념", "depth": 2},
-            {"title": "주요 방법론", "depth": 2},
-            {"title": "결론", "depth": 1},
-            {"title": "요약 및 제언", "depth": 2},
-        ], ensure_ascii=False)
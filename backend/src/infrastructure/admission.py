@@ -0,0 +1,382 @@
+# =============================================================================
+# PRISM Writer Backend - Admission Control / Load Shedding
+# =============================================================================
+# 파일: backend/src/infrastructure/admission.py
+# 역할: 라우트 등급(route class)과 사용자 등급(tier)별 동시 처리 요청 수 제한
+# 특징:
+#   - 등급별 레인(lane) = 동시 처리 상한 + 대기열(FIFO) + 대기 마감 시간
+#   - 예상 대기 시간(대기 순번 / 상한 × 평균 처리 시간)이 마감을 넘으면 즉시 거절
+#     → 느린 목차 생성이 가벼운 참조 API의 메모리/꼬리 지연을 잡아먹지 않음
+#   - tier 한도 초과 = 429, 라우트 등급 전체 포화 = 503 (둘 다 Retry-After)
+#   - 순수 ASGI 미들웨어 → 스트리밍 응답은 본문 전송이 끝날 때까지 슬롯 점유
+#   - tier / user_id 헤더는 프론트엔드 서버의 공유 비밀(X-Prism-Internal-Token)이 맞을 때만 신뢰
+# =============================================================================
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+import asyncio
+import hmac
+import json
+import logging
+import math
+import time
+
+logger = logging.getLogger(__name__)
+
+# 등급 정의는 migration 009의 profiles.tier와 동일 (| 대기 0 | 무료 1 | 프리미엄 2 | 스페셜 3 | 관리자 4 |)
+TIER_HEADER = "x-user-tier"
+USER_ID_HEADER = "x-user-id"
+# 프론트엔드 서버만 아는 공유 비밀 (PRISM_INTERNAL_TOKEN) - 없으면 위 헤더를 신뢰하지 않음
+TOKEN_HEADER = "x-prism-internal-token"
+DEFAULT_TIER = 1
+MAX_TIER = 4
+
+
+@dataclass
+class RouteClassLimits:
+    """라우트 등급별 제한"""
+    max_in_flight: int
+    max_queue: int
+    # 대기 마감 (초) - tier별, 없는 tier는 default_deadline
+    default_deadline: float
+    # 처리 시간 표본이 없을 때 사용할 예상 처리 시간 (초)
+    expected_service_seconds: float
+    tier_deadlines: dict[int, float] = field(default_factory=dict)
+    # tier별 동시 처리 상한 (없는 tier는 라우트 등급 상한만 적용)
+    tier_in_flight: dict[int, int] = field(default_factory=dict)
+
+
+# 주석(시니어 개발자): LLM 호출 수 자체는 LLMGateway가 제한하므로 여기서는
+# 게이트웨이 대기열 앞단에 쌓이는 요청 수(메모리)와 대기 시간을 제한
+DEFAULT_ROUTE_CLASSES: dict[str, RouteClassLimits] = {
+    "llm": RouteClassLimits(
+        max_in_flight=32,
+        max_queue=64,
+        default_deadline=5.0,
+        expected_service_seconds=8.0,
+        tier_deadlines={0: 2.0, 1: 5.0, 2: 10.0, 3: 15.0, 4: 20.0},
+        tier_in_flight={0: 2, 1: 8, 2: 16, 3: 24},
+    ),
+    "light": RouteClassLimits(
+        max_in_flight=256,
+        max_queue=512,
+        default_deadline=1.0,
+        expected_service_seconds=0.05,
+    ),
+}
+
+# 경로 접두사 → 라우트 등급 (먼저 일치한 규칙 사용, 일치 없으면 제한 없음: /health, /metrics, /docs 등)
+DEFAULT_ROUTE_RULES: tuple[tuple[str, str], ...] = (
+    ("/v1/outline/generate", "llm"),
+    ("/v1/", "light"),
+)
+
+
+class AdmissionRejected(Exception):
+    """대기 마감/대기열 한도로 거절됨"""
+
+    def __init__(self, status_code: int, retry_after: float, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+# =============================================================================
+# Lane
+# =============================================================================
+class AdmissionLane:
+    """동시 처리 상한 + FIFO 대기열 (슬롯은 release 시 다음 대기자에게 직접 넘김)"""
+
+    # 처리 시간 EWMA 가중치
+    ALPHA = 0.2
+
+    def __init__(self, capacity: int, max_queue: int, expected_service_seconds: float):
+        self.capacity = capacity
+        self.max_queue = max_queue
+        self.service_seconds = expected_service_seconds
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.last_rejected_at = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def expected_wait(self) -> float:
+        """지금 대기열에 들어가면 예상되는 대기 시간 (초)"""
+        if self.in_flight < self.capacity and not self._waiters:
+            return 0.0
+        return (len(self._waiters) + 1) / self.capacity * self.service_seconds
+
+    async def acquire(self, deadline: float) -> None:
+        """
+        슬롯 획득 (deadline: 최대 대기 시간, 초)
+
+        Raises:
+            AdmissionRejected: 대기열 가득 참 / 예상 대기 > deadline / 대기 중 마감 (status_code는 호출자가 결정)
+        """
+        if self.in_flight < self.capacity and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+
+        expected = self.expected_wait()
+        if len(self._waiters) >= self.max_queue or expected > deadline:
+            self._reject()
+            raise AdmissionRejected(0, expected, "대기 예상 시간이 마감을 초과합니다")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, deadline)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            self._reject()
+            raise AdmissionRejected(0, self.service_seconds, "대기 중 마감 시간이 지났습니다")
+        except asyncio.CancelledError:
+            self._discard(waiter)
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 직후 취소됨 → 다음 대기자에게 반환
+                self.release(None)
+            raise
+        self.admitted += 1
+
+    def release(self, service_seconds: Optional[float]) -> None:
+        """슬롯 반환 (service_seconds: 이번 요청 처리 시간, EWMA 갱신용)"""
+        if service_seconds is not None:
+            self.service_seconds += self.ALPHA * (service_seconds - self.service_seconds)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # in_flight 유지 = 슬롯 인계
+                return
+        self.in_flight -= 1
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _reject(self) -> None:
+        self.rejected += 1
+        self.last_rejected_at = time.monotonic()
+
+    def to_dict(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "capacity": self.capacity,
+            "queued": len(self._waiters),
+            "utilization": round(self.in_flight / self.capacity, 3) if self.capacity else 0.0,
+            "service_ms": round(self.service_seconds * 1000, 3),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+# =============================================================================
+# Controller
+# =============================================================================
+class AdmissionController:
+    """
+    라우트 등급 × tier 레인 관리
+
+    요청 1건 = tier 레인 슬롯(상한이 정의된 tier만) + 라우트 등급 레인 슬롯 (같은 마감 안에서 순서대로 획득)
+    """
+
+    # 최근 이 시간(초) 안에 거절이 있었으면 saturated로 보고
+    SATURATION_WINDOW = 10.0
+
+    def __init__(
+        self,
+        route_classes: Optional[dict[str, RouteClassLimits]] = None,
+        route_rules: tuple[tuple[str, str], ...] = DEFAULT_ROUTE_RULES
+    ):
+        """
+        Args:
+            route_classes: 라우트 등급별 제한 (기본 DEFAULT_ROUTE_CLASSES)
+            route_rules: (경로 접두사, 라우트 등급) 규칙
+        """
+        self.route_classes = route_classes or DEFAULT_ROUTE_CLASSES
+        self.route_rules = route_rules
+        self._class_lanes = {
+            name: AdmissionLane(limits.max_in_flight, limits.max_queue, limits.expected_service_seconds)
+            for name, limits in self.route_classes.items()
+        }
+        self._tier_lanes: dict[tuple[str, int], AdmissionLane] = {}
+
+    def classify(self, path: str) -> Optional[str]:
+        """경로의 라우트 등급 (제한 대상 아니면 None)"""
+        for prefix, route_class in self.route_rules:
+            if path.startswith(prefix):
+                return route_class
+        return None
+
+    def _tier_lane(self, route_class: str, tier: int) -> Optional[AdmissionLane]:
+        lane = self._tier_lanes.get((route_class, tier))
+        if lane is None:
+            limits = self.route_classes[route_class]
+            if tier not in limits.tier_in_flight:
+                return None
+            lane = self._tier_lanes[(route_class, tier)] = AdmissionLane(
+                limits.tier_in_flight[tier], limits.max_queue, limits.expected_service_seconds
+            )
+        return lane
+
+    async def acquire(self, route_class: str, tier: int) -> tuple[AdmissionLane, ...]:
+        """
+        슬롯 획득, 점유한 레인 반환 → 처리 후 release()
+
+        Raises:
+            AdmissionRejected: 429 (tier 한도) / 503 (라우트 등급 포화)
+        """
+        limits = self.route_classes[route_class]
+        deadline = limits.tier_deadlines.get(tier, limits.default_deadline)
+        started = time.monotonic()
+
+        tier_lane = self._tier_lane(route_class, tier)
+        if tier_lane is not None:
+            try:
+                await tier_lane.acquire(deadline)
+            except AdmissionRejected as e:
+                e.status_code = 429
+                raise
+
+        class_lane = self._class_lanes[route_class]
+        try:
+            await class_lane.acquire(max(0.0, deadline - (time.monotonic() - started)))
+        except BaseException as e:
+            if tier_lane is not None:
+                tier_lane.release(None)
+            if isinstance(e, AdmissionRejected):
+                e.status_code = 503
+            raise
+        return (class_lane,) if tier_lane is None else (tier_lane, class_lane)
+
+    @staticmethod
+    def release(lanes: tuple[AdmissionLane, ...], service_seconds: float) -> None:
+        for lane in lanes:
+            lane.release(service_seconds)
+
+    def snapshot(self) -> dict:
+        """/health용 포화 상태 (status: ok / degraded / saturated)"""
+        now = time.monotonic()
+        status = "ok"
+        route_classes = {}
+        for name, lane in self._class_lanes.items():
+            lanes = [lane] + [tier_lane for (cls, _), tier_lane in self._tier_lanes.items() if cls == name]
+            if any(now - item.last_rejected_at < self.SATURATION_WINDOW for item in lanes if item.rejected):
+                status = "saturated"
+            elif status == "ok" and (lane.queued or lane.in_flight >= lane.capacity):
+                status = "degraded"
+            route_classes[name] = {
+                **lane.to_dict(),
+                "tiers": {
+                    str(tier): tier_lane.to_dict()
+                    for (cls, tier), tier_lane in sorted(self._tier_lanes.items())
+                    if cls == name
+                },
+            }
+        return {"status": status, "route_classes": route_classes}
+
+
+# =============================================================================
+# ASGI Middleware
+# =============================================================================
+def _parse_tier(value: Optional[bytes]) -> int:
+    """X-User-Tier 값 (없거나 잘못되면 DEFAULT_TIER)"""
+    if value is None:
+        return DEFAULT_TIER
+    try:
+        return min(MAX_TIER, max(0, int(value)))
+    except ValueError:
+        return DEFAULT_TIER
+
+
+def trusted_identity(
+    headers: list[tuple[bytes, bytes]],
+    trusted_token: Optional[str]
+) -> tuple[int, Optional[str]]:
+    """
+    요청 사용자 (tier, user_id)
+
+    X-User-Tier / X-User-Id는 클라이언트가 임의로 보낼 수 있으므로
+    X-Prism-Internal-Token이 공유 비밀과 일치할 때만 사용 (프론트엔드 서버가 profiles 기준으로 설정)
+    그 외에는 (DEFAULT_TIER, None) - tier 4를 보내 tier 레인과 긴 마감을 얻는 것을 방지
+    """
+    values = {
+        name: value for name, value in headers
+        if name in (TIER_HEADER.encode(), USER_ID_HEADER.encode(), TOKEN_HEADER.encode())
+    }
+    token = values.get(TOKEN_HEADER.encode())
+    if not (trusted_token and token and hmac.compare_digest(token, trusted_token.encode())):
+        return DEFAULT_TIER, None
+    user_id = values.get(USER_ID_HEADER.encode())
+    return _parse_tier(values.get(TIER_HEADER.encode())), user_id.decode() if user_id else None
+
+
+class AdmissionMiddleware:
+    """
+    입장 제어 미들웨어
+
+    사용: app.add_middleware(AdmissionMiddleware, controller=AdmissionController(), trusted_token=...)
+    (CORS 미들웨어보다 먼저 등록 → 거절 응답에도 CORS 헤더가 붙음)
+
+    확인한 사용자 정보는 request.state.user_tier / request.state.user_id로 라우터에 전달
+    """
+
+    def __init__(self, app, controller: AdmissionController, trusted_token: Optional[str] = None):
+        """
+        Args:
+            controller: 입장 제어기
+            trusted_token: 프론트엔드 서버 공유 비밀 (None이면 모든 요청을 DEFAULT_TIER로 처리)
+        """
+        self.app = app
+        self.controller = controller
+        self.trusted_token = trusted_token
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tier, user_id = trusted_identity(scope["headers"], self.trusted_token)
+        state = scope.setdefault("state", {})
+        state["user_tier"] = tier
+        state["user_id"] = user_id
+
+        route_class = self.controller.classify(scope["path"])
+        if route_class is None or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            lanes = await self.controller.acquire(route_class, tier)
+        except AdmissionRejected as e:
+            logger.warning(f"요청 거절 ({e.status_code}): {route_class}/tier {tier} - {e.reason}")
+            await self._reject(send, e)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(lanes, time.perf_counter() - started)
+
+    @staticmethod
+    async def _reject(send, rejection: AdmissionRejected) -> None:
+        body = json.dumps({"detail": rejection.reason}, ensure_ascii=False).encode()
+        await send({
+            "type": "http.response.start",
+            "status": rejection.status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(rejection.retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,248 @@
+# =============================================================================
+# PRISM Writer Backend - In-process Cache
+# =============================================================================
+# 파일: backend/src/infrastructure/cache.py
+# 역할: 크기 제한 + LRU 축출 + TTL 만료를 지원하는 프로세스 내 캐시,
+#       동일 키 동시 요청 병합(single-flight), 문서 변경 시 캐시 무효화 등록부
+# =============================================================================
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+import asyncio
+import inspect
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Cache Stats
+# =============================================================================
+class CacheStats:
+    """캐시 적중/미스 카운터 (캐시 크기 튜닝용)"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+# =============================================================================
+# LRU + TTL Cache
+# =============================================================================
+class LRUCache:
+    """
+    크기 제한 LRU 캐시 (항목별 TTL, 태그 기반 무효화 지원)
+
+    - max_size 초과 시 가장 오래 사용되지 않은 항목부터 축출
+    - ttl_seconds가 지나면 조회 시점에 만료 처리
+    - 항목마다 태그를 붙여 두면 invalidate_tag()로 묶음 무효화 가능
+    """
+
+    _MISSING = object()
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            max_size: 최대 항목 수
+            ttl_seconds: 기본 TTL (None이면 만료 없음)
+        """
+        if max_size <= 0:
+            raise ValueError("max_size는 1 이상이어야 합니다.")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        # key -> (value, expires_at, tags)
+        self._data: "OrderedDict[Hashable, tuple[Any, Optional[float], tuple]]" = OrderedDict()
+        self._tag_index: dict[Hashable, set] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, self._MISSING, count=False) is not self._MISSING
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        """캐시 조회 (적중 시 최근 사용으로 갱신)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                if count:
+                    self.stats.misses += 1
+                return default
+
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats.expirations += 1
+                if count:
+                    self.stats.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            if count:
+                self.stats.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        tags: Iterable[Hashable] = ()
+    ) -> None:
+        """캐시 저장 (용량 초과 시 LRU 축출)"""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        tags = tuple(tags)
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, expires_at, tags)
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+
+            while len(self._data) > self.max_size:
+                oldest_key = next(iter(self._data))
+                self._remove(oldest_key)
+                self.stats.evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """단일 항목 삭제"""
+        with self._lock:
+            if key not in self._data:
+                return False
+            self._remove(key)
+            self.stats.invalidations += 1
+            return True
+
+    def invalidate_tag(self, tag: Hashable) -> int:
+        """태그가 붙은 모든 항목 무효화, 삭제된 항목 수 반환"""
+        with self._lock:
+            keys = list(self._tag_index.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            self.stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._tag_index.clear()
+
+    def _remove(self, key: Hashable) -> None:
+        """락을 잡은 상태에서 호출: 항목과 태그 인덱스 정리"""
+        _, _, tags = self._data.pop(key)
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+
+# =============================================================================
+# Single-flight (동시 요청 병합)
+# =============================================================================
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 비동기 작업을 하나로 병합
+
+    첫 요청이 작업을 시작하고, 진행 중에 들어온 요청은 같은 결과(또는 예외)를 공유.
+    작업은 별도 Task로 실행되므로 첫 요청이 취소되어도 나머지 요청은 영향 없음.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, k=key: self._forget(k, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+
+# =============================================================================
+# Document Invalidation (문서 재수집 → 프로세스 캐시 무효화)
+# =============================================================================
+class DocumentInvalidation:
+    """
+    문서 변경 시 실행할 캐시 무효화 함수 등록부
+
+    - 캐시를 만드는 곳(라우터 모듈 등)에서 register()
+    - IngestionPipeline(on_document_changed=document_invalidation.notify)로 재수집과 연결
+    - 같은 프로세스의 캐시만 대상 (다른 프로세스는 문서 버전 키 / TTL로 반영)
+    """
+
+    def __init__(self):
+        self._handlers: dict[str, Callable[[str, Optional[str]], Any]] = {}
+
+    def register(self, name: str, handler: Callable[[str, Optional[str]], Any]) -> None:
+        """
+        Args:
+            name: 캐시 이름 (같은 이름으로 다시 등록하면 교체)
+            handler: (document_id, user_id) → 제거 항목 수 (동기/비동기 모두 가능)
+        """
+        self._handlers[name] = handler
+
+    def unregister(self, name: str) -> None:
+        self._handlers.pop(name, None)
+
+    async def notify(self, document_id: str, user_id: Optional[str] = None) -> dict[str, int]:
+        """
+        등록된 모든 캐시 무효화 (하나가 실패해도 나머지는 계속)
+
+        Returns:
+            {캐시 이름: 제거 항목 수}
+        """
+        removed: dict[str, int] = {}
+        for name, handler in list(self._handlers.items()):
+            try:
+                result = handler(document_id, user_id)
+                if inspect.isawaitable(result):
+                    result = await result
+                removed[name] = result or 0
+            except Exception as e:
+                logger.error(f"캐시 무효화 실패: cache={name}, doc={document_id}, error={e}")
+        logger.info(f"문서 캐시 무효화: doc={document_id}, removed={removed}")
+        return removed
+
+
+# 프로세스 단위 공유 인스턴스
+document_invalidation = DocumentInvalidation()
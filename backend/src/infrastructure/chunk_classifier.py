@@ -0,0 +1,78 @@
+# =============================================================================
+# PRISM Writer Backend - Chunk Type Classifier
+# =============================================================================
+# 파일: backend/src/infrastructure/chunk_classifier.py
+# 역할: 청크 유형(rule/example/general) 분류
+# 기준: migration 030의 detect_chunk_type() SQL 함수와 동일한 결과 (tests/test_chunk_classifier.py)
+# 특징: SQL의 정규식 11개를 규칙/예시 결합 패턴 2개로 미리 컴파일 → 청크당 최대 2회 스캔
+# =============================================================================
+
+from typing import Iterable
+import re
+
+CHUNK_TYPE_RULE = "rule"
+CHUNK_TYPE_EXAMPLE = "example"
+CHUNK_TYPE_GENERAL = "general"
+
+# -----------------------------------------------------------------------------
+# PostgreSQL 정규식과의 호환
+# -----------------------------------------------------------------------------
+# 주석(시니어 개발자): 파이썬 기본 동작을 그대로 쓰면 SQL과 결과가 달라지는 지점
+#   - \s: PostgreSQL은 libc iswspace (glibc UTF-8 로케일 기준 아래 집합),
+#         파이썬 유니코드 \s는 NBSP(U+00A0), U+0085, U+2007, U+202F까지 포함
+#   - ~* : PostgreSQL은 ASCII 대소문자만 동일시, 파이썬 IGNORECASE는 'ſ'(U+017F)→'s',
+#         'K'(U+212A)→'k'까지 매칭 → re.ASCII로 대소문자 무시 범위를 ASCII로 제한
+_PG_SPACE = r"[\t\n\v\f\r \x1c-\x1f\u1680\u2000-\u2006\u2008-\u200a\u2028\u2029\u205f\u3000]"
+
+
+def _pg(pattern: str) -> str:
+    """SQL 패턴의 \\s를 PostgreSQL 공백 문자 집합으로 치환"""
+    return pattern.replace(r"\s", _PG_SPACE)
+
+
+# 규칙 패턴 - SQL: has_rule_pattern (~ 2개, ~* 4개)
+RULE_PATTERN = re.compile(
+    "|".join([
+        _pg(r"해야\s*(?:합니다|한다|함)"),
+        _pg(r"하지\s*(?:마|말아야|않아야)"),
+        _pg(r"(?i:금지|원칙|규칙|필수|반드시)"),
+        _pg(r"(?i:should\s+(?:always|never))"),
+        _pg(r"(?i:must\s+(?:be|have|not))"),
+        _pg(r"(?i:do\s+not|avoid)"),
+    ]),
+    re.ASCII
+)
+
+# 예시 패턴 - SQL: has_example_pattern (~ 3개, ~* 2개)
+EXAMPLE_PATTERN = re.compile(
+    "|".join([
+        _pg(r"예를\s*들어|예시|사례"),
+        r'"[^"]{10,}"',
+        _pg(r"(?i:before\s*[:/]|after\s*[:/])"),
+        _pg(r"(?i:good\s*example|bad\s*example|for\s*example|e\.g\.)"),
+        _pg(r"다음과\s*같"),
+    ]),
+    re.ASCII
+)
+
+
+def classify_chunk_type(content: str) -> str:
+    """
+    청크 유형 분류 (우선순위: 규칙 > 예시 > 일반)
+
+    Args:
+        content: 청크 텍스트
+
+    Returns:
+        "rule" | "example" | "general"
+    """
+    if RULE_PATTERN.search(content):
+        return CHUNK_TYPE_RULE
+    if EXAMPLE_PATTERN.search(content):
+        return CHUNK_TYPE_EXAMPLE
+    return CHUNK_TYPE_GENERAL
+
+
+def classify_chunk_types(contents: Iterable[str]) -> list[str]:
+    """여러 청크 일괄 분류 (수집/백필 배치용)"""
+    return [classify_chunk_type(content or "") for content in contents]
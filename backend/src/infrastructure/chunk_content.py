@@ -0,0 +1,121 @@
+# =============================================================================
+# PRISM Writer Backend - Chunk Content Loader
+# =============================================================================
+# 파일: backend/src/infrastructure/chunk_content.py
+# 역할: 참조 목록 등에 필요한 청크 본문/출처를 일괄 조회 (N+1 조회 제거)
+# 특징:
+#   - 고유 chunk_id를 모아 rag_chunks + rag_documents를 단일 IN 쿼리로 조회
+#   - 요청자 소유 문서의 청크만 반환 (서비스 키는 RLS를 우회하므로 user_id 조건 필수)
+#   - 청크는 임베딩 버전 단위로 불변이므로 크기 제한 LRU 캐시에 보관 (키: user_id, chunk_id)
+# =============================================================================
+
+from typing import Iterable, Optional
+import logging
+
+from src.infrastructure.cache import LRUCache
+from src.infrastructure.supabase_utils import execute
+
+logger = logging.getLogger(__name__)
+
+# PostgREST IN 필터는 URL 쿼리스트링으로 전달되므로 한 번에 보내는 ID 수 제한
+MAX_IDS_PER_QUERY = 300
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+def format_chunk_source(document_title: Optional[str], metadata: Optional[dict]) -> Optional[str]:
+    """출처 표기: "문서명 (p.12)" / "문서명" / None"""
+    if not document_title:
+        return None
+    page = (metadata or {}).get("page")
+    return f"{document_title} (p.{page})" if page is not None else document_title
+
+
+# =============================================================================
+# Chunk Content Loader
+# =============================================================================
+class ChunkContentLoader:
+    """
+    청크 ID → {"content", "source"} 일괄 조회기
+    """
+
+    def __init__(
+        self,
+        supabase_client=None,
+        cache_size: int = 4096,
+        cache_ttl_seconds: Optional[float] = 60 * 60
+    ):
+        """
+        Args:
+            supabase_client: Supabase 클라이언트 (None이면 조회하지 않고 오류 로그)
+            cache_size: 청크 캐시 최대 항목 수
+            cache_ttl_seconds: 청크 캐시 TTL (재임베딩/재수집 반영 상한)
+        """
+        self.client = supabase_client
+        self.cache = LRUCache(cache_size, cache_ttl_seconds)
+
+    async def get_many(self, chunk_ids: Iterable[str], user_id: Optional[str]) -> dict[str, dict]:
+        """
+        청크 본문/출처 일괄 조회
+
+        Args:
+            chunk_ids: 청크 ID (중복 허용)
+            user_id: 요청자 ID (None이면 아무 청크도 반환하지 않음)
+
+        Returns:
+            {chunk_id: {"content", "source", "document_id"}} - 존재하지 않거나 남의 문서 청크는 제외
+
+        Raises:
+            조회 실패 시 Supabase 클라이언트 예외 그대로 (빈 결과로 숨기지 않음)
+        """
+        if user_id is None:
+            return {}
+
+        unique_ids = list(dict.fromkeys(chunk_ids))
+        found: dict[str, dict] = {}
+        missing = []
+        for chunk_id in unique_ids:
+            cached = self.cache.get((user_id, chunk_id))
+            if cached is None:
+                missing.append(chunk_id)
+            else:
+                found[chunk_id] = cached
+
+        if missing and self.client is None:
+            logger.error(f"Supabase 클라이언트 미설정: 청크 {len(missing)}개의 내용을 조회할 수 없습니다")
+        elif missing:
+            for start in range(0, len(missing), MAX_IDS_PER_QUERY):
+                rows = await self._fetch(missing[start:start + MAX_IDS_PER_QUERY], user_id)
+                for row in rows:
+                    entry = self._row_to_entry(row)
+                    self.cache.set((user_id, row["id"]), entry, tags=(("doc", entry["document_id"]),))
+                    found[row["id"]] = entry
+
+        return found
+
+    def invalidate_document(self, document_id: str) -> int:
+        """문서 재수집/삭제 시 해당 문서의 청크 캐시 제거"""
+        return self.cache.invalidate_tag(("doc", document_id))
+
+    def cache_stats(self) -> dict:
+        return {"size": len(self.cache), **self.cache.stats.to_dict()}
+
+    async def _fetch(self, chunk_ids: list[str], user_id: str) -> list[dict]:
+        """rag_chunks + rag_documents(title) 내부 조인 단일 쿼리 (문서 소유자 = user_id인 행만)"""
+        response = await execute(
+            self.client.table("rag_chunks")
+            .select("id, document_id, content, metadata, rag_documents!inner(title, user_id)")
+            .in_("id", chunk_ids)
+            .eq("rag_documents.user_id", user_id)
+        )
+        return response.data or []
+
+    @staticmethod
+    def _row_to_entry(row: dict) -> dict:
+        document = row.get("rag_documents") or {}
+        return {
+            "document_id": row.get("document_id"),
+            "content": row.get("content") or "",
+            "source": format_chunk_source(document.get("title"), row.get("metadata")),
+        }
@@ -0,0 +1,193 @@
+# =============================================================================
+# PRISM Writer Backend - chunk_type Backfill
+# =============================================================================
+# 파일: backend/src/infrastructure/chunk_type_backfill.py
+# 역할: rag_chunks.chunk_type을 파이썬 분류기로 재계산하는 재개 가능한 백필 작업
+# 특징:
+#   - id 기준 keyset 페이지네이션 (OFFSET 없음), 배치 크기 제한
+#   - 배치당 UPDATE ... FROM unnest() 1회, 값이 바뀐 행만 갱신 → 짧은 행 잠금
+#   - 배치 UPDATE와 같은 트랜잭션에서 체크포인트 저장 (job_checkpoints)
+#   - 초당 처리 행 수 제한(throttle)
+# 실행:
+#   DATABASE_URL=... python -m src.infrastructure.chunk_type_backfill --batch-size 1000 --rate 5000
+# 주의: 'definition', 'reference' 등 detect_chunk_type()이 만들지 않는 값은 수동 지정으로 보고 유지
+# =============================================================================
+
+from typing import Optional
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+from src.infrastructure.chunk_classifier import (
+    CHUNK_TYPE_EXAMPLE,
+    CHUNK_TYPE_GENERAL,
+    CHUNK_TYPE_RULE,
+    classify_chunk_types,
+)
+from src.infrastructure.job_checkpoints import JobCheckpointStore
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = "chunk_type_backfill"
+
+# 재분류 대상 (NULL 포함) - 그 외 값은 유지
+RECLASSIFIABLE_TYPES = {None, CHUNK_TYPE_RULE, CHUNK_TYPE_EXAMPLE, CHUNK_TYPE_GENERAL}
+
+SELECT_BATCH_SQL = """
+SELECT id, content, chunk_type::text AS chunk_type
+FROM public.rag_chunks
+WHERE ($1::uuid IS NULL OR id > $1::uuid)
+ORDER BY id
+LIMIT $2
+"""
+
+UPDATE_BATCH_SQL = """
+UPDATE public.rag_chunks c
+SET chunk_type = v.chunk_type::chunk_type_enum
+FROM unnest($1::uuid[], $2::text[]) AS v(id, chunk_type)
+WHERE c.id = v.id
+"""
+
+# 백필 트랜잭션이 사용자 요청의 행 잠금을 오래 기다리지 않도록 제한
+LOCK_TIMEOUT_SQL = "SET LOCAL lock_timeout = '2s'"
+
+
+class ChunkTypeBackfill:
+    """
+    chunk_type 백필 작업
+    """
+
+    def __init__(
+        self,
+        pool,
+        batch_size: int = 1000,
+        max_rows_per_second: Optional[float] = None,
+        checkpoints: Optional[JobCheckpointStore] = None
+    ):
+        """
+        Args:
+            pool: asyncpg 커넥션 풀
+            batch_size: 배치당 조회 행 수
+            max_rows_per_second: 초당 처리 행 수 상한 (None이면 제한 없음)
+            checkpoints: 체크포인트 저장소 (기본: JobCheckpointStore(pool))
+        """
+        self.pool = pool
+        self.batch_size = batch_size
+        self.max_rows_per_second = max_rows_per_second
+        self.checkpoints = checkpoints or JobCheckpointStore(pool)
+
+    async def run(self, restart: bool = False, max_batches: Optional[int] = None) -> dict:
+        """
+        백필 실행 (이전 체크포인트부터 재개)
+
+        Args:
+            restart: True면 체크포인트를 지우고 처음부터
+            max_batches: 이번 실행에서 처리할 최대 배치 수 (None이면 끝까지)
+
+        Returns:
+            {"processed", "updated", "batches", "last_id", "completed", "rows_per_second"}
+        """
+        if restart:
+            await self.checkpoints.reset(JOB_NAME)
+        checkpoint = await self.checkpoints.load(JOB_NAME)
+        last_id = checkpoint["last_key"] if checkpoint else None
+        if last_id:
+            logger.info(f"chunk_type 백필 재개: last_id={last_id}, processed={checkpoint['processed']}")
+
+        started = time.perf_counter()
+        processed = updated = batches = 0
+        completed = False
+
+        while max_batches is None or batches < max_batches:
+            batch_started = time.perf_counter()
+            rows, changed = await self._process_batch(last_id)
+            if not rows:
+                completed = True
+                break
+
+            last_id = str(rows[-1]["id"])
+            processed += len(rows)
+            updated += changed
+            batches += 1
+            logger.info(f"chunk_type 백필: batch={batches}, processed={processed}, updated={updated}")
+
+            if len(rows) < self.batch_size:
+                completed = True
+                break
+            await self._throttle(len(rows), time.perf_counter() - batch_started)
+
+        if completed:
+            await self.checkpoints.complete(JOB_NAME)
+
+        elapsed = time.perf_counter() - started
+        return {
+            "processed": processed,
+            "updated": updated,
+            "batches": batches,
+            "last_id": last_id,
+            "completed": completed,
+            "rows_per_second": round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+    async def _process_batch(self, last_id: Optional[str]) -> tuple[list, int]:
+        """배치 1개 분류 + 변경분 UPDATE + 체크포인트 (단일 트랜잭션)"""
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(LOCK_TIMEOUT_SQL)
+                rows = await conn.fetch(SELECT_BATCH_SQL, last_id, self.batch_size)
+                if not rows:
+                    return [], 0
+
+                new_types = classify_chunk_types(row["content"] for row in rows)
+                changes = [
+                    (row["id"], new_type)
+                    for row, new_type in zip(rows, new_types)
+                    if row["chunk_type"] in RECLASSIFIABLE_TYPES and row["chunk_type"] != new_type
+                ]
+                if changes:
+                    ids, types = zip(*changes)
+                    await conn.execute(UPDATE_BATCH_SQL, list(ids), list(types))
+
+                await JobCheckpointStore.save(
+                    conn, JOB_NAME, str(rows[-1]["id"]), len(rows), len(changes)
+                )
+        return rows, len(changes)
+
+    async def _throttle(self, rows: int, elapsed: float) -> None:
+        if not self.max_rows_per_second:
+            return
+        delay = rows / self.max_rows_per_second - elapsed
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+async def _main(args: argparse.Namespace) -> None:
+    from src.infrastructure.pg_vector_store import create_pg_pool
+
+    pool = await create_pg_pool(args.dsn, min_size=1, max_size=2)
+    try:
+        backfill = ChunkTypeBackfill(pool, batch_size=args.batch_size, max_rows_per_second=args.rate)
+        result = await backfill.run(restart=args.restart, max_batches=args.max_batches)
+        logger.info(f"chunk_type 백필 결과: {result}")
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="rag_chunks.chunk_type 백필")
+    parser.add_argument("--dsn", default=os.getenv("DATABASE_URL"), help="PostgreSQL 접속 문자열")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=None, help="초당 처리 행 수 상한")
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument("--restart", action="store_true", help="체크포인트 무시하고 처음부터")
+    parsed = parser.parse_args()
+    if not parsed.dsn:
+        parser.error("--dsn 또는 DATABASE_URL이 필요합니다.")
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(parsed))
@@ -0,0 +1,193 @@
+# =============================================================================
+# PRISM Writer Backend - Context Packer
+# =============================================================================
+# 파일: backend/src/infrastructure/context_packer.py
+# 역할: 검색된 청크를 토큰 예산 안에서 프롬프트용 참고 자료 문자열로 압축
+# 특징:
+#   - 관련도(similarity) 높은 청크부터 선택, 예산이 모자라면 문장 경계에서 자름
+#   - 청크 간 겹치는 문장(청크 overlap, 중복 청크) 제거
+#   - 토큰 수는 tokenizer.count_tokens + LRU 캐시 (같은 청크/문장은 재계산 없음)
+#   - 출력은 선택된 청크의 원래 순서(문서 순서) 유지
+# =============================================================================
+
+from dataclasses import dataclass, field
+from typing import Optional
+import re
+
+from src.infrastructure.cache import LRUCache
+from src.infrastructure.tokenizer import DEFAULT_ENCODING, count_tokens, truncate_to_tokens
+
+# 목차 프롬프트 참고 자료 기본 예산 (토큰)
+DEFAULT_CONTEXT_TOKEN_BUDGET = 1500
+
+# 청크 1개가 차지할 수 있는 최대 토큰 (한 청크가 예산을 독식하지 않도록)
+DEFAULT_MAX_CHUNK_TOKENS = 300
+
+# 잘라낸 결과가 이보다 짧으면 넣지 않음 (제목만 남은 조각 방지)
+DEFAULT_MIN_CHUNK_TOKENS = 24
+
+EMPTY_CONTEXT = "참고 자료 없음"
+
+# 문장 경계: 마침표/물음표/느낌표(+닫는 따옴표/괄호) 뒤 공백, 또는 줄바꿈
+SENTENCE_BOUNDARY = re.compile(
+    r"(?:(?<=[.!?。？！])|(?<=[.!?。？！][\"')\]」』]))\s+|\n+"
+)
+WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class PackedContext:
+    """패킹 결과"""
+    text: str
+    tokens: int
+    chunk_ids: list = field(default_factory=list)
+    trimmed: int = 0
+    dropped: int = 0
+
+
+def split_sentences(text: str) -> list[str]:
+    """문장 단위 분할 (빈 문장 제외)"""
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+class ContextPacker:
+    """
+    토큰 예산 기반 컨텍스트 패커
+
+    사용 예:
+        packer = ContextPacker(token_budget=1500)
+        context = packer.pack(chunks).text
+    """
+
+    def __init__(
+        self,
+        token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET,
+        max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+        min_chunk_tokens: int = DEFAULT_MIN_CHUNK_TOKENS,
+        encoding_name: str = DEFAULT_ENCODING,
+        cache_size: int = 8192
+    ):
+        """
+        Args:
+            token_budget: 참고 자료 전체 토큰 상한
+            max_chunk_tokens: 청크 1개 토큰 상한
+            min_chunk_tokens: 잘라낸 청크의 최소 토큰 수
+            encoding_name: tiktoken 인코딩
+            cache_size: 토큰 수 캐시 항목 수 (청크 줄/문장 단위)
+        """
+        self.token_budget = token_budget
+        self.max_chunk_tokens = max_chunk_tokens
+        self.min_chunk_tokens = min_chunk_tokens
+        self.encoding_name = encoding_name
+        self.token_cache = LRUCache(cache_size)
+
+    def count(self, text: str) -> int:
+        """토큰 수 (캐시 경유)"""
+        tokens = self.token_cache.get(text)
+        if tokens is None:
+            tokens = count_tokens(text, self.encoding_name)
+            self.token_cache.set(text, tokens)
+        return tokens
+
+    def pack(self, chunks: list[dict], token_budget: Optional[int] = None) -> PackedContext:
+        """
+        청크 리스트를 예산 안의 참고 자료 문자열로 변환
+
+        Args:
+            chunks: [{"id", "content", "metadata": {"header"}, "similarity"}]
+            token_budget: 이번 호출에만 적용할 예산 (None이면 인스턴스 기본값)
+
+        Returns:
+            PackedContext (text는 "1. 헤더: 내용" 줄 목록, 청크가 없으면 EMPTY_CONTEXT)
+        """
+        budget = self.token_budget if token_budget is None else token_budget
+        # 관련도 내림차순 (동점이면 원래 순서)
+        ranked = sorted(
+            range(len(chunks)),
+            key=lambda i: (-float(chunks[i].get("similarity") or 0.0), i)
+        )
+
+        seen: set[str] = set()
+        selected: dict[int, str] = {}
+        remaining = budget
+        trimmed = dropped = 0
+
+        for i in ranked:
+            chunk = chunks[i]
+            header = (chunk.get("metadata") or {}).get("header") or ""
+            prefix = f"{header}: " if header else ""
+            # 번호("NN. ")와 줄바꿈 몫으로 3토큰 예약
+            limit = min(self.max_chunk_tokens, remaining - 3) - self.count(prefix)
+
+            # 헤딩 인덱스 청크는 content가 곧 헤더 → 본문에서 헤더 문장 제외
+            skip = seen | {self._key(header)} if header else seen
+            sentences = self._new_sentences(chunk.get("content") or "", skip)
+            if not sentences:
+                if header and header not in selected.values() and self.count(header) + 3 <= remaining:
+                    selected[i] = header
+                    remaining -= self.count(header) + 3
+                else:
+                    dropped += 1
+                continue
+            if limit < self.min_chunk_tokens:
+                dropped += 1
+                continue
+
+            body, taken = self._fit_sentences(sentences, limit)
+            if body is None:
+                dropped += 1
+                continue
+
+            line = prefix + body
+            selected[i] = line
+            remaining -= self.count(line) + 3
+            trimmed += 0 if taken == len(sentences) else 1
+            seen.update(self._key(sentence) for sentence in sentences[:max(taken, 1)])
+
+        if not selected:
+            return PackedContext(text=EMPTY_CONTEXT, tokens=self.count(EMPTY_CONTEXT), dropped=dropped)
+
+        lines = [f"{n}. {selected[i]}" for n, i in enumerate(sorted(selected), 1)]
+        return PackedContext(
+            text="\n".join(lines),
+            tokens=budget - remaining,
+            chunk_ids=[chunks[i].get("id") for i in sorted(selected)],
+            trimmed=trimmed,
+            dropped=dropped,
+        )
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _key(sentence: str) -> str:
+        return WHITESPACE.sub(" ", sentence).casefold()
+
+    def _new_sentences(self, content: str, seen: set[str]) -> list[str]:
+        """이미 선택된 청크에 나온 문장 제외 (청크 overlap/중복 청크 제거)"""
+        return [sentence for sentence in split_sentences(content) if self._key(sentence) not in seen]
+
+    def _fit_sentences(self, sentences: list[str], limit: int) -> tuple[Optional[str], int]:
+        """
+        limit 토큰 안에 들어가는 앞쪽 문장들
+
+        Returns:
+            (본문, 포함한 문장 수) - min_chunk_tokens 미만이면 (None, 0),
+            첫 문장을 토큰 단위로 자른 경우 포함 문장 수는 0
+        """
+        taken: list[str] = []
+        used = 0
+        for sentence in sentences:
+            tokens = self.count(sentence) + (1 if taken else 0)
+            if used + tokens > limit:
+                break
+            taken.append(sentence)
+            used += tokens
+
+        if not taken:
+            # 첫 문장부터 한도 초과 → 토큰 단위로 자름 (문장 중간 절단은 이 경우만)
+            body = truncate_to_tokens(sentences[0], limit, self.encoding_name)
+            return (body, 0) if self.count(body) >= self.min_chunk_tokens else (None, 0)
+        if used < self.min_chunk_tokens and len(taken) < len(sentences):
+            return None, 0
+        return " ".join(taken), len(taken)
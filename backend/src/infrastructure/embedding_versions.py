@@ -0,0 +1,90 @@
+# =============================================================================
+# PRISM Writer Backend - Active Embedding Model
+# =============================================================================
+# 파일: backend/src/infrastructure/embedding_versions.py
+# 역할: 현재 검색에 사용 중인 임베딩 모델 조회 (embedding_active_model, migration 044)
+# 사용: ChunkRetriever(active_model=...) → 쿼리 임베딩 모델을 전환 시점에 맞춰 자동 변경
+#       (재임베딩 진행 중에는 이전 모델 유지 = dual-read)
+# =============================================================================
+
+from typing import Optional
+import asyncio
+import logging
+import time
+
+from src.infrastructure.retriever import DEFAULT_EMBEDDING_MODEL_ID
+from src.infrastructure.supabase_utils import execute
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_MODEL_SQL = "SELECT model_id, dim FROM public.embedding_active_model LIMIT 1"
+
+
+class ActiveEmbeddingModel:
+    """
+    활성 임베딩 모델 조회기 (TTL 캐시)
+
+    - asyncpg pool 우선, 없으면 Supabase 클라이언트 사용
+    - 조회 실패 시 마지막 값(없으면 default_model_id) 유지 → 검색은 계속 동작
+    """
+
+    def __init__(
+        self,
+        supabase_client=None,
+        pool=None,
+        default_model_id: str = DEFAULT_EMBEDDING_MODEL_ID,
+        ttl_seconds: float = 30.0
+    ):
+        """
+        Args:
+            supabase_client: Supabase 클라이언트
+            pool: asyncpg 커넥션 풀 (create_pg_pool)
+            default_model_id: 테이블이 없거나 조회 실패 시 사용할 모델 ID
+            ttl_seconds: 조회 결과 캐시 시간 (전환 반영 지연 상한)
+        """
+        self.client = supabase_client
+        self.pool = pool
+        self.ttl_seconds = ttl_seconds
+        self.model_id = default_model_id
+        self.dim: Optional[int] = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> str:
+        """활성 모델 ID 반환 (TTL 만료 시 재조회)"""
+        if time.monotonic() < self._expires_at:
+            return self.model_id
+
+        async with self._lock:
+            if time.monotonic() >= self._expires_at:
+                await self.refresh()
+        return self.model_id
+
+    async def refresh(self) -> None:
+        """즉시 재조회 (cutover 직후 호출)"""
+        try:
+            row = await self._fetch()
+        except Exception as e:
+            logger.warning(f"활성 임베딩 모델 조회 실패, 기존 값 유지({self.model_id}): {e}")
+            row = None
+
+        if row:
+            if row["model_id"] != self.model_id:
+                logger.info(f"활성 임베딩 모델 변경: {self.model_id} → {row['model_id']}")
+            self.model_id = row["model_id"]
+            self.dim = row["dim"]
+        self._expires_at = time.monotonic() + self.ttl_seconds
+
+    async def _fetch(self) -> Optional[dict]:
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow(ACTIVE_MODEL_SQL)
+            return dict(row) if row else None
+
+        if self.client is not None:
+            response = await execute(
+                self.client.table("embedding_active_model").select("model_id, dim").limit(1)
+            )
+            return response.data[0] if response.data else None
+
+        return None
@@ -0,0 +1,166 @@
+# =============================================================================
+# PRISM Writer Backend - Document Heading Index
+# =============================================================================
+# 파일: backend/src/infrastructure/heading_index.py
+# 역할: 문서별 헤딩 트리 생성/저장/조회 (rag_document_headings 테이블)
+# 용도: 목차 생성 시 벡터 검색 없이 doc_id 키 조회로 구조 정보 확보
+# =============================================================================
+
+from typing import Optional
+import logging
+import unicodedata
+
+from src.infrastructure.supabase_utils import execute
+
+logger = logging.getLogger(__name__)
+
+HEADINGS_TABLE = "rag_document_headings"
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+def build_heading_entries(document_id: str, chunks: list[dict]) -> list[dict]:
+    """
+    수집된 청크 목록에서 헤딩 트리 행 생성 (수집 시점에 호출)
+
+    Args:
+        document_id: 문서 ID
+        chunks: chunk_index 순서의 청크 [{"id", "metadata": {"header", "header_level"}}]
+
+    Returns:
+        rag_document_headings 행 리스트
+        [{"document_id", "chunk_id", "title", "level", "position", "parent_position"}]
+    """
+    entries = []
+    stack: list[tuple[int, int]] = []  # (level, position) - 상위 헤딩 추적
+    for chunk in chunks:
+        metadata = chunk.get("metadata") or {}
+        level = metadata.get("header_level")
+        title = (metadata.get("header") or "").strip()
+        if level is None or not title:
+            continue
+
+        level = min(max(int(level), 1), 6)
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+
+        position = len(entries)
+        entries.append({
+            "document_id": document_id,
+            "chunk_id": chunk.get("id"),
+            "title": title,
+            "level": level,
+            "position": position,
+            "parent_position": stack[-1][1] if stack else None,
+        })
+        stack.append((level, position))
+    return entries
+
+
+def _bigrams(text: str) -> set[str]:
+    """문자 bigram 집합 (공백 제거, 한글 형태소 분석 없이 부분 일치 측정용)"""
+    compact = "".join(unicodedata.normalize("NFC", text).lower().split())
+    if len(compact) < 2:
+        return {compact} if compact else set()
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+def heading_relevance(topic: str, title: str) -> float:
+    """주제와 헤딩 제목의 문자 bigram Dice 유사도 (0.0 ~ 1.0)"""
+    a, b = _bigrams(topic), _bigrams(title)
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+# =============================================================================
+# Heading Index (Supabase)
+# =============================================================================
+class HeadingIndex:
+    """
+    rag_document_headings 테이블 접근 클래스
+    """
+
+    def __init__(self, supabase_client=None):
+        """
+        Args:
+            supabase_client: Supabase 클라이언트 (의존성 주입)
+        """
+        self.client = supabase_client
+
+    async def save_document_headings(self, document_id: str, entries: list[dict]) -> int:
+        """문서의 헤딩 트리 교체 저장 (재수집 시 기존 행 삭제 후 일괄 삽입)"""
+        await execute(self.client.table(HEADINGS_TABLE).delete().eq("document_id", document_id))
+        if entries:
+            await execute(self.client.table(HEADINGS_TABLE).insert(entries))
+        logger.info(f"헤딩 인덱스 저장: doc={document_id}, headings={len(entries)}")
+        return len(entries)
+
+    async def get_headings(self, doc_ids: list[str], user_id: Optional[str] = None) -> list[dict]:
+        """
+        문서 ID 리스트의 헤딩을 단일 키 조회로 가져옴 (문서/순서 정렬)
+
+        Args:
+            doc_ids: 문서 ID 리스트
+            user_id: 문서 소유자 ID (None이면 빈 결과)
+
+        주석(시니어 개발자): 앱의 Supabase 클라이언트는 서비스 키라 RLS가 적용되지 않음
+        → AsyncpgHeadingIndex와 같이 rag_documents 내부 조인 + 소유자 조건으로 직접 필터링
+        """
+        if not doc_ids or user_id is None:
+            return []
+        response = await execute(
+            self.client.table(HEADINGS_TABLE)
+            .select("document_id, chunk_id, title, level, position, parent_position, rag_documents!inner(user_id)")
+            .in_("document_id", list(doc_ids))
+            .eq("rag_documents.user_id", user_id)
+            .order("document_id")
+            .order("position")
+        )
+        rows = response.data or []
+        for row in rows:
+            row.pop("rag_documents", None)
+        return rows
+
+    async def retrieve_structure(
+        self,
+        doc_ids: list[str],
+        topic: Optional[str] = None,
+        top_k: int = 50,
+        user_id: Optional[str] = None
+    ) -> list[dict]:
+        """
+        목차 생성용 구조 청크 조회
+
+        Args:
+            doc_ids: 참조할 문서 ID 리스트
+            user_id: 문서 소유자 ID (None이면 빈 결과, get_headings 참고)
+            topic: 주어지면 헤딩 제목만 대상으로 경량 관련도 계산,
+                   top_k 초과 시 관련도 상위 top_k만 남김 (문서 순서는 유지)
+            top_k: 최대 반환 수
+
+        Returns:
+            retrieve_structure_chunks와 동일한 형태의 청크 리스트
+            (content/metadata.header = 헤딩 제목, metadata.header_level = 레벨)
+        """
+        headings = await self.get_headings(doc_ids, user_id)
+        chunks = [
+            {
+                "id": heading.get("chunk_id"),
+                "document_id": heading["document_id"],
+                "content": heading["title"],
+                "metadata": {
+                    "header": heading["title"],
+                    "header_level": heading["level"],
+                    "position": heading["position"],
+                    "parent_position": heading.get("parent_position"),
+                },
+                "similarity": heading_relevance(topic, heading["title"]) if topic else 1.0,
+            }
+            for heading in headings
+        ]
+        if len(chunks) > top_k:
+            ranked = sorted(range(len(chunks)), key=lambda i: chunks[i]["similarity"], reverse=True)
+            chunks = [chunks[i] for i in sorted(ranked[:top_k])]
+        return chunks
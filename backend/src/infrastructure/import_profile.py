@@ -0,0 +1,136 @@
+# =============================================================================
+# PRISM Writer Backend - Import Time Profiler
+# =============================================================================
+# 파일: backend/src/infrastructure/import_profile.py
+# 역할: 콜드 스타트 시 모듈별 import 시간 측정 (python -X importtime 결과 파싱)
+# 실행:
+#   cd backend && python -m src.infrastructure.import_profile              # main.py 상위 30개
+#   python -m src.infrastructure.import_profile --warmup --top 50          # 백그라운드 예열 모듈 포함
+#   python -m src.infrastructure.import_profile --json > imports.json
+# =============================================================================
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+import argparse
+import json
+import subprocess
+import sys
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class ImportTiming:
+    """모듈 1개의 import 시간 (마이크로초, -X importtime 단위)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.module.split(".")[0]
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """
+    -X importtime 출력 파싱
+
+    형식: "import time:  self [us] | cumulative | imported package" (들여쓰기 = 중첩 깊이)
+    """
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 라인
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(ImportTiming(
+            module=stripped,
+            self_us=int(parts[0]),
+            cumulative_us=int(parts[1]),
+            depth=(len(name) - len(stripped) - 1) // 2,
+        ))
+    return timings
+
+
+def profile_imports(code: str = "import main", cwd: Optional[Path] = None) -> list[ImportTiming]:
+    """
+    새 인터프리터에서 code를 실행하며 import 시간 측정 (현재 프로세스의 모듈 캐시 영향 없음)
+
+    Raises:
+        RuntimeError: code 실행 실패
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd or BACKEND_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import 프로파일 실행 실패:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def cumulative_ms(timings: list[ImportTiming], module: str) -> Optional[float]:
+    """최상위로 import된 module의 누적 시간 (ms)"""
+    for timing in timings:
+        if timing.module == module and timing.depth == 0:
+            return timing.cumulative_us / 1000
+    return None
+
+
+def by_package(timings: list[ImportTiming]) -> dict[str, float]:
+    """최상위 패키지별 자체 import 시간 합계 (ms, 내림차순)"""
+    totals: dict[str, int] = {}
+    for timing in timings:
+        totals[timing.package] = totals.get(timing.package, 0) + timing.self_us
+    return {package: us / 1000 for package, us in sorted(totals.items(), key=lambda item: -item[1])}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="모듈별 import 시간 측정")
+    parser.add_argument("--module", default="main", help="측정할 진입 모듈")
+    parser.add_argument("--warmup", action="store_true", help="백그라운드 예열 대상 모듈까지 import")
+    parser.add_argument("--top", type=int, default=30, help="출력할 모듈 수 (누적 시간 순)")
+    parser.add_argument("--json", action="store_true", help="JSON 출력")
+    args = parser.parse_args(argv)
+
+    code = f"import {args.module}"
+    if args.warmup:
+        code += "\nfrom src.infrastructure.warmup import warm_modules\nwarm_modules()"
+    timings = profile_imports(code)
+
+    total_ms = cumulative_ms(timings, args.module)
+    top = sorted(timings, key=lambda timing: -timing.cumulative_us)[:args.top]
+    packages = by_package(timings)
+
+    if args.json:
+        print(json.dumps({
+            "module": args.module,
+            "total_ms": total_ms,
+            "modules": [
+                {"module": t.module, "self_ms": t.self_us / 1000, "cumulative_ms": t.cumulative_us / 1000}
+                for t in top
+            ],
+            "packages": packages,
+        }, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{args.module} import: {total_ms:.1f} ms (모듈 {len(timings)}개)\n")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for timing in top:
+        print(f"{timing.cumulative_us / 1000:>14.1f} {timing.self_us / 1000:>9.1f}  {'  ' * timing.depth}{timing.module}")
+    print(f"\n{'self ms':>14}  package")
+    for package, ms in list(packages.items())[:args.top]:
+        print(f"{ms:>14.1f}  {package}")
+
+
+if __name__ == "__main__":
+    main()
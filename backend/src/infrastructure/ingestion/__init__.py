@@ -0,0 +1,33 @@
+# =============================================================================
+# PRISM Writer Backend - Ingestion Package
+# =============================================================================
+# 디렉토리: backend/src/infrastructure/ingestion/
+# 역할: 문서 파싱 → 청크 분할 → 임베딩 → rag_chunks 적재
+# =============================================================================
+
+import importlib
+
+# 주석(시니어 개발자): 하위 모듈은 asyncpg/numpy 등을 끌어오므로 패키지 import 시점이 아니라
+# 이름을 처음 참조할 때 로드 (PEP 562) → API 프로세스 콜드 스타트에 수집 의존성 비용이 붙지 않음
+_EXPORTS = {
+    "BatchEmbedder": "src.infrastructure.ingestion.embedder",
+    "ChunkCopyWriter": "src.infrastructure.ingestion.writer",
+    "ChunkSpool": "src.infrastructure.ingestion.writer",
+    "IngestionPipeline": "src.infrastructure.ingestion.pipeline",
+    "chunk_pages": "src.infrastructure.ingestion.chunking",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
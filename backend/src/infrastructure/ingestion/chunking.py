@@ -0,0 +1,276 @@
+# =============================================================================
+# PRISM Writer Backend - Ingestion: Page Streaming & Chunking
+# =============================================================================
+# 파일: backend/src/infrastructure/ingestion/chunking.py
+# 역할: 문서를 페이지 단위로 스트리밍하고 토큰 기준 청크로 분할
+# 주의: 이 모듈의 최상위 함수는 프로세스 풀 워커에서 실행되므로 pickle 가능해야 함
+#       (클로저/람다/외부 클라이언트 사용 금지)
+# =============================================================================
+
+from typing import Iterable, Iterator, Optional
+import re
+
+from src.infrastructure.chunk_classifier import classify_chunk_type
+from src.infrastructure.tokenizer import count_tokens, split_by_tokens
+
+# frontend/src/lib/rag/chunking.ts와 동일한 기본값
+DEFAULT_CHUNK_SIZE = 512
+DEFAULT_OVERLAP = 50
+
+# 텍스트 파일을 페이지처럼 나눌 때의 기준 문자 수
+TEXT_PAGE_CHARS = 20000
+
+HEADER_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$")
+PARAGRAPH_SPLIT_PATTERN = re.compile(r"\n\s*\n")
+
+# 주석(시니어 개발자): PDF/일반 텍스트에는 마크다운 '#'이 없으므로 번호 매긴 제목 줄을 헤딩으로 추정
+# ("제1장", "Chapter 2", "1.2 연구 방법", "IV. 결론") - 연도/쪽번호가 걸리지 않도록 번호는 2자리까지,
+# 문장 부호로 끝나거나 긴 줄은 본문으로 취급. 번호 목록 항목이 헤딩으로 잡힐 수 있는 휴리스틱
+PLAIN_HEADING_PATTERN = re.compile(
+    r"^(?:"
+    r"(?P<chapter>제\s*\d{1,2}\s*[장편부]|(?:chapter|part)\s+\d{1,2})(?:\s+\S.*)?"
+    r"|(?P<section>제\s*\d{1,2}\s*절)(?:\s+\S.*)?"
+    r"|(?P<number>\d{1,2}(?:\.\d{1,2}){0,3})\.?\s+\S.*"
+    r"|(?P<roman>[IVX]{1,5})\.\s+\S.*"
+    r")$",
+    re.IGNORECASE,
+)
+PLAIN_HEADING_MAX_CHARS = 60
+PLAIN_HEADING_REJECT_ENDINGS = (".", ",", ";", ":", "!", "?", "。")
+
+PDF_MIME_TYPES = {"application/pdf"}
+TEXT_MIME_TYPES = {"text/plain", "text/markdown", "text/x-markdown"}
+MARKDOWN_MIME_TYPES = {"text/markdown", "text/x-markdown"}
+
+
+# =============================================================================
+# Page Readers
+# =============================================================================
+def is_pdf(file_path: str, file_type: Optional[str] = None) -> bool:
+    return file_type in PDF_MIME_TYPES or (file_type is None and file_path.lower().endswith(".pdf"))
+
+
+def is_text(file_path: str, file_type: Optional[str] = None) -> bool:
+    if file_type is not None:
+        return file_type in TEXT_MIME_TYPES
+    return file_path.lower().endswith((".txt", ".md", ".markdown"))
+
+
+def is_markdown(file_path: str, file_type: Optional[str] = None) -> bool:
+    if file_type is not None:
+        return file_type in MARKDOWN_MIME_TYPES
+    return file_path.lower().endswith((".md", ".markdown"))
+
+
+def pdf_page_count(file_path: str) -> int:
+    from pypdf import PdfReader
+    return len(PdfReader(file_path).pages)
+
+
+def iter_pdf_pages(file_path: str, start: int = 0, end: Optional[int] = None) -> Iterator[tuple[int, str]]:
+    """
+    PDF 페이지 텍스트를 한 페이지씩 생성 (페이지 번호는 1부터)
+
+    pypdf는 페이지 객체를 접근 시점에 파싱하므로 메모리는 페이지 단위로 유지됨
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(file_path)
+    end = len(reader.pages) if end is None else min(end, len(reader.pages))
+    for index in range(start, end):
+        yield index + 1, reader.pages[index].extract_text() or ""
+
+
+def iter_text_pages(file_path: str, page_chars: int = TEXT_PAGE_CHARS) -> Iterator[tuple[int, str]]:
+    """텍스트/마크다운 파일을 빈 줄 경계에서 page_chars 내외 블록으로 스트리밍"""
+    page_number, lines, size = 1, [], 0
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            lines.append(line)
+            size += len(line)
+            if size >= page_chars and not line.strip():
+                yield page_number, "".join(lines)
+                page_number, lines, size = page_number + 1, [], 0
+    if lines:
+        yield page_number, "".join(lines)
+
+
+# =============================================================================
+# Chunker
+# =============================================================================
+def _plain_heading(line: str) -> Optional[tuple[str, int]]:
+    """번호 매긴 제목 줄이면 (제목, 레벨) 반환 (장/편/부/로마 숫자: 1, 절: 2, "1.2.3": 점 개수 + 1)"""
+    if len(line) > PLAIN_HEADING_MAX_CHARS or line.endswith(PLAIN_HEADING_REJECT_ENDINGS):
+        return None
+    match = PLAIN_HEADING_PATTERN.match(line)
+    if match is None:
+        return None
+    if match.group("section"):
+        level = 2
+    elif match.group("number"):
+        level = match.group("number").count(".") + 1
+    else:
+        level = 1
+    return line, level
+
+
+def _match_header(line: str, plain_headings: bool) -> Optional[tuple[str, int]]:
+    match = HEADER_PATTERN.match(line)
+    if match:
+        return match.group(2).strip(), len(match.group(1))
+    return _plain_heading(line) if plain_headings else None
+
+
+def _segments(text: str, plain_headings: bool = False) -> Iterator[tuple[Optional[tuple[str, int]], str]]:
+    """
+    페이지 텍스트를 (헤더, 문단) 조각으로 분리
+
+    Args:
+        plain_headings: True면 마크다운 '#' 외에 번호 매긴 제목 줄도 헤더로 추정 (PDF/일반 텍스트)
+
+    Yields:
+        (헤더 정보 (제목, 레벨) 또는 None, 문단 텍스트) - 헤더 줄로 시작하는 문단은 헤더 정보 포함
+    """
+    for paragraph in PARAGRAPH_SPLIT_PATTERN.split(text):
+        current: list[str] = []
+        header = None
+        for line in paragraph.splitlines():
+            matched = _match_header(line.strip(), plain_headings)
+            if matched:
+                if current:
+                    yield header, "\n".join(current).strip()
+                header = matched
+                current = [line.strip()]
+            else:
+                current.append(line)
+        if current and "\n".join(current).strip():
+            yield header, "\n".join(current).strip()
+
+
+class _ChunkBuilder:
+    """문단을 토큰 한도까지 모아 청크 생성 (overlap은 문단 경계 기준)"""
+
+    def __init__(self, chunk_size: int, overlap: int):
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.chunks: list[dict] = []
+        self.buffer: list[tuple[str, int, int]] = []  # (텍스트, 토큰 수, 페이지)
+        self.buffer_tokens = 0
+        self.section: Optional[tuple[str, int]] = None
+        self.starts_section = False
+
+    def add(self, header: Optional[tuple[str, int]], text: str, page: int) -> None:
+        if header is not None:
+            self.flush(carry_overlap=False)
+            self.section = header
+            self.starts_section = True
+
+        tokens = count_tokens(text)
+        if tokens > self.chunk_size:
+            self.flush(carry_overlap=False)
+            for piece in split_by_tokens(text, self.chunk_size, self.overlap):
+                self.buffer = [(piece, count_tokens(piece), page)]
+                self.flush(carry_overlap=False)
+            return
+
+        if self.buffer and self.buffer_tokens + tokens > self.chunk_size:
+            self.flush(carry_overlap=True)
+        self.buffer.append((text, tokens, page))
+        self.buffer_tokens += tokens
+
+    def flush(self, carry_overlap: bool) -> None:
+        if not self.buffer:
+            return
+        content = "\n\n".join(text for text, _, _ in self.buffer).strip()
+        if content:
+            metadata = {
+                "page": self.buffer[0][2],
+                "page_end": self.buffer[-1][2],
+                "section_title": self.section[0] if self.section else None,
+                "token_count": sum(tokens for _, tokens, _ in self.buffer),
+            }
+            if self.starts_section and self.section:
+                metadata["header"], metadata["header_level"] = self.section
+            self.chunks.append({
+                "content": content,
+                "chunk_type": classify_chunk_type(content),
+                "metadata": metadata,
+            })
+            self.starts_section = False
+
+        carried: list[tuple[str, int, int]] = []
+        if carry_overlap and self.overlap > 0:
+            total = 0
+            for item in reversed(self.buffer):
+                if total + item[1] > self.overlap:
+                    break
+                carried.insert(0, item)
+                total += item[1]
+        self.buffer = carried
+        self.buffer_tokens = sum(tokens for _, tokens, _ in carried)
+
+
+def chunk_pages(
+    pages: Iterable[tuple[int, str]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    overlap: int = DEFAULT_OVERLAP,
+    plain_headings: bool = False
+) -> list[dict]:
+    """
+    페이지 스트림을 청크 리스트로 변환
+
+    Args:
+        pages: (페이지 번호, 텍스트) 이터러블
+        chunk_size: 청크 최대 토큰 수
+        overlap: 인접 청크 간 겹치는 최대 토큰 수 (문단 단위)
+        plain_headings: 번호 매긴 제목 줄도 헤더로 추정 (마크다운이 아닌 문서)
+
+    Returns:
+        [{"content", "chunk_type", "metadata": {"page", "page_end", "section_title",
+          "token_count", ["header", "header_level"]}}]
+        header/header_level은 섹션을 시작하는 청크에만 포함 (heading_index 입력 형식)
+    """
+    builder = _ChunkBuilder(chunk_size, overlap)
+    for page_number, text in pages:
+        for header, segment in _segments(text, plain_headings):
+            builder.add(header, segment, page_number)
+    builder.flush(carry_overlap=False)
+    return builder.chunks
+
+
+# =============================================================================
+# Process Pool Workers
+# =============================================================================
+def chunk_pdf_range(file_path: str, start: int, end: int, chunk_size: int, overlap: int) -> list[dict]:
+    """워커: PDF 페이지 범위 [start, end) 파싱 + 청크 분할"""
+    return chunk_pages(iter_pdf_pages(file_path, start, end), chunk_size, overlap, plain_headings=True)
+
+
+def chunk_text_pages(
+    pages: list[tuple[int, str]],
+    chunk_size: int,
+    overlap: int,
+    plain_headings: bool = False
+) -> list[dict]:
+    """워커: 텍스트 페이지 묶음 청크 분할"""
+    return chunk_pages(pages, chunk_size, overlap, plain_headings)
+
+
+def carry_sections(chunks: list[dict], section: Optional[str]) -> Optional[str]:
+    """
+    워커별로 나뉜 페이지 범위의 섹션 정보 이어붙이기 (문서 순서대로 호출)
+
+    범위 앞부분 청크는 이전 범위의 섹션에 속하므로 section_title을 채움
+
+    Returns:
+        다음 범위로 넘길 현재 섹션 제목
+    """
+    for chunk in chunks:
+        metadata = chunk["metadata"]
+        if metadata.get("header"):
+            section = metadata["header"]
+        elif metadata.get("section_title") is None:
+            metadata["section_title"] = section
+        else:
+            section = metadata["section_title"]
+    return section
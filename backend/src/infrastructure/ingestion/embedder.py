@@ -0,0 +1,98 @@
+# =============================================================================
+# PRISM Writer Backend - Ingestion: Batch Embedder
+# =============================================================================
+# 파일: backend/src/infrastructure/ingestion/embedder.py
+# 역할: 청크 임베딩을 대용량 배치 + 동시 요청 수 제한으로 생성
+# =============================================================================
+
+from typing import Optional
+import asyncio
+import logging
+import time
+
+from src.infrastructure.retriever import DEFAULT_EMBEDDING_MODEL_ID
+from src.infrastructure.supabase_utils import call_maybe_async
+
+logger = logging.getLogger(__name__)
+
+# OpenAI embeddings API: 요청당 최대 2048개 입력, 청크 512토큰 기준 128개 ≈ 65k 토큰
+DEFAULT_EMBED_BATCH_SIZE = 128
+DEFAULT_EMBED_CONCURRENCY = 4
+
+
+class BatchEmbedder:
+    """
+    임베딩 배치 요청기
+
+    - 입력을 batch_size 단위로 묶어 embeddings.create 1회로 처리
+    - 동시 요청 수는 max_concurrency로 제한
+    - gateway(LLMGateway)가 주어지면 등급별 속도 제한/재시도/서킷 브레이커 경유
+    """
+
+    def __init__(
+        self,
+        client,
+        model_id: str = DEFAULT_EMBEDDING_MODEL_ID,
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_EMBED_CONCURRENCY,
+        gateway=None,
+        tier: int = 4,
+        dimensions: Optional[int] = None
+    ):
+        """
+        Args:
+            client: 임베딩 클라이언트 (OpenAI 호환, embeddings.create)
+            model_id: 임베딩 모델 ID (rag_chunks.embedding_model_id에 기록)
+            batch_size: 요청당 입력 수
+            max_concurrency: 동시 임베딩 요청 수 상한
+            gateway: 공유 LLMGateway (선택)
+            tier: gateway 사용 시 적용할 등급 (백그라운드 수집은 관리자 등급 버킷 사용)
+            dimensions: 출력 차원 지정 (text-embedding-3 계열만 지원, None이면 모델 기본값)
+        """
+        self.client = client
+        self.model_id = model_id
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.gateway = gateway
+        self.tier = tier
+        self.dimensions = dimensions
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        self.requests = 0
+        self.inputs = 0
+        self.total_ms = 0.0
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """텍스트 리스트 임베딩 (입력 순서 유지)"""
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        results = await asyncio.gather(*(self._embed_batch(batch) for batch in batches))
+        return [vector for batch in results for vector in batch]
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        kwargs = {"model": self.model_id, "input": texts}
+        if self.dimensions:
+            kwargs["dimensions"] = self.dimensions
+
+        async def call():
+            return await call_maybe_async(self.client.embeddings.create, **kwargs)
+
+        async with self._semaphore:
+            started = time.perf_counter()
+            if self.gateway is not None:
+                response = await self.gateway.run(call, tier=self.tier)
+            else:
+                response = await call()
+            self.total_ms += (time.perf_counter() - started) * 1000
+
+        self.requests += 1
+        self.inputs += len(texts)
+        data = sorted(response.data, key=lambda item: getattr(item, "index", 0))
+        return [list(item.embedding) for item in data]
+
+    def stats(self) -> dict:
+        return {
+            "model_id": self.model_id,
+            "requests": self.requests,
+            "inputs": self.inputs,
+            "avg_request_ms": round(self.total_ms / self.requests, 3) if self.requests else 0.0,
+        }
@@ -0,0 +1,298 @@
+# =============================================================================
+# PRISM Writer Backend - Ingestion Pipeline
+# =============================================================================
+# 파일: backend/src/infrastructure/ingestion/pipeline.py
+# 역할: 문서 → 청크 → 임베딩 → rag_chunks 적재 파이프라인
+# 단계:
+#   1. 파싱/청크 분할: 프로세스 풀에서 페이지 범위 단위로 병렬 처리
+#      (동시에 떠 있는 범위 수를 제한하여 대용량 PDF도 메모리 일정)
+#   2. 임베딩: 청크를 배치로 묶어 동시 요청 수 제한 하에 생성
+#      (재수집 시 내용 해시가 같은 기존 청크는 임베딩 생략, 기존 행 재사용)
+#   3. 적재: 임베딩된 배치는 로컬 스풀 파일에 쌓고 (임베딩 동안 DB 커넥션 미사용),
+#      마지막에 짧은 트랜잭션 하나에서 COPY로 스테이징 → 교체
+#   4. 커밋 후 on_document_changed 호출 (검색/목차/청크 캐시 무효화)
+# =============================================================================
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable, Optional
+import asyncio
+import logging
+import os
+import time
+import uuid
+
+from src.infrastructure.ingestion.chunking import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_OVERLAP,
+    carry_sections,
+    chunk_pdf_range,
+    chunk_text_pages,
+    is_markdown,
+    is_pdf,
+    is_text,
+    iter_text_pages,
+    pdf_page_count,
+)
+from src.infrastructure.ingestion.embedder import BatchEmbedder
+from src.infrastructure.ingestion.writer import ChunkCopyWriter, ChunkSpool, content_hash
+from src.infrastructure.supabase_utils import maybe_await
+
+logger = logging.getLogger(__name__)
+
+# 워커 1개 작업 단위 (페이지 수)
+DEFAULT_PAGES_PER_TASK = 16
+
+
+class IngestionPipeline:
+    """
+    스트리밍 병렬 문서 수집 파이프라인
+
+    사용 예:
+        pipeline = IngestionPipeline(
+            pool, BatchEmbedder(AsyncOpenAI()),
+            on_document_changed=document_invalidation.notify
+        )
+        stats = await pipeline.ingest(document_id, user_id, "/tmp/upload.pdf", "application/pdf")
+    """
+
+    def __init__(
+        self,
+        pool,
+        embedder: BatchEmbedder,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        overlap: int = DEFAULT_OVERLAP,
+        pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        writer: Optional[ChunkCopyWriter] = None,
+        on_document_changed: Optional[Callable[[str, str], Any]] = None
+    ):
+        """
+        Args:
+            pool: asyncpg 커넥션 풀 (create_pg_pool)
+            embedder: 배치 임베딩 생성기
+            chunk_size: 청크 최대 토큰 수
+            overlap: 인접 청크 간 겹치는 최대 토큰 수
+            pages_per_task: 워커 작업 단위 페이지 수
+            max_workers: 프로세스 풀 크기 (기본: CPU 수)
+            executor: 외부에서 관리하는 Executor (주어지면 close()에서 종료하지 않음)
+            writer: 청크 적재기 (기본: ChunkCopyWriter(pool))
+            on_document_changed: 청크 교체 커밋 후 호출 (document_id, user_id), 동기/비동기 모두 가능
+                                 (예: cache.document_invalidation.notify)
+        """
+        self.embedder = embedder
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.pages_per_task = pages_per_task
+        self.max_workers = max_workers or os.cpu_count() or 2
+        self.writer = writer or ChunkCopyWriter(pool)
+        self.on_document_changed = on_document_changed
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+    async def ingest(
+        self,
+        document_id: str,
+        user_id: str,
+        file_path: str,
+        file_type: Optional[str] = None,
+        incremental: bool = True
+    ) -> dict:
+        """
+        문서 수집 (임베딩은 트랜잭션 밖에서, 기존 청크 교체만 트랜잭션 안에서)
+
+        Args:
+            document_id: rag_documents.id
+            user_id: 문서 소유자 (rag_chunks.tenant_id)
+            file_path: 로컬 파일 경로
+            file_type: MIME 타입 (None이면 확장자로 판단)
+            incremental: True면 내용이 같은 기존 청크의 임베딩/id 재사용
+
+        Returns:
+            {"document_id", "chunks", "reused", "embedded", "headings",
+             "embedding_requests", "elapsed_ms"}
+
+        Raises:
+            ValueError: 지원하지 않는 파일 형식
+        """
+        started = time.perf_counter()
+        requests_before = self.embedder.requests
+        await self.writer.update_document(document_id, "processing", {})
+
+        try:
+            existing = (
+                await self.writer.existing_chunks(document_id, self.embedder.model_id) if incremental else {}
+            )
+            with ChunkSpool() as spool:
+                async for batch in self._embedded_batches(file_path, file_type, existing):
+                    await asyncio.to_thread(spool.write, batch)
+                headings = await self.writer.replace(document_id, spool, user_id, self.embedder.model_id)
+        except Exception as e:
+            logger.error(f"문서 수집 실패: doc={document_id}, error={e}")
+            await self.writer.update_document(document_id, "error", {"error_message": str(e)})
+            raise
+
+        # 청크 교체가 커밋된 뒤에만 캐시 무효화 (이후 요청은 새 청크로 캐시를 다시 채움)
+        await self._notify_document_changed(document_id, user_id)
+
+        stats = {
+            "document_id": document_id,
+            "chunks": spool.rows,
+            "reused": spool.reused,
+            "embedded": spool.rows - spool.reused,
+            "headings": headings,
+            "embedding_requests": self.embedder.requests - requests_before,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        await self.writer.update_document(
+            document_id, "ready", {"chunk_count": spool.rows, "embedding_model_id": self.embedder.model_id}
+        )
+        logger.info(f"문서 수집 완료: {stats}")
+        return stats
+
+    async def _notify_document_changed(self, document_id: str, user_id: str) -> None:
+        """변경 알림 (수집은 이미 커밋되었으므로 알림 실패는 로그만 남김)"""
+        if self.on_document_changed is None:
+            return
+        try:
+            await maybe_await(self.on_document_changed(document_id, user_id))
+        except Exception as e:
+            logger.error(f"문서 변경 알림 실패: doc={document_id}, error={e}")
+
+    # -------------------------------------------------------------------------
+    # Stage 1: 파싱/청크 분할 (프로세스 풀)
+    # -------------------------------------------------------------------------
+    async def iter_chunks(self, file_path: str, file_type: Optional[str] = None) -> AsyncIterator[dict]:
+        """
+        문서 순서대로 청크 생성 (chunk_index, id, 섹션 정보 채움)
+
+        워커 작업은 최대 max_workers * 2개까지만 동시에 제출하여 메모리 상한 유지
+        """
+        loop = asyncio.get_running_loop()
+        window = self.max_workers * 2
+        pending: deque = deque()
+        section: Optional[str] = None
+        chunk_index = 0
+
+        for task_args in await self._task_args(file_path, file_type):
+            pending.append(loop.run_in_executor(self.executor, *task_args))
+            if len(pending) < window:
+                continue
+            chunks = await pending.popleft()
+            section = carry_sections(chunks, section)
+            for chunk in chunks:
+                yield self._finish_chunk(chunk, chunk_index)
+                chunk_index += 1
+
+        while pending:
+            chunks = await pending.popleft()
+            section = carry_sections(chunks, section)
+            for chunk in chunks:
+                yield self._finish_chunk(chunk, chunk_index)
+                chunk_index += 1
+
+    async def _task_args(self, file_path: str, file_type: Optional[str]):
+        """워커 작업 인자 이터레이터 (PDF: 페이지 범위, 텍스트: 페이지 묶음)"""
+        if is_pdf(file_path, file_type):
+            page_count = await asyncio.to_thread(pdf_page_count, file_path)
+            return (
+                (chunk_pdf_range, file_path, start, min(start + self.pages_per_task, page_count),
+                 self.chunk_size, self.overlap)
+                for start in range(0, page_count, self.pages_per_task)
+            )
+        if is_text(file_path, file_type):
+            return self._text_task_args(file_path, plain_headings=not is_markdown(file_path, file_type))
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type or file_path}")
+
+    def _text_task_args(self, file_path: str, plain_headings: bool):
+        group: list[tuple[int, str]] = []
+        for page in iter_text_pages(file_path):
+            group.append(page)
+            if len(group) >= self.pages_per_task:
+                yield chunk_text_pages, group, self.chunk_size, self.overlap, plain_headings
+                group = []
+        if group:
+            yield chunk_text_pages, group, self.chunk_size, self.overlap, plain_headings
+
+    @staticmethod
+    def _finish_chunk(chunk: dict, chunk_index: int) -> dict:
+        chunk["id"] = str(uuid.uuid4())
+        chunk["chunk_index"] = chunk_index
+        return chunk
+
+    # -------------------------------------------------------------------------
+    # Stage 2: 임베딩 배치 (동시 요청 수 제한, 순서 유지)
+    # -------------------------------------------------------------------------
+    async def _embedded_batches(
+        self,
+        file_path: str,
+        file_type: Optional[str],
+        existing: Optional[dict[str, list[str]]] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        적재할 청크 배치 생성 (진행 중 임베딩 배치는 max_concurrency * 2개까지)
+
+        Args:
+            existing: {content_hash: [기존 chunk_id]} - 일치하는 청크는 임베딩 없이 기존 id로 내보냄
+                      (스테이징 적재는 순서 무관, 헤딩은 finalize에서 chunk_index로 정렬)
+        """
+        window = self.embedder.max_concurrency * 2
+        pending: deque = deque()
+        batch: list[dict] = []
+        reused: list[dict] = []
+
+        try:
+            async for chunk in self.iter_chunks(file_path, file_type):
+                chunk["content_hash"] = content_hash(chunk["content"])
+                reusable_ids = existing.get(chunk["content_hash"]) if existing else None
+                if reusable_ids:
+                    chunk["id"] = reusable_ids.pop(0)
+                    chunk["embedding"] = None
+                    chunk["reused"] = True
+                    reused.append(chunk)
+                    if len(reused) >= self.embedder.batch_size:
+                        yield reused
+                        reused = []
+                    continue
+
+                batch.append(chunk)
+                if len(batch) < self.embedder.batch_size:
+                    continue
+                pending.append(self._embed_batch(batch))
+                batch = []
+                if len(pending) >= window:
+                    yield await pending.popleft()
+
+            if reused:
+                yield reused
+            if batch:
+                pending.append(self._embed_batch(batch))
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _embed_batch(self, batch: list[dict]) -> asyncio.Task:
+        async def run() -> list[dict]:
+            vectors = await self.embedder.embed([chunk["content"] for chunk in batch])
+            for chunk, vector in zip(batch, vectors):
+                chunk["embedding"] = vector
+            return batch
+
+        return asyncio.ensure_future(run())
@@ -0,0 +1,280 @@
+# =============================================================================
+# PRISM Writer Backend - Ingestion: Bulk Chunk Writer (asyncpg COPY)
+# =============================================================================
+# 파일: backend/src/infrastructure/ingestion/writer.py
+# 역할: 임베딩된 청크를 로컬 스풀 파일에 모아 두었다가
+#       짧은 트랜잭션 하나에서 스테이징 COPY → rag_chunks / rag_document_headings 교체
+#       (내용이 같은 기존 청크는 행을 유지하고 chunk_index/metadata만 갱신, migration 045)
+# 주의: pool은 pg_vector_store.create_pg_pool()로 생성 (vector/jsonb 코덱 등록 필요)
+# =============================================================================
+
+from typing import Iterator
+import asyncio
+import hashlib
+import json
+import logging
+import pickle
+import tempfile
+
+from src.infrastructure.heading_index import build_heading_entries
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# SQL
+# =============================================================================
+# 주석(시니어 개발자): jsonb/enum 컬럼은 COPY 바이너리 포맷 코덱이 없으므로
+# 스테이징에는 text로 적재하고 최종 INSERT ... SELECT에서 캐스팅
+CREATE_STAGING_SQL = """
+CREATE TEMP TABLE ingest_chunks_staging (
+    id UUID,
+    chunk_index INTEGER,
+    content TEXT,
+    embedding vector(1536),
+    metadata TEXT,
+    chunk_type TEXT,
+    content_hash TEXT,
+    reused BOOLEAN
+) ON COMMIT DROP
+"""
+
+STAGING_COLUMNS = [
+    "id", "chunk_index", "content", "embedding", "metadata", "chunk_type", "content_hash", "reused"
+]
+
+# 재사용 가능한 기존 청크 (같은 임베딩 모델로 만든 행만)
+EXISTING_CHUNKS_SQL = """
+SELECT id::text AS id, COALESCE(content_hash, md5(content)) AS content_hash
+FROM public.rag_chunks
+WHERE document_id = $1::uuid
+  AND embedding IS NOT NULL
+  AND embedding_model_id = $2
+ORDER BY chunk_index
+"""
+
+DEFER_CHUNK_INDEX_SQL = "SET CONSTRAINTS public.unique_chunk_per_document DEFERRED"
+
+DELETE_CHUNKS_SQL = """
+DELETE FROM public.rag_chunks c
+WHERE c.document_id = $1::uuid
+  AND NOT EXISTS (
+      SELECT 1 FROM ingest_chunks_staging s WHERE s.id = c.id AND s.reused
+  )
+"""
+
+# 주석(시니어 개발자): 값이 바뀐 행만 갱신 (순서가 그대로인 청크는 dead tuple을 만들지 않음)
+UPDATE_REUSED_CHUNKS_SQL = """
+UPDATE public.rag_chunks c
+SET chunk_index = s.chunk_index,
+    metadata = s.metadata::jsonb,
+    chunk_type = s.chunk_type::chunk_type_enum,
+    content_hash = s.content_hash
+FROM ingest_chunks_staging s
+WHERE s.reused
+  AND c.id = s.id
+  AND c.document_id = $1::uuid
+  AND (c.chunk_index, c.metadata, c.chunk_type::text, c.content_hash)
+      IS DISTINCT FROM (s.chunk_index, s.metadata::jsonb, s.chunk_type, s.content_hash)
+"""
+
+INSERT_CHUNKS_SQL = """
+INSERT INTO public.rag_chunks (
+    id, document_id, chunk_index, content, embedding, metadata, chunk_type,
+    tenant_id, embedding_model_id, embedding_dim, embedded_at, content_hash
+)
+SELECT
+    s.id, $1::uuid, s.chunk_index, s.content, s.embedding, s.metadata::jsonb,
+    s.chunk_type::chunk_type_enum, $2::uuid, $3, vector_dims(s.embedding), NOW(), s.content_hash
+FROM ingest_chunks_staging s
+WHERE NOT s.reused
+"""
+
+DELETE_HEADINGS_SQL = "DELETE FROM public.rag_document_headings WHERE document_id = $1::uuid"
+
+HEADING_COLUMNS = ["document_id", "chunk_id", "title", "level", "position", "parent_position"]
+
+UPDATE_DOCUMENT_SQL = """
+UPDATE public.rag_documents
+SET status = $2,
+    metadata = COALESCE(metadata, '{}'::jsonb) || $3::jsonb,
+    updated_at = NOW()
+WHERE id = $1::uuid
+"""
+
+
+def content_hash(content: str) -> str:
+    """청크 내용 해시 (SQL md5(content)와 동일)"""
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# Chunk Spool
+# =============================================================================
+# 주석(시니어 개발자): 임베딩 API 호출은 문서 크기에 따라 수 분이 걸리므로 그동안 풀 커넥션과
+# 트랜잭션을 잡고 있으면 안 됨 → 임베딩된 배치는 디스크에 쌓고(메모리 일정), DB는 교체 시점에만 사용
+class ChunkSpool:
+    """
+    적재 대기 청크 버퍼 (임시 파일, 배치 단위 pickle)
+
+    사용 예:
+        with ChunkSpool() as spool:
+            spool.write(batch)                   # 임베딩 배치마다 반복
+            await writer.replace(document_id, spool, user_id, model_id)
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.reused = 0
+        self.heading_chunks: list[dict] = []
+        self._batches = 0
+        self._file = tempfile.TemporaryFile()
+
+    def __enter__(self) -> "ChunkSpool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def write(self, chunks: list[dict]) -> None:
+        """
+        청크 배치를 스테이징 레코드로 변환하여 기록
+
+        Args:
+            chunks: [{"id", "chunk_index", "content", "embedding", "metadata", "chunk_type"}]
+                    재사용 청크는 기존 id + "reused": True (embedding 불필요)
+        """
+        records = [
+            (
+                chunk["id"],
+                chunk["chunk_index"],
+                chunk["content"],
+                chunk["embedding"],
+                json.dumps(chunk["metadata"], ensure_ascii=False),
+                chunk["chunk_type"],
+                chunk.get("content_hash") or content_hash(chunk["content"]),
+                bool(chunk.get("reused")),
+            )
+            for chunk in chunks
+        ]
+        pickle.dump(records, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._batches += 1
+        self.rows += len(chunks)
+        self.reused += sum(1 for chunk in chunks if chunk.get("reused"))
+        self.heading_chunks.extend(
+            {"id": chunk["id"], "chunk_index": chunk["chunk_index"], "metadata": chunk["metadata"]}
+            for chunk in chunks
+            if chunk["metadata"].get("header_level") is not None
+        )
+
+    def batches(self) -> Iterator[list[tuple]]:
+        """기록된 배치를 순서대로 읽기 (STAGING_COLUMNS 순서의 레코드 리스트)"""
+        self._file.flush()
+        self._file.seek(0)
+        for _ in range(self._batches):
+            yield pickle.load(self._file)
+
+
+# =============================================================================
+# Chunk Copy Writer
+# =============================================================================
+class ChunkWriteSession:
+    """단일 문서 교체 세션 (커넥션 + 트랜잭션 + 스테이징 테이블 보유)"""
+
+    def __init__(self, conn, document_id: str):
+        self.conn = conn
+        self.document_id = document_id
+
+    async def copy(self, records: list[tuple]) -> None:
+        """스테이징 레코드 배치를 임시 테이블로 COPY"""
+        await self.conn.copy_records_to_table(
+            "ingest_chunks_staging", records=records, columns=STAGING_COLUMNS
+        )
+
+    async def finalize(
+        self,
+        user_id: str,
+        embedding_model_id: str,
+        heading_chunks: list[dict],
+        reused: bool = True
+    ) -> int:
+        """
+        기존 청크/헤딩 교체 (스테이징 → rag_chunks), 저장된 헤딩 수 반환
+
+        재사용 청크는 제자리 갱신, 나머지 기존 청크는 삭제, 새 청크는 INSERT
+        """
+        await self.conn.execute(DEFER_CHUNK_INDEX_SQL)
+        await self.conn.execute(DELETE_CHUNKS_SQL, self.document_id)
+        if reused:
+            await self.conn.execute(UPDATE_REUSED_CHUNKS_SQL, self.document_id)
+        await self.conn.execute(INSERT_CHUNKS_SQL, self.document_id, user_id, embedding_model_id)
+
+        heading_chunks = sorted(heading_chunks, key=lambda chunk: chunk["chunk_index"])
+        entries = build_heading_entries(self.document_id, heading_chunks)
+        await self.conn.execute(DELETE_HEADINGS_SQL, self.document_id)
+        if entries:
+            await self.conn.copy_records_to_table(
+                "rag_document_headings",
+                records=[tuple(entry[column] for column in HEADING_COLUMNS) for entry in entries],
+                columns=HEADING_COLUMNS,
+                schema_name="public"
+            )
+        return len(entries)
+
+
+class ChunkCopyWriter:
+    """
+    asyncpg COPY 기반 rag_chunks 적재기
+
+    사용 예:
+        existing = await writer.existing_chunks(document_id, model_id)
+        with ChunkSpool() as spool:
+            spool.write(batch)                   # 임베딩 배치마다 반복 (DB 커넥션 미사용)
+            headings = await writer.replace(document_id, spool, user_id, model_id)
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def existing_chunks(self, document_id: str, embedding_model_id: str) -> dict[str, list[str]]:
+        """
+        재사용 가능한 기존 청크 조회 (트랜잭션 밖, 커넥션은 조회 동안만 사용)
+
+        Returns:
+            {content_hash: [chunk_id, ...]} (같은 내용이 여러 번이면 chunk_index 순)
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(EXISTING_CHUNKS_SQL, document_id, embedding_model_id)
+        existing: dict[str, list[str]] = {}
+        for row in rows:
+            existing.setdefault(row["content_hash"], []).append(row["id"])
+        return existing
+
+    async def replace(self, document_id: str, spool: ChunkSpool, user_id: str, embedding_model_id: str) -> int:
+        """
+        스풀된 청크로 문서 청크/헤딩 교체 (COPY + finalize를 한 트랜잭션에서), 저장된 헤딩 수 반환
+
+        주석(시니어 개발자): 여기서는 로컬 파일 읽기와 DB 쓰기만 하므로 트랜잭션 길이는
+        임베딩 API 지연과 무관하게 적재량에만 비례
+        """
+        batches = spool.batches()
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(CREATE_STAGING_SQL)
+                session = ChunkWriteSession(conn, document_id)
+                while True:
+                    records = await asyncio.to_thread(next, batches, None)
+                    if records is None:
+                        break
+                    await session.copy(records)
+                return await session.finalize(
+                    user_id, embedding_model_id, spool.heading_chunks, reused=spool.reused > 0
+                )
+
+    async def update_document(self, document_id: str, status: str, metadata: dict) -> None:
+        """rag_documents 상태/메타데이터 갱신 (트랜잭션 밖, 진행 상태 즉시 노출)"""
+        async with self.pool.acquire() as conn:
+            await conn.execute(UPDATE_DOCUMENT_SQL, document_id, status, metadata)
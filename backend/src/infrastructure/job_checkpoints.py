@@ -0,0 +1,70 @@
+# =============================================================================
+# PRISM Writer Backend - Job Checkpoints
+# =============================================================================
+# 파일: backend/src/infrastructure/job_checkpoints.py
+# 역할: 백그라운드 작업 진행 위치 저장/조회 (job_checkpoints 테이블, migration 043)
+# 사용: 배치 처리와 같은 트랜잭션(conn)에서 save() 호출 → 재개 시 중복/누락 없음
+# =============================================================================
+
+from typing import Optional
+
+LOAD_SQL = """
+SELECT job_name, last_key, processed, updated, state, started_at, updated_at, completed_at
+FROM public.job_checkpoints
+WHERE job_name = $1
+"""
+
+SAVE_SQL = """
+INSERT INTO public.job_checkpoints (job_name, last_key, processed, updated, state)
+VALUES ($1, $2, $3, $4, $5::jsonb)
+ON CONFLICT (job_name) DO UPDATE SET
+    last_key = EXCLUDED.last_key,
+    processed = job_checkpoints.processed + EXCLUDED.processed,
+    updated = job_checkpoints.updated + EXCLUDED.updated,
+    state = job_checkpoints.state || EXCLUDED.state,
+    updated_at = NOW(),
+    completed_at = NULL
+"""
+
+COMPLETE_SQL = "UPDATE public.job_checkpoints SET completed_at = NOW(), updated_at = NOW() WHERE job_name = $1"
+
+RESET_SQL = "DELETE FROM public.job_checkpoints WHERE job_name = $1"
+
+
+class JobCheckpointStore:
+    """
+    job_checkpoints 접근 클래스 (asyncpg)
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def load(self, job_name: str) -> Optional[dict]:
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(LOAD_SQL, job_name)
+        return dict(row) if row else None
+
+    @staticmethod
+    async def save(
+        conn,
+        job_name: str,
+        last_key: Optional[str],
+        processed: int,
+        updated: int,
+        state: Optional[dict] = None
+    ) -> None:
+        """
+        진행 위치 저장 (processed/updated는 이번 배치 증가분)
+
+        Args:
+            conn: 배치 처리 중인 커넥션 (트랜잭션 안에서 호출)
+        """
+        await conn.execute(SAVE_SQL, job_name, last_key, processed, updated, state or {})
+
+    async def complete(self, job_name: str) -> None:
+        async with self.pool.acquire() as conn:
+            await conn.execute(COMPLETE_SQL, job_name)
+
+    async def reset(self, job_name: str) -> None:
+        async with self.pool.acquire() as conn:
+            await conn.execute(RESET_SQL, job_name)
@@ -0,0 +1,380 @@
+# =============================================================================
+# PRISM Writer Backend - LLM Gateway
+# =============================================================================
+# 파일: backend/src/infrastructure/llm_gateway.py
+# 역할: 모든 유스케이스가 공유하는 LLM 호출 관문
+#   - 전역 동시 실행 제한 (세마포어)
+#   - 사용자 등급(tier)별 토큰 버킷 요청 속도 제한
+#   - 지수 백오프 + 지터 재시도, 서킷 브레이커
+#   - (선택) p95 지연 초과 시 헤지(hedged) 요청
+#   - 대기열 깊이 / 대기 시간 지표
+# =============================================================================
+
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Optional
+import asyncio
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Tier Limits
+# =============================================================================
+# 등급 정의는 migration 009의 profiles.tier와 동일
+# | 대기 0 | 무료 1 | 프리미엄 2 | 스페셜 3 | 관리자 4 |
+# 값: (초당 요청 수, 버스트 크기)
+DEFAULT_TIER_LIMITS: dict[int, tuple[float, int]] = {
+    0: (0.2, 1),
+    1: (1.0, 3),
+    2: (4.0, 10),
+    3: (10.0, 20),
+    4: (20.0, 40),
+}
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷 브레이커가 열려 있어 호출을 거부함"""
+
+
+# =============================================================================
+# Token Bucket
+# =============================================================================
+class TokenBucket:
+    """비동기 토큰 버킷 (rate: 초당 보충 토큰 수, capacity: 최대 버스트)"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """
+        토큰 amount개 획득 (부족하면 대기), 대기한 시간(초) 반환
+
+        amount가 capacity보다 크면 capacity만큼만 요구 (버스트 한도 초과 요청도 진행 가능)
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                delay = (amount - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self.tokens -= amount
+        return waited
+
+
+# =============================================================================
+# Circuit Breaker
+# =============================================================================
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커
+
+    closed → (연속 실패 failure_threshold회) → open → (reset_timeout 경과) → half-open
+    half-open에서 시험 호출 1회 성공 시 closed, 실패 시 다시 open
+    (시험 호출이 취소되면 판정 없이 release_trial() → 다음 호출이 다시 시험)
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "open":
+            raise CircuitOpenError("LLM 서킷 브레이커가 열려 있습니다.")
+        if state == "half-open":
+            if self._trial_in_flight:
+                raise CircuitOpenError("LLM 서킷 브레이커 시험 호출 진행 중입니다.")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """판정 없이 끝난 호출(취소 등) - half-open 시험 자리만 반환"""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            logger.warning(f"LLM 서킷 브레이커 open: 연속 실패 {self.failures}회")
+
+
+# =============================================================================
+# Gateway Metrics
+# =============================================================================
+class GatewayMetrics:
+    """대기열 깊이, 대기 시간, 지연 분포 등 처리량 튜닝용 지표"""
+
+    def __init__(self, window: int = 200):
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.rejected = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.latencies_ms: deque = deque(maxlen=window)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies_ms:
+            return None
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def to_dict(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "rejected": self.rejected,
+            "wait_avg_ms": round(self.wait_total_ms / self.requests, 3) if self.requests else 0.0,
+            "wait_max_ms": round(self.wait_max_ms, 3),
+            "latency_p50_ms": self.percentile(0.50),
+            "latency_p95_ms": self.percentile(0.95),
+        }
+
+
+# =============================================================================
+# LLM Gateway
+# =============================================================================
+class LLMGateway:
+    """
+    공유 비동기 LLM 게이트웨이
+
+    사용 예:
+        gateway = LLMGateway(AsyncOpenAI())
+        text = await gateway.chat([{"role": "user", "content": prompt}], model="gpt-4o-mini", tier=1)
+    """
+
+    def __init__(
+        self,
+        client=None,
+        max_concurrency: int = 8,
+        tier_limits: Optional[dict[int, tuple[float, int]]] = None,
+        max_retries: int = 2,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        hedge: bool = False,
+        hedge_min_samples: int = 20
+    ):
+        """
+        Args:
+            client: LLM 클라이언트 (OpenAI 호환, chat.completions.create)
+            max_concurrency: 전역 동시 LLM 호출 수 상한
+            tier_limits: 등급별 (초당 요청 수, 버스트) - 기본 DEFAULT_TIER_LIMITS
+            max_retries: 실패 시 재시도 횟수
+            base_delay: 백오프 기본 지연 (초)
+            max_delay: 백오프 최대 지연 (초)
+            failure_threshold: 서킷 open까지 연속 실패 횟수
+            reset_timeout: 서킷 open 유지 시간 (초)
+            hedge: p95 지연 초과 시 두 번째 요청 발송 여부
+            hedge_min_samples: 헤지 기준(p95) 계산에 필요한 최소 표본 수
+        """
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        limits = tier_limits or DEFAULT_TIER_LIMITS
+        self._buckets = {tier: TokenBucket(rate, burst) for tier, (rate, burst) in limits.items()}
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.metrics = GatewayMetrics()
+
+    # -------------------------------------------------------------------------
+    # Admission (rate limit + concurrency)
+    # -------------------------------------------------------------------------
+    @asynccontextmanager
+    async def slot(self, tier: int = 1):
+        """
+        등급별 속도 제한 + 전역 동시성 슬롯 획득 (재시도 없음)
+
+        스트리밍 호출처럼 게이트웨이 재시도 로직을 쓰기 어려운 경우 직접 사용
+        """
+        bucket = self._buckets.get(tier) or self._buckets[min(self._buckets)]
+        started = time.perf_counter()
+        self.metrics.queue_depth += 1
+        try:
+            await bucket.acquire()
+            await self._semaphore.acquire()
+        finally:
+            self.metrics.queue_depth -= 1
+
+        wait_ms = (time.perf_counter() - started) * 1000
+        self.metrics.requests += 1
+        self.metrics.wait_total_ms += wait_ms
+        self.metrics.wait_max_ms = max(self.metrics.wait_max_ms, wait_ms)
+        self.metrics.in_flight += 1
+        try:
+            yield
+        finally:
+            self.metrics.in_flight -= 1
+            self._semaphore.release()
+
+    # -------------------------------------------------------------------------
+    # Calls
+    # -------------------------------------------------------------------------
+    async def chat(self, messages: list[dict], model: str, tier: int = 1, **kwargs) -> str:
+        """채팅 완성 호출, 응답 텍스트 반환"""
+        async def call():
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                **kwargs
+            )
+            return response.choices[0].message.content
+
+        return await self.run(call, tier=tier)
+
+    async def run(self, call: Callable[[], Awaitable[Any]], tier: int = 1) -> Any:
+        """
+        임의의 비동기 LLM 호출 실행 (속도 제한 + 동시성 + 재시도 + 서킷 브레이커)
+
+        Args:
+            call: 인자 없는 코루틴 함수 (재시도/헤지 시 여러 번 호출될 수 있음)
+            tier: 사용자 등급 (profiles.tier)
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                self.metrics.rejected += 1
+                raise
+
+            try:
+                result = await self._call_with_hedge(call, tier)
+                self.breaker.record_success()
+                return result
+
+            except asyncio.CancelledError:
+                # 주석(시니어 개발자): 클라이언트 연결 종료 / 헤지 패자 취소는 LLM 상태와 무관하므로
+                # 실패로 세지 않되, half-open 시험 자리는 반드시 반환 (안 하면 재시작 전까지 계속 open)
+                self.breaker.release_trial()
+                raise
+
+            except Exception as e:
+                self.metrics.failures += 1
+                self.breaker.record_failure()
+                logger.warning(f"LLM 호출 실패 (시도 {attempt + 1}): {e}")
+                if attempt == self.max_retries:
+                    raise
+                self.metrics.retries += 1
+                await asyncio.sleep(self._backoff_delay(attempt))
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """지수 백오프 + full jitter"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def _attempt(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        tier: int,
+        admitted: Optional[asyncio.Event] = None
+    ) -> Any:
+        """
+        슬롯 1개를 점유한 LLM 호출 1회 (지연 표본은 슬롯 획득 후 호출 시간만)
+
+        Args:
+            admitted: 슬롯을 얻은 시점에 set (헤지 대기 시간은 이때부터 계산)
+        """
+        async with self.slot(tier):
+            if admitted is not None:
+                admitted.set()
+            started = time.perf_counter()
+            result = await call()
+            self.metrics.latencies_ms.append((time.perf_counter() - started) * 1000)
+            return result
+
+    async def _call_with_hedge(self, call: Callable[[], Awaitable[Any]], tier: int = 1) -> Any:
+        """
+        p95 지연을 넘기면 두 번째 요청을 보내고 먼저 성공한 결과 사용
+
+        주석(시니어 개발자): 헤지 요청도 실제 LLM 호출 1건이므로 별도 슬롯(속도 제한 + 동시성)을 획득,
+        한 슬롯 안에서 두 요청을 보내면 동시성 상한이 지켜지지 않음
+        """
+        deadline_ms = None
+        if self.hedge and len(self.metrics.latencies_ms) >= self.hedge_min_samples:
+            deadline_ms = self.metrics.percentile(0.95)
+
+        if deadline_ms is None:
+            return await self._attempt(call, tier)
+
+        admitted = asyncio.Event()
+        primary = asyncio.ensure_future(self._attempt(call, tier, admitted))
+        pending = {primary}
+        error: Optional[BaseException] = None
+        try:
+            # 대기열에서 기다린 시간은 헤지 기준에서 제외 (포화 시 헤지가 부하를 키우지 않도록)
+            admission = asyncio.ensure_future(admitted.wait())
+            await asyncio.wait({primary, admission}, return_when=asyncio.FIRST_COMPLETED)
+            admission.cancel()
+
+            done, _ = await asyncio.wait({primary}, timeout=deadline_ms / 1000)
+            if done:
+                return primary.result()
+
+            self.metrics.hedges += 1
+            hedged = asyncio.ensure_future(self._attempt(call, tier))
+            pending = {primary, hedged}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedged:
+                            self.metrics.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            **self.metrics.to_dict(),
+            "max_concurrency": self.max_concurrency,
+            "circuit": self.breaker.state,
+        }
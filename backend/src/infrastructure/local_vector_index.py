@@ -0,0 +1,299 @@
+# =============================================================================
+# PRISM Writer Backend - Local Vector Index (NumPy, memory-mapped)
+# =============================================================================
+# 파일: backend/src/infrastructure/local_vector_index.py
+# 역할: 테넌트별 임베딩 행렬을 메모리 맵 파일로 보관하고 top-k 코사인 검색 제공
+# 용도: 소/중규모 테넌트의 저지연 검색, 테스트/CI용 오프라인 백엔드
+# =============================================================================
+
+from pathlib import Path
+from typing import Optional
+import json
+import logging
+import re
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Tenant Index
+# =============================================================================
+class _TenantIndex:
+    """
+    단일 테넌트의 벡터 행렬 + 청크 메타데이터
+
+    파일 구성:
+    - vectors.bin: L2 정규화된 임베딩 행렬 (row-major, dtype 고정)
+    - chunks.jsonl: 행 순서와 동일한 청크 메타데이터 (id, document_id, content, metadata)
+    """
+
+    def __init__(self, directory: Path, dim: int, dtype: np.dtype):
+        self.directory = directory
+        self.dim = dim
+        self.dtype = dtype
+        self.vectors_path = directory / "vectors.bin"
+        self.chunks_path = directory / "chunks.jsonl"
+        self.lock = threading.Lock()
+
+        self.chunks: list[dict] = []
+        self.doc_codes = np.empty(0, dtype=np.int32)  # 행별 문서 코드
+        self.doc_code_map: dict[str, int] = {}
+        self.row_of: dict[str, int] = {}  # chunk_id -> 행 번호
+        self.matrix: Optional[np.memmap] = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    # -------------------------------------------------------------------------
+    # Load / Append / Remove
+    # -------------------------------------------------------------------------
+    def _load(self) -> None:
+        if self.chunks_path.exists():
+            with self.chunks_path.open(encoding="utf-8") as f:
+                self.chunks = [json.loads(line) for line in f if line.strip()]
+        self.doc_codes = np.fromiter(
+            (self._doc_code(chunk["document_id"]) for chunk in self.chunks),
+            dtype=np.int32,
+            count=len(self.chunks)
+        )
+        self._remap()
+
+    def _remap(self) -> None:
+        """행 수에 맞게 메모리 맵 다시 열기"""
+        rows = len(self.chunks)
+        self.row_of = {chunk["id"]: i for i, chunk in enumerate(self.chunks)}
+        if rows == 0 or not self.vectors_path.exists():
+            self.matrix = None
+            return
+        self.matrix = np.memmap(self.vectors_path, dtype=self.dtype, mode="r", shape=(rows, self.dim))
+
+    def _doc_code(self, document_id: str) -> int:
+        code = self.doc_code_map.get(document_id)
+        if code is None:
+            code = len(self.doc_code_map)
+            self.doc_code_map[document_id] = code
+        return code
+
+    def append(self, chunks: list[dict], vectors: np.ndarray) -> None:
+        """정규화된 벡터와 메타데이터를 파일 끝에 추가 (기존 행 재작성 없음)"""
+        with self.lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self.vectors_path.open("ab") as f:
+                f.write(np.ascontiguousarray(vectors, dtype=self.dtype).tobytes())
+            with self.chunks_path.open("a", encoding="utf-8") as f:
+                for chunk in chunks:
+                    f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+
+            new_codes = np.fromiter(
+                (self._doc_code(chunk["document_id"]) for chunk in chunks),
+                dtype=np.int32,
+                count=len(chunks)
+            )
+            self.chunks.extend(chunks)
+            self.doc_codes = np.concatenate([self.doc_codes, new_codes])
+            self._remap()
+
+    def remove_documents(self, document_ids: set[str]) -> int:
+        """문서의 모든 행 삭제 (파일 압축 재작성), 삭제된 행 수 반환"""
+        with self.lock:
+            codes = [self.doc_code_map[d] for d in document_ids if d in self.doc_code_map]
+            if not codes or self.matrix is None:
+                return 0
+            keep = ~np.isin(self.doc_codes, codes)
+            removed = int((~keep).sum())
+            if removed == 0:
+                return 0
+
+            kept_vectors = np.array(self.matrix[keep])
+            kept_chunks = [chunk for chunk, k in zip(self.chunks, keep) if k]
+            self.matrix = None  # 메모리 맵 해제 후 재작성
+
+            tmp_vectors = self.vectors_path.with_suffix(".tmp")
+            tmp_vectors.write_bytes(kept_vectors.tobytes())
+            tmp_vectors.replace(self.vectors_path)
+            tmp_chunks = self.chunks_path.with_suffix(".tmp")
+            with tmp_chunks.open("w", encoding="utf-8") as f:
+                for chunk in kept_chunks:
+                    f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+            tmp_chunks.replace(self.chunks_path)
+
+            self.chunks = kept_chunks
+            self.doc_codes = self.doc_codes[keep]
+            self._remap()
+            return removed
+
+    def vectors(self, chunk_ids: list[str]) -> dict:
+        """청크 ID별 정규화 벡터 (float32)"""
+        matrix, row_of = self.matrix, self.row_of
+        if matrix is None:
+            return {}
+        found = [(chunk_id, row_of[chunk_id]) for chunk_id in chunk_ids if chunk_id in row_of]
+        if not found:
+            return {}
+        rows = np.asarray(matrix[[row for _, row in found]], dtype=np.float32)
+        return {chunk_id: rows[i] for i, (chunk_id, _) in enumerate(found)}
+
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+    def search(
+        self,
+        queries: np.ndarray,
+        doc_ids: Optional[list[str]],
+        top_k: int,
+        threshold: float
+    ) -> list[list[dict]]:
+        """
+        정규화된 쿼리 행렬 (q, dim)에 대해 쿼리별 top-k 코사인 검색
+
+        한 번의 행렬곱으로 (q, n) 유사도를 구한 뒤 argpartition으로 상위 k개만 정렬
+        """
+        matrix, doc_codes, chunks = self.matrix, self.doc_codes, self.chunks
+        if matrix is None or top_k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        scores = queries @ matrix.T.astype(np.float32, copy=False)  # (q, n)
+
+        if doc_ids:
+            allowed = [self.doc_code_map[d] for d in doc_ids if d in self.doc_code_map]
+            if not allowed:
+                return [[] for _ in range(len(queries))]
+            scores[:, ~np.isin(doc_codes, allowed)] = -np.inf
+
+        k = min(top_k, scores.shape[1])
+        results = []
+        for row in scores:
+            top = np.argpartition(-row, k - 1)[:k]
+            top = top[np.argsort(-row[top], kind="stable")]
+            hits = []
+            for idx in top:
+                similarity = float(row[idx])
+                if similarity < threshold:
+                    break
+                chunk = chunks[idx]
+                hits.append({
+                    "id": chunk["id"],
+                    "document_id": chunk["document_id"],
+                    "content": chunk.get("content", ""),
+                    "metadata": chunk.get("metadata") or {},
+                    "similarity": similarity,
+                })
+            results.append(hits)
+        return results
+
+
+# =============================================================================
+# Local Vector Index (ChunkRetriever backend)
+# =============================================================================
+class LocalVectorIndex:
+    """
+    ChunkRetriever용 로컬 벡터 검색 백엔드
+
+    - 테넌트(user_id)별로 디렉토리를 분리하여 행렬을 메모리 맵으로 보관
+    - 검색: NumPy 행렬곱 + argpartition (Python 루프 없이 유사도 계산)
+    - 수집(ingestion) 시 add_chunks()로 파일 끝에 증분 추가
+    """
+
+    DEFAULT_TENANT = "_shared"
+
+    def __init__(self, root_dir: str, dim: int = 1536, dtype: str = "float32"):
+        """
+        Args:
+            root_dir: 인덱스 파일 루트 디렉토리
+            dim: 임베딩 차원 (rag_chunks 기본 1536)
+            dtype: 저장 정밀도 ("float32": 검색 시 변환 없음, "float16": 디스크/메모리 절반)
+        """
+        if dtype not in ("float16", "float32"):
+            raise ValueError("dtype은 float16 또는 float32만 지원합니다.")
+        self.root_dir = Path(root_dir)
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        self._tenants: dict[str, _TenantIndex] = {}
+        self._lock = threading.Lock()
+
+    def _tenant(self, user_id: Optional[str]) -> _TenantIndex:
+        tenant_id = user_id or self.DEFAULT_TENANT
+        index = self._tenants.get(tenant_id)
+        if index is None:
+            with self._lock:
+                index = self._tenants.get(tenant_id)
+                if index is None:
+                    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", tenant_id)
+                    index = _TenantIndex(self.root_dir / safe_name, self.dim, self.dtype)
+                    self._tenants[tenant_id] = index
+        return index
+
+    def _normalize(self, vectors) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    # -------------------------------------------------------------------------
+    # Ingestion
+    # -------------------------------------------------------------------------
+    def add_chunks(self, user_id: Optional[str], chunks: list[dict]) -> int:
+        """
+        청크 증분 추가
+
+        Args:
+            user_id: 테넌트(사용자) ID
+            chunks: [{"id", "document_id", "content", "metadata", "embedding"}]
+
+        Returns:
+            추가된 청크 수
+        """
+        if not chunks:
+            return 0
+        vectors = self._normalize([chunk["embedding"] for chunk in chunks])
+        records = [
+            {
+                "id": chunk["id"],
+                "document_id": chunk["document_id"],
+                "content": chunk.get("content", ""),
+                "metadata": chunk.get("metadata") or {},
+            }
+            for chunk in chunks
+        ]
+        self._tenant(user_id).append(records, vectors)
+        logger.info(f"로컬 인덱스 추가: tenant={user_id}, chunks={len(records)}")
+        return len(records)
+
+    def remove_document(self, user_id: Optional[str], document_id: str) -> int:
+        """문서 재처리/삭제 시 해당 문서의 행 제거"""
+        return self._tenant(user_id).remove_documents({document_id})
+
+    def count(self, user_id: Optional[str] = None) -> int:
+        return len(self._tenant(user_id))
+
+    # -------------------------------------------------------------------------
+    # Search (ChunkRetriever backend interface)
+    # -------------------------------------------------------------------------
+    async def search(
+        self,
+        query_vector: list[float],
+        user_id: Optional[str],
+        doc_ids: Optional[list[str]],
+        top_k: int,
+        threshold: float
+    ) -> list[dict]:
+        return (await self.search_many([query_vector], user_id, doc_ids, top_k, threshold))[0]
+
+    async def search_many(
+        self,
+        query_vectors: list[list[float]],
+        user_id: Optional[str],
+        doc_ids: Optional[list[str]],
+        top_k: int,
+        threshold: float
+    ) -> list[list[dict]]:
+        queries = self._normalize(query_vectors)
+        return self._tenant(user_id).search(queries, doc_ids, top_k, threshold)
+
+    async def get_embeddings(self, chunk_ids: list[str], user_id: Optional[str] = None) -> dict:
+        """청크 임베딩 조회 (MMR 다양화용), {chunk_id: np.ndarray}"""
+        return self._tenant(user_id).vectors(chunk_ids)
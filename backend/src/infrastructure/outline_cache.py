@@ -0,0 +1,136 @@
+# =============================================================================
+# PRISM Writer Backend - Outline Result Cache
+# =============================================================================
+# 파일: backend/src/infrastructure/outline_cache.py
+# 역할: 목차 생성 결과의 내용 주소 기반(content-addressed) 캐시 + 동시 요청 병합
+# 키 구성: 정규화된 주제, 문서 ID 집합 + 문서 버전, max_depth, 프롬프트 템플릿 버전, 사용자 ID
+# =============================================================================
+
+from typing import Any, Awaitable, Callable, Iterable, Optional
+import hashlib
+import json
+import logging
+
+from src.infrastructure.cache import LRUCache, SingleFlight
+from src.infrastructure.retriever import normalize_query
+from src.infrastructure.supabase_utils import execute
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Document Version Lookup
+# =============================================================================
+class DocumentVersionLookup:
+    """
+    rag_documents의 버전 정보 조회 (캐시 키용)
+
+    version 컬럼과 updated_at을 함께 사용하여 재업로드/재처리 모두 감지
+    """
+
+    def __init__(self, supabase_client=None):
+        self.client = supabase_client
+
+    async def get_versions(self, doc_ids: list[str]) -> dict[str, str]:
+        if not doc_ids or self.client is None:
+            return {}
+        response = await execute(
+            self.client.table("rag_documents")
+            .select("id, version, updated_at")
+            .in_("id", list(doc_ids))
+        )
+        return {
+            row["id"]: f"{row.get('version')}:{row.get('updated_at')}"
+            for row in response.data or []
+        }
+
+
+# =============================================================================
+# Outline Result Cache
+# =============================================================================
+class OutlineResultCache:
+    """
+    목차 생성 결과 캐시
+
+    - 키에 문서 버전이 포함되므로 문서가 바뀌면 이전 항목은 자동으로 조회되지 않음
+    - invalidate_document()로 해당 문서를 참조한 항목을 즉시 제거 (메모리 회수)
+    - 같은 키로 동시에 들어온 요청은 SingleFlight로 LLM 호출 1회만 수행
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: Optional[float] = 60 * 60):
+        """
+        Args:
+            max_size: 최대 캐시 항목 수 (LRU 축출)
+            ttl_seconds: 항목 TTL (초)
+        """
+        self.cache = LRUCache(max_size, ttl_seconds)
+        self.single_flight = SingleFlight()
+
+    @staticmethod
+    def make_key(
+        topic: str,
+        doc_ids: Optional[Iterable[str]],
+        doc_versions: Optional[dict[str, str]],
+        max_depth: int,
+        prompt_version: str,
+        user_id: Optional[str] = None
+    ) -> str:
+        """
+        정규화된 입력의 SHA-256 해시 (내용 주소)
+
+        주석(시니어 개발자): 참고 문서는 소유자에게만 조회되므로 같은 doc_ids라도
+        사용자별로 결과가 다를 수 있음 → 사용자 ID를 키에 포함 (다른 사용자에게 결과 노출 방지)
+        """
+        doc_versions = doc_versions or {}
+        payload = {
+            "topic": normalize_query(topic),
+            "docs": [[doc_id, doc_versions.get(doc_id)] for doc_id in sorted(set(doc_ids or ()))],
+            "max_depth": max_depth,
+            "prompt": prompt_version,
+            "user": user_id,
+        }
+        encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        doc_ids: Optional[Iterable[str]] = None,
+        should_cache: Callable[[Any], bool] = bool
+    ) -> Any:
+        """
+        캐시 조회, 없으면 compute() 실행 후 저장 (동시 동일 요청은 1회만 실행)
+
+        compute()의 결과는 공유되므로 불변 값(tuple 등)을 반환해야 함
+
+        Args:
+            should_cache: 결과 저장 여부 (기본: 비어 있지 않을 때만)
+                          주석(시니어 개발자): 파싱 실패 등으로 빈 목차가 나오면 TTL 내내 같은 빈 결과가
+                          재사용되어 재시도가 소용없어짐 → 동시 요청 병합만 하고 저장하지 않음
+        """
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        async def run():
+            value = await compute()
+            if should_cache(value):
+                self.cache.set(key, value, tags=[("doc", doc_id) for doc_id in doc_ids or ()])
+            return value
+
+        return await self.single_flight.do(key, run)
+
+    def invalidate_document(self, document_id: str) -> int:
+        """문서 변경 시 해당 문서를 참조한 목차 캐시 제거"""
+        removed = self.cache.invalidate_tag(("doc", document_id))
+        logger.info(f"목차 캐시 무효화: doc={document_id}, removed={removed}")
+        return removed
+
+    def stats(self) -> dict:
+        return {
+            **self.cache.stats.to_dict(),
+            "size": len(self.cache),
+            "inflight": self.single_flight.inflight,
+            "coalesced": self.single_flight.coalesced,
+        }
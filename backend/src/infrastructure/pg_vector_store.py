@@ -0,0 +1,342 @@
+# =============================================================================
+# PRISM Writer Backend - asyncpg Vector Store
+# =============================================================================
+# 파일: backend/src/infrastructure/pg_vector_store.py
+# 역할: PostgREST(HTTP) 대신 asyncpg 커넥션 풀로 pgvector 직접 검색
+# 특징:
+#   - 애플리케이션 수명 동안 유지되는 커넥션 풀 (main.py startup/shutdown)
+#   - vector(1536) 파라미터 바이너리 인코딩 (JSON 텍스트 변환 없음)
+#   - 쿼리별 hnsw.ef_search 조정, 풀 포화도 지표
+# 주의: 직접 연결은 RLS를 우회하므로 모든 쿼리에 user_id 조건 필수
+#       pgbouncer transaction 모드에서는 prepared statement 캐시가 동작하지 않으므로
+#       Supabase 직접 연결(5432) 또는 session 모드 사용
+# =============================================================================
+
+from typing import Optional
+import json
+import logging
+import struct
+import time
+
+import asyncpg
+
+from src.infrastructure.heading_index import HeadingIndex
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# SQL (asyncpg가 커넥션별로 prepared statement로 캐시)
+# =============================================================================
+SIMILARITY_SQL = """
+SELECT
+    c.id::text AS chunk_id,
+    c.document_id::text AS document_id,
+    c.content,
+    1 - (c.embedding <=> $1::vector(1536)) AS similarity,
+    c.metadata
+FROM public.rag_chunks c
+INNER JOIN public.rag_documents d ON c.document_id = d.id
+WHERE d.user_id = $2::uuid
+  AND ($3::uuid[] IS NULL OR c.document_id = ANY($3::uuid[]))
+ORDER BY c.embedding <=> $1::vector(1536)
+LIMIT $4
+"""
+
+SIMILARITY_MANY_SQL = """
+SELECT
+    query_index,
+    chunk_id::text AS chunk_id,
+    document_id::text AS document_id,
+    content,
+    similarity,
+    metadata
+FROM public.search_similar_chunks_many($1::vector(1536)[], $2::uuid, $3, $4::uuid[], $5)
+"""
+
+# vector_send(): pgvector 바이너리 표현 (uint16 dim, uint16 unused, float4[dim] big-endian)
+EMBEDDINGS_SQL = """
+SELECT c.id::text AS chunk_id, vector_send(c.embedding) AS data
+FROM public.rag_chunks c
+INNER JOIN public.rag_documents d ON c.document_id = d.id
+WHERE c.id = ANY($1::uuid[])
+  AND d.user_id = $2::uuid
+  AND c.embedding IS NOT NULL
+"""
+
+HEADINGS_SQL = """
+SELECT
+    h.document_id::text AS document_id,
+    h.chunk_id::text AS chunk_id,
+    h.title,
+    h.level,
+    h.position,
+    h.parent_position
+FROM public.rag_document_headings h
+INNER JOIN public.rag_documents d ON h.document_id = d.id
+WHERE h.document_id = ANY($1::uuid[])
+  AND d.user_id = $2::uuid
+ORDER BY h.document_id, h.position
+"""
+
+SET_EF_SEARCH_SQL = "SELECT set_config('hnsw.ef_search', $1, true)"
+
+
+# =============================================================================
+# pgvector Binary Codec
+# =============================================================================
+def encode_vector(vector) -> bytes:
+    """pgvector 바이너리 포맷: int16 dim, int16 unused, float32 * dim (big-endian)"""
+    values = list(vector)
+    return struct.pack(f">HH{len(values)}f", len(values), 0, *values)
+
+
+def decode_vector(data: bytes) -> list[float]:
+    dim, _ = struct.unpack_from(">HH", data)
+    return list(struct.unpack_from(f">{dim}f", data, 4))
+
+
+async def _init_connection(conn) -> None:
+    """풀의 새 커넥션마다 vector/jsonb 코덱 등록"""
+    await conn.set_type_codec(
+        "vector", schema="public", encoder=encode_vector, decoder=decode_vector, format="binary"
+    )
+    await conn.set_type_codec(
+        "jsonb", schema="pg_catalog", encoder=json.dumps, decoder=json.loads, format="text"
+    )
+
+
+async def create_pg_pool(
+    dsn: str,
+    min_size: int = 2,
+    max_size: int = 10,
+    statement_cache_size: int = 256
+):
+    """
+    애플리케이션 수명용 asyncpg 커넥션 풀 생성
+
+    Args:
+        dsn: PostgreSQL 접속 문자열 (DATABASE_URL)
+        min_size: 최소 커넥션 수
+        max_size: 최대 커넥션 수
+        statement_cache_size: 커넥션별 prepared statement 캐시 크기
+    """
+    pool = await asyncpg.create_pool(
+        dsn,
+        min_size=min_size,
+        max_size=max_size,
+        statement_cache_size=statement_cache_size,
+        init=_init_connection
+    )
+    logger.info(f"PostgreSQL 커넥션 풀 생성: min={min_size}, max={max_size}")
+    return pool
+
+
+# =============================================================================
+# Pool Metrics
+# =============================================================================
+class PoolMetrics:
+    """커넥션 풀 포화도 지표 (acquire 대기 시간, 사용 중 커넥션 수)"""
+
+    def __init__(self):
+        self.acquire_count = 0
+        self.acquire_wait_total_ms = 0.0
+        self.acquire_wait_max_ms = 0.0
+        self.in_use = 0
+
+    def record_acquire(self, wait_ms: float) -> None:
+        self.acquire_count += 1
+        self.acquire_wait_total_ms += wait_ms
+        self.acquire_wait_max_ms = max(self.acquire_wait_max_ms, wait_ms)
+
+    def to_dict(self, pool=None) -> dict:
+        result = {
+            "acquire_count": self.acquire_count,
+            "acquire_wait_avg_ms": round(self.acquire_wait_total_ms / self.acquire_count, 3)
+            if self.acquire_count else 0.0,
+            "acquire_wait_max_ms": round(self.acquire_wait_max_ms, 3),
+            "in_use": self.in_use,
+        }
+        if pool is not None:
+            size, max_size = pool.get_size(), pool.get_max_size()
+            result.update({
+                "size": size,
+                "idle": pool.get_idle_size(),
+                "max_size": max_size,
+                "saturation": round(self.in_use / max_size, 3) if max_size else 0.0,
+            })
+        return result
+
+
+class _MeteredAcquire:
+    """pool.acquire() 래퍼: 대기 시간과 사용 중 커넥션 수 기록"""
+
+    def __init__(self, pool, metrics: PoolMetrics):
+        self.pool = pool
+        self.metrics = metrics
+        self.conn = None
+
+    async def __aenter__(self):
+        started = time.perf_counter()
+        self.conn = await self.pool.acquire()
+        self.metrics.record_acquire((time.perf_counter() - started) * 1000)
+        self.metrics.in_use += 1
+        return self.conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.metrics.in_use -= 1
+        await self.pool.release(self.conn)
+
+
+# =============================================================================
+# asyncpg Vector Store (ChunkRetriever backend)
+# =============================================================================
+class AsyncpgVectorStore:
+    """
+    ChunkRetriever용 asyncpg 검색 백엔드 (vector_store 인터페이스)
+    """
+
+    def __init__(self, pool, ef_search: Optional[int] = None):
+        """
+        Args:
+            pool: create_pg_pool()로 만든 커넥션 풀
+            ef_search: 기본 hnsw.ef_search (None이면 서버 기본값)
+        """
+        self.pool = pool
+        self.ef_search = ef_search
+        self.metrics = PoolMetrics()
+
+    def acquire(self) -> _MeteredAcquire:
+        return _MeteredAcquire(self.pool, self.metrics)
+
+    def pool_stats(self) -> dict:
+        return self.metrics.to_dict(self.pool)
+
+    def _ef_search_for(self, top_k: int, ef_search: Optional[int]) -> Optional[int]:
+        """ef_search는 최소 top_k 이상이어야 recall이 보장됨"""
+        ef = ef_search or self.ef_search
+        return max(ef, top_k) if ef else None
+
+    @staticmethod
+    async def _fetch(conn, ef: Optional[int], sql: str, *args) -> list:
+        """
+        쿼리 실행 (ef가 있을 때만 트랜잭션 + SET LOCAL hnsw.ef_search)
+
+        주석(시니어 개발자): set_config(..., true)는 트랜잭션 범위라 트랜잭션이 필요하지만,
+        ef 미지정 시에는 BEGIN/COMMIT 왕복을 생략하고 단일 쿼리로 실행
+        """
+        if not ef:
+            return await conn.fetch(sql, *args)
+        async with conn.transaction():
+            await conn.execute(SET_EF_SEARCH_SQL, str(ef))
+            return await conn.fetch(sql, *args)
+
+    async def search(
+        self,
+        query_vector: list[float],
+        user_id: Optional[str],
+        doc_ids: Optional[list[str]],
+        top_k: int,
+        threshold: float,
+        ef_search: Optional[int] = None
+    ) -> list[dict]:
+        ef = self._ef_search_for(top_k, ef_search)
+        async with self.acquire() as conn:
+            rows = await self._fetch(conn, ef, SIMILARITY_SQL, query_vector, user_id, doc_ids or None, top_k)
+
+        return [self._row_to_chunk(row) for row in rows if row["similarity"] >= threshold]
+
+    async def search_many(
+        self,
+        query_vectors: list[list[float]],
+        user_id: Optional[str],
+        doc_ids: Optional[list[str]],
+        top_k: int,
+        threshold: float,
+        ef_search: Optional[int] = None
+    ) -> list[list[dict]]:
+        ef = self._ef_search_for(top_k, ef_search)
+        async with self.acquire() as conn:
+            rows = await self._fetch(
+                conn, ef, SIMILARITY_MANY_SQL, query_vectors, user_id, top_k, doc_ids or None, threshold
+            )
+
+        grouped: list[list[dict]] = [[] for _ in query_vectors]
+        for row in rows:
+            grouped[row["query_index"]].append(self._row_to_chunk(row))
+        return grouped
+
+    async def get_embeddings(self, chunk_ids: list[str], user_id: Optional[str] = None) -> dict:
+        """
+        청크 임베딩 조회 (MMR 다양화용)
+
+        vector 코덱(list 변환)을 거치지 않도록 vector_send()의 바이너리를 그대로 받아
+        NumPy 배열로 해석
+
+        Args:
+            chunk_ids: 청크 ID 리스트
+            user_id: 문서 소유자 ID (다른 사용자 청크는 제외, None이면 빈 결과)
+
+        Returns:
+            {chunk_id: np.ndarray(float32)}
+        """
+        import numpy as np
+
+        if not chunk_ids:
+            return {}
+        async with self.acquire() as conn:
+            rows = await conn.fetch(EMBEDDINGS_SQL, chunk_ids, user_id)
+        return {
+            row["chunk_id"]: np.frombuffer(row["data"], dtype=">f4", offset=4).astype(np.float32)
+            for row in rows
+        }
+
+    @staticmethod
+    def _row_to_chunk(row) -> dict:
+        return {
+            "id": row["chunk_id"],
+            "document_id": row["document_id"],
+            "content": row["content"],
+            "metadata": row["metadata"] or {},
+            "similarity": float(row["similarity"]),
+        }
+
+
+# =============================================================================
+# asyncpg Heading Index
+# =============================================================================
+class AsyncpgHeadingIndex(HeadingIndex):
+    """헤딩 인덱스의 구조 조회를 asyncpg prepared statement로 처리"""
+
+    def __init__(self, store: AsyncpgVectorStore):
+        super().__init__(supabase_client=None)
+        self.store = store
+
+    async def save_document_headings(self, document_id: str, entries: list[dict]) -> int:
+        async with self.store.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    "DELETE FROM public.rag_document_headings WHERE document_id = $1::uuid",
+                    document_id
+                )
+                await conn.executemany(
+                    """
+                    INSERT INTO public.rag_document_headings
+                        (document_id, chunk_id, title, level, position, parent_position)
+                    VALUES ($1::uuid, $2::uuid, $3, $4, $5, $6)
+                    """,
+                    [
+                        (e["document_id"], e["chunk_id"], e["title"], e["level"],
+                         e["position"], e["parent_position"])
+                        for e in entries
+                    ]
+                )
+        return len(entries)
+
+    async def get_headings(self, doc_ids: list[str], user_id: Optional[str] = None) -> list[dict]:
+        """user_id 소유 문서의 헤딩만 조회 (RLS 우회 연결이므로 None이면 빈 결과)"""
+        if not doc_ids or user_id is None:
+            return []
+        async with self.store.acquire() as conn:
+            rows = await conn.fetch(HEADINGS_SQL, list(doc_ids), user_id)
+        return [dict(row) for row in rows]
@@ -5,19 +5,19 @@
 # 역할: 목차 생성을 위한 LLM 프롬프트 템플릿
 # =============================================================================
 
+import hashlib
+
 # =============================================================================
 # Main Outline Generation Prompt
 # =============================================================================
-OUTLINE_GENERATION_PROMPT = """당신은 문서 작성 전문가입니다.
-아래 참고 자료의 구조를 분석하여, 주어진 주제에 맞는 논리적인 목차를 생성하세요.
-
-## 입력 정보
-- 주제: {topic}
-- 참고 자료:
-{context}
+# 주석(시니어 개발자): 고정 지시문을 앞(system), 요청마다 바뀌는 입력을 뒤(user)에 배치
+# → 모든 요청의 프롬프트 앞부분이 동일하여 LLM 제공자의 prompt prefix 캐시가 적용됨
+# 고정 부분에는 {placeholder}를 넣지 말 것 (format() 대상 아님)
+OUTLINE_SYSTEM_PROMPT = """당신은 문서 작성 전문가입니다.
+사용자가 제공한 참고 자료의 구조를 분석하여, 주어진 주제에 맞는 논리적인 목차를 생성하세요.
 
 ## 출력 규칙
-1. 목차는 최대 {max_depth}단계까지만 생성하세요.
+1. 목차는 입력 정보의 최대 깊이까지만 생성하세요.
 2. 각 항목은 명확하고 구체적인 제목으로 작성하세요.
 3. 논리적 흐름(서론-본론-결론)을 유지하세요.
 4. 항목 수는 7~15개 사이로 유지하세요.
@@ -25,14 +25,38 @@ OUTLINE_GENERATION_PROMPT = """당신은 문서 작성 전문가입니다.
 ## 출력 형식 (JSON)
 반드시 아래 형식의 JSON 배열로만 응답하세요:
 [
-  {{"title": "서론", "depth": 1}},
-  {{"title": "배경 및 목적", "depth": 2}},
+  {"title": "서론", "depth": 1},
+  {"title": "배경 및 목적", "depth": 2},
   ...
 ]
 
 JSON 배열만 출력하고, 다른 설명은 포함하지 마세요.
 """
 
+OUTLINE_INPUT_PROMPT = """## 입력 정보
+- 주제: {topic}
+- 최대 깊이: {max_depth}단계
+- 참고 자료:
+{context}
+"""
+
+# 단일 메시지로 보내야 하는 경우용 (고정 부분이 앞)
+OUTLINE_GENERATION_PROMPT = (
+    OUTLINE_SYSTEM_PROMPT.replace("{", "{{").replace("}", "}}") + "\n" + OUTLINE_INPUT_PROMPT
+)
+
+
+def build_outline_messages(topic: str, context: str, max_depth: int) -> list[dict]:
+    """목차 생성 chat 메시지 (system: 고정 지시문, user: 요청별 입력)"""
+    return [
+        {"role": "system", "content": OUTLINE_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": OUTLINE_INPUT_PROMPT.format(topic=topic, context=context, max_depth=max_depth),
+        },
+    ]
+
+
 # =============================================================================
 # Context-aware Outline Prompt (with references)
 # =============================================================================
@@ -66,3 +90,11 @@ OUTLINE_SIMPLE_PROMPT = """주제: {topic}
 출력 형식 (JSON 배열만):
 [{{"title": "...", "depth": 1}}, ...]
 """
+
+# =============================================================================
+# Prompt Template Version
+# =============================================================================
+# 목차 결과 캐시 키에 포함: 프롬프트를 수정하면 이전 캐시 항목은 자동으로 무효
+PROMPT_TEMPLATE_VERSION = hashlib.sha256(
+    OUTLINE_GENERATION_PROMPT.encode("utf-8")
+).hexdigest()[:16]
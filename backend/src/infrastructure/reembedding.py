@@ -0,0 +1,375 @@
+# =============================================================================
+# PRISM Writer Backend - Background Re-embedding
+# =============================================================================
+# 파일: backend/src/infrastructure/reembedding.py
+# 역할: 임베딩 모델 교체 시 rag_chunks 전체를 새 모델로 재임베딩하는 재개 가능한 작업
+# 특징:
+#   - 그림자 컬럼(embedding_next, migration 044)에 기록 → 검색은 전환 전까지 이전 벡터 사용
+#   - id 기준 keyset 페이지네이션, 대상은 embedding_next_model_id가 목표 모델과 다른 행
+#   - 분당 토큰 예산(TokenBucket) 안에서 여러 배치 임베딩을 동시에 진행
+#   - 배치당 UPDATE ... FROM unnest() 1회 + 같은 트랜잭션에서 체크포인트 저장
+#   - 진행률/처리량(rows/s, tokens/s, ETA)을 로그와 job_checkpoints.state에 기록
+# 실행:
+#   DATABASE_URL=... OPENAI_API_KEY=... python -m src.infrastructure.reembedding \
+#       --model text-embedding-3-large --dimensions 1536 --tokens-per-minute 1000000
+#   완료 후: python -m src.infrastructure.reembedding --model text-embedding-3-large --cutover
+# 주의: 재임베딩 중 새로 수집된 청크는 이전 모델로 embedding에만 기록되므로
+#       패스 종료 후 남은 행을 다시 훑어 처리 (cutover_embedding_next()도 남은 행이 있으면 거부)
+# =============================================================================
+
+from collections import deque
+from typing import Optional
+import argparse
+import asyncio
+import hashlib
+import logging
+import os
+import time
+
+from src.infrastructure.job_checkpoints import JobCheckpointStore
+from src.infrastructure.llm_gateway import TokenBucket
+from src.infrastructure.tokenizer import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# rag_chunks.embedding_next 컬럼 차원 (migration 044)
+SHADOW_EMBEDDING_DIM = 1536
+
+DEFAULT_REEMBED_BATCH_SIZE = 512
+
+# 패스 종료 후 남은 행(작업 중 새로 수집된 청크 등)을 다시 훑는 최대 횟수
+MAX_SWEEP_PASSES = 3
+
+STALE_CONDITION = "(embedding_next IS NULL OR embedding_next_model_id IS DISTINCT FROM $1)"
+
+SELECT_STALE_SQL = f"""
+SELECT id, content
+FROM public.rag_chunks
+WHERE {STALE_CONDITION}
+  AND ($2::uuid IS NULL OR id > $2::uuid)
+ORDER BY id
+LIMIT $3
+"""
+
+COUNT_STALE_SQL = f"SELECT COUNT(*) FROM public.rag_chunks WHERE {STALE_CONDITION}"
+
+# 주석(시니어 개발자): 조회 이후 내용이 바뀐 청크는 md5 불일치로 건너뜀 (다음 패스에서 재처리)
+UPDATE_BATCH_SQL = """
+UPDATE public.rag_chunks c
+SET embedding_next = v.embedding,
+    embedding_next_model_id = $4,
+    embedding_next_at = NOW()
+FROM unnest($1::uuid[], $2::vector(1536)[], $3::text[]) AS v(id, embedding, content_md5)
+WHERE c.id = v.id
+  AND md5(c.content) = v.content_md5
+"""
+
+CREATE_INDEX_SQL = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rag_chunks_embedding_next_hnsw
+ON public.rag_chunks USING hnsw (embedding_next vector_cosine_ops)
+WITH (m = 16, ef_construction = 64)
+"""
+
+CUTOVER_SQL = "SELECT public.cutover_embedding_next($1)"
+
+LOCK_TIMEOUT_SQL = "SET LOCAL lock_timeout = '2s'"
+
+
+def job_name_for(model_id: str) -> str:
+    """목표 모델별 체크포인트 이름 (모델을 바꾸면 처음부터 진행)"""
+    return f"reembed:{model_id}"
+
+
+class ReembeddingWorker:
+    """
+    재임베딩 작업
+
+    조회(짧은 커넥션) → 임베딩(동시 진행, 토큰 예산) → 쓰기(조회 순서대로) 파이프라인
+    체크포인트는 쓰기가 끝난 배치까지만 전진하므로 중단 시 진행 중 배치는 재조회됨
+    """
+
+    def __init__(
+        self,
+        pool,
+        embedder,
+        batch_size: int = DEFAULT_REEMBED_BATCH_SIZE,
+        tokens_per_minute: Optional[float] = None,
+        checkpoints: Optional[JobCheckpointStore] = None,
+        dim: int = SHADOW_EMBEDDING_DIM
+    ):
+        """
+        Args:
+            pool: asyncpg 커넥션 풀 (create_pg_pool, vector 코덱 필요)
+            embedder: BatchEmbedder (model_id가 목표 모델)
+            batch_size: 배치당 조회/쓰기 행 수
+            tokens_per_minute: 분당 임베딩 입력 토큰 상한 (None이면 제한 없음)
+            checkpoints: 체크포인트 저장소 (기본: JobCheckpointStore(pool))
+            dim: 그림자 컬럼 차원 (임베딩 결과 검증용)
+        """
+        self.pool = pool
+        self.embedder = embedder
+        self.model_id = embedder.model_id
+        self.job_name = job_name_for(self.model_id)
+        self.batch_size = batch_size
+        self.dim = dim
+        self.checkpoints = checkpoints or JobCheckpointStore(pool)
+        # 1분 분량까지 버스트 허용
+        self.budget = (
+            TokenBucket(tokens_per_minute / 60.0, int(tokens_per_minute))
+            if tokens_per_minute else None
+        )
+        # 동시에 진행하는 임베딩 배치 수 (embedder 내부 동시성 제한과 맞춤)
+        self.window = max(1, getattr(embedder, "max_concurrency", 1))
+
+        self._stop = asyncio.Event()
+        self._reset_progress(total=0)
+
+    # =========================================================================
+    # Progress
+    # =========================================================================
+    def _reset_progress(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+        self.updated = 0
+        self.tokens = 0
+        self.started_at = time.monotonic()
+
+    def progress(self) -> dict:
+        """진행률/처리량 (다른 태스크에서 주기적으로 조회 가능)"""
+        elapsed = time.monotonic() - self.started_at
+        rows_per_second = self.done / elapsed if elapsed > 0 else 0.0
+        remaining = max(self.total - self.done, 0)
+        return {
+            "model_id": self.model_id,
+            "total": self.total,
+            "done": self.done,
+            "updated": self.updated,
+            "remaining": remaining,
+            "percent": round(100.0 * self.done / self.total, 2) if self.total else 100.0,
+            "rows_per_second": round(rows_per_second, 1),
+            "tokens_per_second": round(self.tokens / elapsed, 1) if elapsed > 0 else 0.0,
+            "eta_seconds": round(remaining / rows_per_second) if rows_per_second > 0 else None,
+        }
+
+    def stop(self) -> None:
+        """현재 진행 중인 배치 쓰기까지 마치고 종료 (체크포인트 유지)"""
+        self._stop.set()
+
+    # =========================================================================
+    # Run
+    # =========================================================================
+    async def count_stale(self) -> int:
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(COUNT_STALE_SQL, self.model_id)
+
+    async def run(self, restart: bool = False, max_batches: Optional[int] = None) -> dict:
+        """
+        재임베딩 실행 (이전 체크포인트부터 재개)
+
+        Args:
+            restart: True면 체크포인트를 지우고 처음부터 (이미 목표 모델인 행은 어차피 건너뜀)
+            max_batches: 이번 실행에서 쓸 최대 배치 수 (None이면 끝까지)
+
+        Returns:
+            progress() + {"batches", "last_id", "completed"}
+        """
+        if restart:
+            await self.checkpoints.reset(self.job_name)
+        checkpoint = await self.checkpoints.load(self.job_name)
+        last_id = checkpoint["last_key"] if checkpoint else None
+
+        self._reset_progress(total=await self.count_stale())
+        logger.info(f"재임베딩 시작: model={self.model_id}, 대상={self.total}, last_id={last_id}")
+
+        batches = 0
+        completed = False
+        for _ in range(MAX_SWEEP_PASSES):
+            last_id, written, exhausted = await self._run_pass(
+                last_id, None if max_batches is None else max_batches - batches
+            )
+            batches += written
+            if not exhausted or self._stop.is_set():
+                break
+
+            # 패스 종료: 작업 중 추가/변경된 청크가 없으면 완료
+            remaining = await self.count_stale()
+            if remaining == 0:
+                completed = True
+                break
+            logger.info(f"재임베딩 패스 종료, 남은 청크 {remaining}개 - 처음부터 다시 훑음")
+            self.total = self.done + remaining
+            last_id = None
+
+        if completed:
+            await self.checkpoints.complete(self.job_name)
+
+        result = {**self.progress(), "batches": batches, "last_id": last_id, "completed": completed}
+        logger.info(f"재임베딩 종료: {result}")
+        return result
+
+    async def _run_pass(
+        self,
+        last_id: Optional[str],
+        max_batches: Optional[int]
+    ) -> tuple[Optional[str], int, bool]:
+        """
+        keyset 한 바퀴 처리
+
+        Returns:
+            (마지막으로 쓴 id, 쓴 배치 수, 끝까지 조회했는지)
+        """
+        pending: deque = deque()
+        cursor = last_id
+        written = 0
+        exhausted = False
+
+        try:
+            while True:
+                can_fetch = (
+                    not exhausted
+                    and not self._stop.is_set()
+                    and (max_batches is None or written + len(pending) < max_batches)
+                )
+                if can_fetch and len(pending) < self.window:
+                    rows = await self._fetch(cursor)
+                    if rows:
+                        cursor = str(rows[-1]["id"])
+                        pending.append((rows, await self._start_embedding(rows)))
+                    if len(rows) < self.batch_size:
+                        exhausted = True
+                    continue
+
+                if not pending:
+                    break
+
+                # 조회 순서대로 쓰기 → 체크포인트가 연속 구간만 가리킴
+                rows, task = pending.popleft()
+                vectors = await task
+                await self._write(rows, vectors)
+                last_id = str(rows[-1]["id"])
+                written += 1
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+        # 상한/중단으로 멈춘 경우 미처리 배치가 남아 있을 수 있음
+        return last_id, written, exhausted and cursor == last_id
+
+    async def _fetch(self, last_id: Optional[str]) -> list:
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(SELECT_STALE_SQL, self.model_id, last_id, self.batch_size)
+
+    async def _start_embedding(self, rows: list) -> asyncio.Task:
+        """토큰 예산 확보 후 임베딩 태스크 시작 (예산 대기는 조회 루프에서 발생)"""
+        texts = [row["content"] for row in rows]
+        tokens = sum(count_tokens(text) for text in texts)
+        if self.budget is not None:
+            await self.budget.acquire(tokens)
+        self.tokens += tokens
+        return asyncio.create_task(self.embedder.embed(texts))
+
+    async def _write(self, rows: list, vectors: list[list[float]]) -> None:
+        if len(vectors) != len(rows):
+            raise ValueError(f"임베딩 결과 수 불일치: {len(vectors)} != {len(rows)}")
+        for vector in vectors:
+            if len(vector) != self.dim:
+                raise ValueError(
+                    f"임베딩 차원 불일치: {self.model_id}={len(vector)}, embedding_next={self.dim} "
+                    f"(--dimensions 지정 또는 embedding_next 컬럼 타입 변경 필요)"
+                )
+
+        ids = [row["id"] for row in rows]
+        digests = [hashlib.md5(row["content"].encode("utf-8")).hexdigest() for row in rows]
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(LOCK_TIMEOUT_SQL)
+                status = await conn.execute(UPDATE_BATCH_SQL, ids, vectors, digests, self.model_id)
+                updated = _affected_rows(status)
+                self.done += len(rows)
+                self.updated += updated
+                await JobCheckpointStore.save(
+                    conn, self.job_name, str(ids[-1]), len(rows), updated, {"progress": self.progress()}
+                )
+
+        progress = self.progress()
+        logger.info(
+            f"재임베딩: {progress['done']}/{progress['total']} ({progress['percent']}%), "
+            f"{progress['rows_per_second']} rows/s, {progress['tokens_per_second']} tokens/s, "
+            f"ETA {progress['eta_seconds']}s"
+        )
+
+    # =========================================================================
+    # Cutover
+    # =========================================================================
+    async def cutover(self, build_index: bool = True) -> int:
+        """
+        embedding_next 인덱스 생성 후 embedding ↔ embedding_next 전환
+
+        Returns:
+            전환된 청크 수
+        """
+        async with self.pool.acquire() as conn:
+            if build_index:
+                # CONCURRENTLY는 트랜잭션 밖에서 실행해야 함
+                await conn.execute(CREATE_INDEX_SQL)
+            count = await conn.fetchval(CUTOVER_SQL, self.model_id)
+        logger.info(f"임베딩 모델 전환 완료: model={self.model_id}, chunks={count}")
+        return count
+
+
+def _affected_rows(status: str) -> int:
+    """asyncpg execute() 상태 문자열 ('UPDATE 42')에서 행 수 추출"""
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (AttributeError, ValueError):
+        return 0
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+async def _main(args: argparse.Namespace) -> None:
+    from openai import AsyncOpenAI
+
+    from src.infrastructure.ingestion.embedder import BatchEmbedder
+    from src.infrastructure.pg_vector_store import create_pg_pool
+
+    pool = await create_pg_pool(args.dsn, min_size=1, max_size=args.concurrency + 1)
+    try:
+        embedder = BatchEmbedder(
+            AsyncOpenAI(),
+            model_id=args.model,
+            batch_size=args.embed_batch_size,
+            max_concurrency=args.concurrency,
+            dimensions=args.dimensions,
+        )
+        worker = ReembeddingWorker(
+            pool, embedder, batch_size=args.batch_size, tokens_per_minute=args.tokens_per_minute
+        )
+        if args.cutover:
+            await worker.cutover(build_index=not args.skip_index)
+        else:
+            await worker.run(restart=args.restart, max_batches=args.max_batches)
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="rag_chunks 재임베딩 (embedding_next 그림자 컬럼)")
+    parser.add_argument("--dsn", default=os.getenv("DATABASE_URL"), help="PostgreSQL 접속 문자열")
+    parser.add_argument("--model", required=True, help="목표 임베딩 모델 ID")
+    parser.add_argument("--dimensions", type=int, default=None, help="출력 차원 (text-embedding-3 계열)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_REEMBED_BATCH_SIZE)
+    parser.add_argument("--embed-batch-size", type=int, default=128, help="임베딩 요청당 입력 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 임베딩 요청 수")
+    parser.add_argument("--tokens-per-minute", type=float, default=None, help="분당 입력 토큰 상한")
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument("--restart", action="store_true", help="체크포인트 무시하고 처음부터")
+    parser.add_argument("--cutover", action="store_true", help="재임베딩 완료 후 인덱스 생성 + 전환")
+    parser.add_argument("--skip-index", action="store_true", help="전환 시 인덱스 생성 생략")
+    parsed = parser.parse_args()
+    if not parsed.dsn:
+        parser.error("--dsn 또는 DATABASE_URL이 필요합니다.")
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(parsed))
@@ -0,0 +1,409 @@
+# =============================================================================
+# PRISM Writer Backend - References Repository
+# =============================================================================
+# 파일: backend/src/infrastructure/references_repository.py
+# 역할: 글(draft) 참조 저장소 - 인메모리 구현 + Supabase(draft_references) 구현
+#       (+ 워커 간 공유용 SQLite 구현: sqlite_references.py)
+# 특징:
+#   - (chunk_id, paragraph_index) / 참조 ID 해시 인덱스 → 중복 체크·삭제 O(1)
+#   - 일괄 생성/삭제 (DB는 단일 multi-row INSERT / DELETE)
+#   - 문단 삽입/삭제 편집 시 paragraph_index 일괄 이동 (정렬 인덱스 / DB 범위 UPDATE)
+#   - (paragraph_index, id) 키셋 페이지 조회 (커서 페이지네이션)
+# =============================================================================
+
+from datetime import datetime
+from typing import Optional
+import bisect
+import logging
+import os
+import tempfile
+import uuid
+
+from src.infrastructure.supabase_utils import execute
+
+logger = logging.getLogger(__name__)
+
+REFERENCES_TABLE = "draft_references"
+
+
+# =============================================================================
+# Exceptions
+# =============================================================================
+class DuplicateReferenceError(Exception):
+    """같은 문단에 동일한 청크 참조가 이미 존재함"""
+
+    def __init__(self, conflicts: list[tuple[str, int]]):
+        self.conflicts = conflicts
+        super().__init__(f"중복 참조: {conflicts}")
+
+
+class DraftNotFoundError(Exception):
+    """참조가 한 번도 생성되지 않은 글"""
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+def _new_reference(draft_id: str, item: dict) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "draft_id": draft_id,
+        "chunk_id": item["chunk_id"],
+        "paragraph_index": item["paragraph_index"],
+        "reference_type": item.get("reference_type", "citation"),
+        "created_at": datetime.now(),
+    }
+
+
+def _find_batch_duplicates(items: list[dict]) -> list[tuple[str, int]]:
+    """요청 배치 내부의 (chunk_id, paragraph_index) 중복"""
+    seen, duplicates = set(), []
+    for item in items:
+        slot = (item["chunk_id"], item["paragraph_index"])
+        if slot in seen:
+            duplicates.append(slot)
+        seen.add(slot)
+    return duplicates
+
+
+# =============================================================================
+# In-memory Repository
+# =============================================================================
+class _DraftReferences:
+    """단일 글의 참조 + 해시 인덱스 + 문단 순서 인덱스"""
+
+    def __init__(self):
+        self.by_id: dict[str, dict] = {}                 # 참조 ID → 참조 (삽입 순서 유지)
+        self.by_slot: dict[tuple[str, int], str] = {}    # (chunk_id, paragraph_index) → 참조 ID
+        self.by_paragraph: list[tuple[int, str]] = []    # (paragraph_index, 참조 ID) 정렬 리스트
+        self.version = 0                                 # 변경될 때마다 증가 (응답 캐시/ETag 키)
+
+    def add(self, reference: dict) -> None:
+        self.by_id[reference["id"]] = reference
+        self.by_slot[(reference["chunk_id"], reference["paragraph_index"])] = reference["id"]
+        bisect.insort(self.by_paragraph, (reference["paragraph_index"], reference["id"]))
+
+    def remove(self, reference_id: str) -> bool:
+        reference = self.by_id.pop(reference_id, None)
+        if reference is None:
+            return False
+        del self.by_slot[(reference["chunk_id"], reference["paragraph_index"])]
+        key = (reference["paragraph_index"], reference_id)
+        del self.by_paragraph[bisect.bisect_left(self.by_paragraph, key)]
+        return True
+
+    def shift(self, start_index: int, delete_count: int, insert_count: int) -> tuple[int, int]:
+        """
+        문단 편집 반영: [start, start + delete_count) 참조 삭제, 이후 참조는 delta만큼 이동
+
+        이진 탐색으로 경계를 찾고 영향받는 참조만 갱신 (O(log n + 영향 범위)).
+        이동량이 모든 후속 참조에 동일하므로 정렬 순서는 그대로 유지됨.
+
+        Returns:
+            (삭제된 참조 수, 이동된 참조 수)
+        """
+        delta = insert_count - delete_count
+        lo = bisect.bisect_left(self.by_paragraph, (start_index,))
+        hi = bisect.bisect_left(self.by_paragraph, (start_index + delete_count,))
+
+        for _, reference_id in self.by_paragraph[lo:hi]:
+            reference = self.by_id.pop(reference_id)
+            del self.by_slot[(reference["chunk_id"], reference["paragraph_index"])]
+
+        tail = self.by_paragraph[hi:] if delta else []
+        for _, reference_id in tail:
+            reference = self.by_id[reference_id]
+            del self.by_slot[(reference["chunk_id"], reference["paragraph_index"])]
+            reference["paragraph_index"] += delta
+        for _, reference_id in tail:
+            reference = self.by_id[reference_id]
+            self.by_slot[(reference["chunk_id"], reference["paragraph_index"])] = reference_id
+
+        if delta:
+            self.by_paragraph[lo:] = [(index + delta, reference_id) for index, reference_id in tail]
+        else:
+            del self.by_paragraph[lo:hi]
+        return hi - lo, len(tail)
+
+
+class InMemoryReferencesRepository:
+    """
+    프로세스 메모리 참조 저장소 (개발/테스트용)
+    """
+
+    def __init__(self):
+        self._drafts: dict[str, _DraftReferences] = {}
+
+    async def list_for_draft(self, draft_id: str) -> list[dict]:
+        draft = self._drafts.get(draft_id)
+        return list(draft.by_id.values()) if draft else []
+
+    async def list_page(
+        self,
+        draft_id: str,
+        after: Optional[tuple[int, str]] = None,
+        limit: Optional[int] = None
+    ) -> list[dict]:
+        """
+        (paragraph_index, id) 순 키셋 페이지 조회
+
+        Args:
+            after: 이전 페이지 마지막 참조의 (paragraph_index, id) - None이면 처음부터
+            limit: 최대 개수 (None이면 전부)
+        """
+        draft = self._drafts.get(draft_id)
+        if draft is None:
+            return []
+        start = bisect.bisect_right(draft.by_paragraph, after) if after else 0
+        end = None if limit is None else start + limit
+        return [draft.by_id[reference_id] for _, reference_id in draft.by_paragraph[start:end]]
+
+    async def version(self, draft_id: str) -> Optional[str]:
+        """글 참조 목록 버전 (변경 시마다 바뀜, 응답 캐시 키)"""
+        draft = self._drafts.get(draft_id)
+        return str(draft.version) if draft else "0"
+
+    async def create(self, draft_id: str, item: dict) -> dict:
+        return (await self.create_many(draft_id, [item]))[0]
+
+    async def create_many(self, draft_id: str, items: list[dict]) -> list[dict]:
+        """
+        일괄 생성 (전부 성공 또는 전부 실패)
+
+        Raises:
+            DuplicateReferenceError: 기존 참조 또는 배치 내부와 중복
+        """
+        draft = self._drafts.setdefault(draft_id, _DraftReferences())
+        conflicts = _find_batch_duplicates(items) + [
+            (item["chunk_id"], item["paragraph_index"])
+            for item in items
+            if (item["chunk_id"], item["paragraph_index"]) in draft.by_slot
+        ]
+        if conflicts:
+            raise DuplicateReferenceError(conflicts)
+
+        created = [_new_reference(draft_id, item) for item in items]
+        for reference in created:
+            draft.add(reference)
+        draft.version += 1
+        return created
+
+    async def delete(self, draft_id: str, reference_id: str) -> bool:
+        """
+        Raises:
+            DraftNotFoundError: 글이 존재하지 않음
+        """
+        return (await self.delete_many(draft_id, [reference_id])) == 1
+
+    async def delete_many(self, draft_id: str, reference_ids: list[str]) -> int:
+        """일괄 삭제, 실제 삭제된 수 반환"""
+        draft = self._drafts.get(draft_id)
+        if draft is None:
+            raise DraftNotFoundError(draft_id)
+        deleted = sum(1 for reference_id in set(reference_ids) if draft.remove(reference_id))
+        if deleted:
+            draft.version += 1
+        return deleted
+
+    async def shift_paragraphs(
+        self,
+        draft_id: str,
+        start_index: int,
+        delete_count: int = 0,
+        insert_count: int = 0
+    ) -> dict:
+        """
+        문단 삽입/삭제 편집에 맞춰 참조 위치 일괄 이동
+
+        Returns:
+            {"deleted": 삭제된 참조 수, "shifted": 이동된 참조 수}
+        """
+        draft = self._drafts.get(draft_id)
+        if draft is None:
+            raise DraftNotFoundError(draft_id)
+        deleted, shifted = draft.shift(start_index, delete_count, insert_count)
+        if deleted or shifted:
+            draft.version += 1
+        return {"deleted": deleted, "shifted": shifted}
+
+
+# =============================================================================
+# Supabase Repository (draft_references)
+# =============================================================================
+class SupabaseReferencesRepository:
+    """
+    draft_references 테이블 기반 참조 저장소
+
+    중복 체크는 UNIQUE(draft_id, chunk_id, paragraph_index) 제약(migration 041, 042)에 위임
+    """
+
+    def __init__(self, supabase_client):
+        self.client = supabase_client
+
+    async def list_for_draft(self, draft_id: str) -> list[dict]:
+        response = await execute(
+            self.client.table(REFERENCES_TABLE)
+            .select("id, draft_id, chunk_id, paragraph_index, reference_type, created_at")
+            .eq("draft_id", draft_id)
+            .order("created_at")
+        )
+        return response.data or []
+
+    async def list_page(
+        self,
+        draft_id: str,
+        after: Optional[tuple[int, str]] = None,
+        limit: Optional[int] = None
+    ) -> list[dict]:
+        """(paragraph_index, id) 키셋 페이지 조회 (idx_draft_references_paragraph 사용, migration 042)"""
+        query = (
+            self.client.table(REFERENCES_TABLE)
+            .select("id, draft_id, chunk_id, paragraph_index, reference_type, created_at")
+            .eq("draft_id", draft_id)
+        )
+        if after is not None:
+            paragraph_index, reference_id = after
+            query = query.or_(
+                f"paragraph_index.gt.{paragraph_index},"
+                f"and(paragraph_index.eq.{paragraph_index},id.gt.{reference_id})"
+            )
+        query = query.order("paragraph_index").order("id")
+        if limit is not None:
+            query = query.limit(limit)
+        response = await execute(query)
+        return response.data or []
+
+    async def version(self, draft_id: str) -> Optional[str]:
+        """테이블에 버전 컬럼이 없으므로 None (응답 캐시 없이 본문 해시 ETag만 사용)"""
+        return None
+
+    async def create(self, draft_id: str, item: dict) -> dict:
+        return (await self.create_many(draft_id, [item]))[0]
+
+    async def create_many(self, draft_id: str, items: list[dict]) -> list[dict]:
+        """단일 multi-row INSERT (트랜잭션 단위로 전부 성공 또는 전부 실패)"""
+        duplicates = _find_batch_duplicates(items)
+        if duplicates:
+            raise DuplicateReferenceError(duplicates)
+
+        rows = [
+            {
+                "draft_id": draft_id,
+                "chunk_id": item["chunk_id"],
+                "paragraph_index": item["paragraph_index"],
+                "reference_type": item.get("reference_type", "citation"),
+            }
+            for item in items
+        ]
+        try:
+            response = await execute(self.client.table(REFERENCES_TABLE).insert(rows))
+        except Exception as e:
+            if getattr(e, "code", None) == "23505":  # unique_violation
+                raise DuplicateReferenceError(await self._existing_slots(draft_id, items) or [
+                    (item["chunk_id"], item["paragraph_index"]) for item in items
+                ]) from e
+            raise
+        return response.data or []
+
+    async def _existing_slots(self, draft_id: str, items: list[dict]) -> list[tuple[str, int]]:
+        """
+        배치 중 이미 저장된 (chunk_id, paragraph_index) (INSERT 실패 후에만 조회)
+
+        주석(시니어 개발자): 23505는 어느 행이 충돌했는지 알려주지 않으므로 키를 다시 조회해
+        실제 충돌만 보고 (다른 저장소와 같은 conflicts 의미). 그 사이 삭제되어 비면 호출부가 배치 전체로 대체
+        """
+        response = await execute(
+            self.client.table(REFERENCES_TABLE)
+            .select("chunk_id, paragraph_index")
+            .eq("draft_id", draft_id)
+            .in_("chunk_id", list({item["chunk_id"] for item in items}))
+        )
+        existing = {(row["chunk_id"], row["paragraph_index"]) for row in response.data or []}
+        return [
+            (item["chunk_id"], item["paragraph_index"])
+            for item in items
+            if (item["chunk_id"], item["paragraph_index"]) in existing
+        ]
+
+    async def delete(self, draft_id: str, reference_id: str) -> bool:
+        return (await self.delete_many(draft_id, [reference_id])) == 1
+
+    async def delete_many(self, draft_id: str, reference_ids: list[str]) -> int:
+        """단일 DELETE ... WHERE draft_id = ? AND id IN (...)"""
+        if not reference_ids:
+            return 0
+        response = await execute(
+            self.client.table(REFERENCES_TABLE)
+            .delete()
+            .eq("draft_id", draft_id)
+            .in_("id", list(set(reference_ids)))
+        )
+        return len(response.data or [])
+
+    async def shift_paragraphs(
+        self,
+        draft_id: str,
+        start_index: int,
+        delete_count: int = 0,
+        insert_count: int = 0
+    ) -> dict:
+        """shift_draft_paragraphs RPC (migration 042) - 단일 트랜잭션 범위 DELETE + UPDATE"""
+        response = await execute(
+            self.client.rpc(
+                "shift_draft_paragraphs",
+                {
+                    "draft_id_param": draft_id,
+                    "start_index": start_index,
+                    "delete_count": delete_count,
+                    "insert_count": insert_count,
+                }
+            )
+        )
+        row = (response.data or [{}])[0]
+        return {"deleted": row.get("deleted_count", 0), "shifted": row.get("shifted_count", 0)}
+
+
+# =============================================================================
+# Factory
+# =============================================================================
+REFERENCES_BACKENDS = ("sqlite", "memory", "supabase")
+
+
+def create_references_repository(
+    backend: Optional[str] = None,
+    sqlite_path: Optional[str] = None,
+    supabase_client=None
+):
+    """
+    설정에 맞는 참조 저장소 생성
+
+    Args:
+        backend: "sqlite" (기본, 노드 내 워커 간 공유) / "memory" (단일 프로세스) / "supabase"
+                 None이면 REFERENCES_BACKEND 환경 변수
+        sqlite_path: SQLite 파일 경로 (None이면 REFERENCES_SQLITE_PATH 또는 임시 디렉토리)
+        supabase_client: backend="supabase"일 때 사용할 클라이언트
+
+    주의:
+        임시 디렉토리 기본값은 컨테이너 재시작/재배포 시 사라짐 (참조 데이터 유실)
+        → 운영에서는 REFERENCES_SQLITE_PATH를 영속 볼륨 경로로 지정하거나 supabase 백엔드 사용
+    """
+    backend = backend or os.getenv("REFERENCES_BACKEND", "sqlite")
+    if backend == "memory":
+        return InMemoryReferencesRepository()
+    if backend == "supabase":
+        if supabase_client is None:
+            raise ValueError(
+                "supabase 백엔드에는 supabase_client가 필요합니다 (SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY 확인)."
+            )
+        return SupabaseReferencesRepository(supabase_client)
+    if backend == "sqlite":
+        from src.infrastructure.sqlite_references import SQLiteReferencesRepository
+
+        path = sqlite_path or os.getenv("REFERENCES_SQLITE_PATH")
+        if not path:
+            path = os.path.join(tempfile.gettempdir(), "prism_writer_references.sqlite3")
+            logger.warning(
+                f"REFERENCES_SQLITE_PATH 미설정 - 참조를 임시 경로에 저장합니다 (컨테이너 재시작 시 유실): {path}"
+            )
+        return SQLiteReferencesRepository(path)
+    raise ValueError(f"지원하지 않는 참조 저장소입니다: {backend} (가능: {', '.join(REFERENCES_BACKENDS)})")
@@ -6,10 +6,76 @@
 # =============================================================================
 
 from typing import Optional
+from array import array
+import asyncio
+import hashlib
 import logging
+import unicodedata
+
+from src.infrastructure.cache import LRUCache
+from src.infrastructure.supabase_utils import call_maybe_async, execute
 
 logger = logging.getLogger(__name__)
 
+# 기본 임베딩 모델 (migration 018의 embedding_model_id 기본값과 동일)
+DEFAULT_EMBEDDING_MODEL_ID = "text-embedding-3-small"
+
+# RRF 상수 (frontend/src/lib/rag/search/utils.ts의 RRF_K와 동일)
+RRF_K = 60
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+def normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (유니코드 NFC, 소문자, 공백 축약)"""
+    return " ".join(unicodedata.normalize("NFC", query).lower().split())
+
+
+def hash_vector(vector: list[float]) -> str:
+    """임베딩 벡터의 안정적인 해시 (float32 바이트 기준)"""
+    return hashlib.sha1(array("f", vector).tobytes()).hexdigest()
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: dict[str, list[dict]],
+    weights: Optional[dict[str, float]] = None,
+    k: int = RRF_K
+) -> list[dict]:
+    """
+    가중 Reciprocal Rank Fusion
+
+    score(d) = Σ weight_r / (k + rank_r(d)),  rank는 1부터 시작
+
+    Args:
+        ranked_lists: 랭커 이름 -> 순위순 청크 리스트 (청크는 "id" 필수)
+        weights: 랭커별 가중치 (기본 1.0)
+        k: RRF 상수
+
+    Returns:
+        fused_score 내림차순 청크 리스트
+        (각 청크에 "fused_score"와 랭커별 순위 "ranks" 추가, 없는 랭커는 None)
+    """
+    weights = weights or {}
+    fused: dict[str, dict] = {}
+    for ranker, chunks in ranked_lists.items():
+        weight = weights.get(ranker, 1.0)
+        for rank, chunk in enumerate(chunks, 1):
+            entry = fused.get(chunk["id"])
+            if entry is None:
+                entry = dict(chunk)
+                entry["fused_score"] = 0.0
+                entry["ranks"] = {name: None for name in ranked_lists}
+                fused[chunk["id"]] = entry
+            else:
+                # 벡터 유사도 등 먼저 들어온 값이 없으면 보충
+                for key, value in chunk.items():
+                    entry.setdefault(key, value)
+            entry["fused_score"] += weight / (k + rank)
+            entry["ranks"][ranker] = rank
+
+    return sorted(fused.values(), key=lambda c: c["fused_score"], reverse=True)
+
 
 # =============================================================================
 # Retriever Class
@@ -17,78 +83,588 @@ logger = logging.getLogger(__name__)
 class ChunkRetriever:
     """
     벡터 DB에서 관련 청크를 검색하는 클래스
+
+    검색 백엔드:
+    - 기본: Supabase RPC (search_similar_chunks)
+    - vector_store 주입 시: 해당 백엔드의 search()/search_many() 사용
+      (예: LocalVectorIndex - 로컬 메모리 맵 인덱스)
+    - heading_index 주입 시: doc_ids가 있는 구조 검색은 헤딩 인덱스 키 조회로 처리
+
+    2단 캐시:
+    - 임베딩 캐시: (정규화된 쿼리, 임베딩 모델 ID) -> 쿼리 벡터
+    - 결과 캐시: (user, 벡터 해시, doc_ids, top_k, threshold) -> 검색 결과
+      문서 재처리 시 invalidate_document()로 무효화
     """
-    
-    def __init__(self, supabase_client=None):
+
+    def __init__(
+        self,
+        supabase_client=None,
+        embedding_client=None,
+        vector_store=None,
+        heading_index=None,
+        embedding_model_id: str = DEFAULT_EMBEDDING_MODEL_ID,
+        active_model=None,
+        embedding_cache_size: int = 2048,
+        embedding_cache_ttl: Optional[float] = 24 * 60 * 60,
+        result_cache_size: int = 512,
+        result_cache_ttl: Optional[float] = 5 * 60,
+        mmr_lambda: Optional[float] = None,
+        mmr_duplicate_threshold: Optional[float] = 0.95,
+        mmr_fetch_factor: int = 3,
+        vector_cache_size: int = 4096
+    ):
         """
         Args:
             supabase_client: Supabase 클라이언트 (의존성 주입)
+            embedding_client: 임베딩 클라이언트 (OpenAI 호환, embeddings.create)
+            vector_store: 대체 검색 백엔드 (search/search_many 제공, 없으면 Supabase 사용)
+            heading_index: 문서 헤딩 인덱스 (HeadingIndex, 구조 검색용)
+            embedding_model_id: 임베딩 모델 ID (캐시 키에 포함)
+            active_model: 활성 모델 조회기 (ActiveEmbeddingModel, 주어지면 embedding_model_id 대신 사용)
+            embedding_cache_size: 임베딩 캐시 최대 항목 수
+            embedding_cache_ttl: 임베딩 캐시 TTL (초)
+            result_cache_size: 결과 캐시 최대 항목 수
+            result_cache_ttl: 결과 캐시 TTL (초)
+            mmr_lambda: MMR 관련도 가중치 (None이면 다양화 기본 비활성, retrieve_chunks(diversify=True)로 개별 사용)
+            mmr_duplicate_threshold: 선택된 청크와 코사인 유사도가 이 값 이상이면 중복으로 제외
+            mmr_fetch_factor: 다양화 시 top_k 대비 후보 수 배수
+            vector_cache_size: 후보 청크 임베딩 캐시 최대 항목 수
         """
         self.client = supabase_client
-    
+        self.embedding_client = embedding_client
+        self.vector_store = vector_store
+        self.heading_index = heading_index
+        self.embedding_model_id = embedding_model_id
+        self.active_model = active_model
+        self.embedding_cache = LRUCache(embedding_cache_size, embedding_cache_ttl)
+        self.result_cache = LRUCache(result_cache_size, result_cache_ttl)
+        self.mmr_lambda = mmr_lambda
+        self.mmr_duplicate_threshold = mmr_duplicate_threshold
+        self.mmr_fetch_factor = mmr_fetch_factor
+        # (모델 ID, chunk_id) → float32 벡터 (재임베딩 전환 시 자연히 분리)
+        self.vector_cache = LRUCache(vector_cache_size, embedding_cache_ttl)
+
     async def retrieve_chunks(
         self,
         query: str,
         user_id: Optional[str] = None,
         doc_ids: Optional[list[str]] = None,
         top_k: int = 10,
-        threshold: float = 0.7
+        threshold: float = 0.7,
+        diversify: Optional[bool] = None
     ) -> list[dict]:
         """
         쿼리와 유사한 청크 검색
-        
+
         Args:
             query: 검색 쿼리 (자연어)
             user_id: 사용자 ID (RLS 필터링)
             doc_ids: 특정 문서 ID 리스트로 필터링
             top_k: 반환할 최대 결과 수
             threshold: 유사도 임계값 (0.0 ~ 1.0)
-            
+            diversify: MMR로 거의 같은 청크 제거 (None이면 mmr_lambda 설정 여부를 따름)
+
         Returns:
             검색된 청크 리스트 [{"id", "content", "metadata", "similarity"}]
         """
         logger.info(f"청크 검색: query='{query[:50]}...', top_k={top_k}")
-        
-        # TODO: 실제 벡터 검색 구현
-        # 1. 쿼리를 임베딩 벡터로 변환
-        # 2. Supabase의 match_documents RPC 호출
-        # 3. 결과 반환
-        
-        # 현재는 더미 데이터 반환
-        return []
-    
+
+        if not self._can_search:
+            # 클라이언트 미주입 시 빈 결과 (로컬 개발용)
+            return []
+
+        # 1. 쿼리를 임베딩 벡터로 변환 (임베딩 캐시)
+        query_vector = await self._embed_query(query)
+
+        # 2. 결과 캐시 조회
+        if diversify is None:
+            diversify = self.mmr_lambda is not None
+        cache_key = self._result_cache_key(query_vector, user_id, doc_ids, top_k, threshold)
+        if diversify:
+            cache_key += (("mmr", self._mmr_lambda, self.mmr_duplicate_threshold),)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            return [dict(chunk) for chunk in cached]
+
+        # 3. 벡터 검색 (다양화 시 후보를 넉넉히 가져와 MMR로 top_k 선택)
+        chunks = await self._search_by_vector(
+            query_vector=query_vector,
+            user_id=user_id,
+            doc_ids=doc_ids,
+            top_k=top_k * self.mmr_fetch_factor if diversify else top_k,
+            threshold=threshold
+        )
+        if diversify:
+            chunks = await self._diversify(chunks, top_k, user_id)
+
+        # 4. 결과 캐시 저장 (문서 ID / 사용자 태그로 무효화 가능하게)
+        self._store_result(cache_key, chunks, user_id, doc_ids)
+
+        return chunks
+
+    async def retrieve_chunks_many(
+        self,
+        queries: list[str],
+        user_id: Optional[str] = None,
+        doc_ids: Optional[list[str]] = None,
+        top_k: int = 10,
+        threshold: float = 0.7
+    ) -> list[list[dict]]:
+        """
+        여러 쿼리를 한 번에 검색 (임베딩 1회 배치 요청 + DB 1회 왕복)
+
+        Args:
+            queries: 검색 쿼리 리스트 (예: 주제 + 후보 섹션 제목)
+            user_id: 사용자 ID (RLS 필터링)
+            doc_ids: 특정 문서 ID 리스트로 필터링
+            top_k: 쿼리별 반환할 최대 결과 수
+            threshold: 유사도 임계값 (0.0 ~ 1.0)
+
+        Returns:
+            쿼리 순서와 동일한 청크 리스트의 리스트
+        """
+        logger.info(f"다중 청크 검색: queries={len(queries)}, top_k={top_k}")
+
+        if not queries or not self._can_search:
+            return [[] for _ in queries]
+
+        # 1. 모든 쿼리 임베딩 (캐시 미스만 한 번에 배치 요청)
+        query_vectors = await self._embed_queries(queries)
+
+        # 2. 결과 캐시 조회, 미스난 쿼리만 모아서 검색
+        results: list[Optional[list[dict]]] = [None] * len(queries)
+        pending: dict = {}  # cache_key -> 쿼리 인덱스 리스트 (중복 쿼리 병합)
+        for i, vector in enumerate(query_vectors):
+            cache_key = self._result_cache_key(vector, user_id, doc_ids, top_k, threshold)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                results[i] = [dict(chunk) for chunk in cached]
+            else:
+                pending.setdefault(cache_key, []).append(i)
+
+        # 3. 미스난 쿼리를 단일 SQL 왕복으로 검색
+        if pending:
+            first_indices = [indices[0] for indices in pending.values()]
+            grouped = await self._search_by_vectors_many(
+                query_vectors=[query_vectors[i] for i in first_indices],
+                user_id=user_id,
+                doc_ids=doc_ids,
+                top_k=top_k,
+                threshold=threshold
+            )
+            for (cache_key, indices), chunks in zip(pending.items(), grouped):
+                self._store_result(cache_key, chunks, user_id, doc_ids)
+                for i in indices:
+                    results[i] = [dict(chunk) for chunk in chunks]
+
+        return results
+
+    async def retrieve_chunks_hybrid(
+        self,
+        query: str,
+        user_id: Optional[str] = None,
+        doc_ids: Optional[list[str]] = None,
+        top_k: int = 10,
+        threshold: float = 0.7,
+        vector_depth: Optional[int] = None,
+        lexical_depth: Optional[int] = None,
+        vector_weight: float = 1.0,
+        lexical_weight: float = 1.0,
+        rrf_k: int = RRF_K
+    ) -> list[dict]:
+        """
+        하이브리드 검색 (벡터 + 키워드 BM25), 가중 RRF로 병합
+
+        두 검색은 asyncio로 동시에 실행되므로 지연시간은 max(벡터, 키워드)
+        (키워드 검색을 먼저 띄우고, 쿼리 임베딩은 동기 클라이언트여도 스레드에서 실행되어 키워드 검색을 막지 않음)
+
+        Args:
+            query: 검색 쿼리 (자연어)
+            user_id: 사용자 ID (RLS 필터링)
+            doc_ids: 특정 문서 ID 리스트로 필터링
+            top_k: 병합 후 반환할 최대 결과 수
+            threshold: 벡터 검색 유사도 임계값 (키워드 검색에는 적용 안 함)
+            vector_depth: 벡터 검색 후보 수 (기본 top_k * 2)
+            lexical_depth: 키워드 검색 후보 수 (기본 top_k * 2)
+            vector_weight: 벡터 랭커 RRF 가중치
+            lexical_weight: 키워드 랭커 RRF 가중치
+            rrf_k: RRF 상수
+
+        Returns:
+            청크 리스트 [{"id", "content", "metadata", "similarity", "fused_score", "ranks"}]
+            ranks: {"vector": 순위 또는 None, "lexical": 순위 또는 None} (디버깅용)
+        """
+        logger.info(f"하이브리드 검색: query='{query[:50]}...', top_k={top_k}")
+
+        lexical_chunks, vector_chunks = await asyncio.gather(
+            self._search_lexical(
+                query=query,
+                user_id=user_id,
+                doc_ids=doc_ids,
+                top_k=lexical_depth or top_k * 2
+            ),
+            self.retrieve_chunks(
+                query=query,
+                user_id=user_id,
+                doc_ids=doc_ids,
+                top_k=vector_depth or top_k * 2,
+                threshold=threshold
+            )
+        )
+
+        fused = reciprocal_rank_fusion(
+            {"vector": vector_chunks, "lexical": lexical_chunks},
+            weights={"vector": vector_weight, "lexical": lexical_weight},
+            k=rrf_k
+        )
+        for chunk in fused:
+            # 키워드 검색에서만 나온 청크는 벡터 유사도 없음
+            if chunk["ranks"]["vector"] is None:
+                chunk["similarity"] = 0.0
+        return fused[:top_k]
+
     async def retrieve_structure_chunks(
         self,
         topic: str,
         doc_ids: Optional[list[str]] = None,
-        top_k: int = 50
+        top_k: int = 50,
+        user_id: Optional[str] = None
     ) -> list[dict]:
         """
         헤더 기반 구조적 청크 검색 (목차 생성용)
-        
+
         Args:
             topic: 주제
             doc_ids: 참조할 문서 ID 리스트
             top_k: 최대 검색 수
-            
+            user_id: 사용자 ID (본인 문서만 조회)
+
         Returns:
             헤더 메타데이터가 있는 청크 리스트
         """
         logger.info(f"구조적 청크 검색: topic='{topic}'")
-        
+
+        # 0. 문서가 지정되면 사전 계산된 헤딩 인덱스로 키 조회 (벡터 검색 생략)
+        if self.heading_index is not None and doc_ids:
+            structure_chunks = await self.heading_index.retrieve_structure(
+                doc_ids=doc_ids,
+                topic=topic,
+                top_k=top_k,
+                user_id=user_id
+            )
+            if structure_chunks:
+                logger.info(f"헤딩 인덱스에서 구조적 청크 {len(structure_chunks)}개 발견")
+                return structure_chunks
+            # 헤딩 인덱스가 아직 없는 문서 (백필 전) → 벡터 검색으로 폴백
+
         # 1. 일반 검색 수행
         all_chunks = await self.retrieve_chunks(
             query=topic,
+            user_id=user_id,
             doc_ids=doc_ids,
             top_k=top_k,
             threshold=0.5  # 구조 검색은 임계값 낮춤
         )
-        
+
         # 2. 헤더 메타데이터가 있는 것만 필터링
         structure_chunks = [
             chunk for chunk in all_chunks
             if chunk.get("metadata", {}).get("header_level") is not None
         ]
-        
+
         logger.info(f"구조적 청크 {len(structure_chunks)}개 발견")
         return structure_chunks
+
+    # =========================================================================
+    # Diversification (MMR)
+    # =========================================================================
+    @property
+    def _mmr_lambda(self) -> float:
+        from src.infrastructure.mmr import DEFAULT_MMR_LAMBDA
+
+        return DEFAULT_MMR_LAMBDA if self.mmr_lambda is None else self.mmr_lambda
+
+    async def _diversify(self, chunks: list[dict], top_k: int, user_id: Optional[str]) -> list[dict]:
+        """
+        MMR로 후보 청크 중 top_k개 선택 (선택 순서 = 반환 순서)
+
+        관련도는 검색 결과의 similarity, 후보 간 유사도는 청크 임베딩으로 계산
+        임베딩을 구할 수 없는 후보는 제외
+        """
+        if len(chunks) <= 1:
+            return chunks[:top_k]
+
+        from src.infrastructure.mmr import mmr_select
+        import numpy as np
+
+        vectors = await self._candidate_vectors([chunk["id"] for chunk in chunks], user_id)
+        candidates = [chunk for chunk in chunks if chunk["id"] in vectors]
+        if not candidates:
+            return chunks[:top_k]
+
+        selected = mmr_select(
+            query_vector=None,
+            candidate_vectors=np.stack([vectors[chunk["id"]] for chunk in candidates]),
+            k=top_k,
+            lambda_mult=self._mmr_lambda,
+            duplicate_threshold=self.mmr_duplicate_threshold,
+            relevance=[chunk.get("similarity", 0.0) for chunk in candidates],
+        )
+        return [candidates[i] for i in selected]
+
+    async def _candidate_vectors(self, chunk_ids: list[str], user_id: Optional[str]) -> dict:
+        """후보 청크 임베딩 {chunk_id: np.ndarray} (캐시 미스만 한 번에 조회)"""
+        model_id = await self._query_model_id()
+        vectors = {}
+        missing = []
+        for chunk_id in chunk_ids:
+            vector = self.vector_cache.get((model_id, chunk_id))
+            if vector is not None:
+                vectors[chunk_id] = vector
+            else:
+                missing.append(chunk_id)
+
+        if missing:
+            if self.vector_store is not None and hasattr(self.vector_store, "get_embeddings"):
+                fetched = await self.vector_store.get_embeddings(missing, user_id)
+            else:
+                fetched = await self._fetch_embeddings(missing)
+            for chunk_id, vector in fetched.items():
+                self.vector_cache.set((model_id, chunk_id), vector)
+            vectors.update(fetched)
+        return vectors
+
+    async def _fetch_embeddings(self, chunk_ids: list[str]) -> dict:
+        """Supabase에서 청크 임베딩 조회 (PostgREST는 vector를 '[...]' 문자열로 반환)"""
+        if self.client is None:
+            return {}
+
+        import numpy as np
+
+        response = await execute(
+            self.client.table("rag_chunks").select("id, embedding").in_("id", chunk_ids)
+        )
+        vectors = {}
+        for row in response.data or []:
+            embedding = row.get("embedding")
+            if isinstance(embedding, str):
+                vectors[row["id"]] = np.array(embedding.strip("[]").split(","), dtype=np.float32)
+            elif embedding is not None:
+                vectors[row["id"]] = np.asarray(embedding, dtype=np.float32)
+        return vectors
+
+    async def embed_query(self, query: str) -> Optional[tuple[str, list[float]]]:
+        """
+        쿼리 임베딩 + 임베딩 모델 ID (임베딩 캐시 공유, 시맨틱 목차 캐시용)
+
+        Returns:
+            (model_id, vector) - 임베딩 클라이언트가 없으면 None
+        """
+        if self.embedding_client is None:
+            return None
+        model_id = await self._query_model_id()
+        return model_id, await self._embed_query(query)
+
+    # =========================================================================
+    # Cache Management
+    # =========================================================================
+    def invalidate_document(self, document_id: str, user_id: Optional[str] = None) -> int:
+        """
+        문서 재처리(re-ingestion) 시 관련 검색 결과 캐시 무효화
+
+        Args:
+            document_id: 재처리된 문서 ID
+            user_id: 문서 소유자 ID (주어지면 사용자 전체 검색 결과도 무효화)
+
+        Returns:
+            무효화된 캐시 항목 수
+        """
+        removed = self.result_cache.invalidate_tag(("doc", document_id))
+        if user_id is not None:
+            removed += self.result_cache.invalidate_tag(("user", user_id))
+        logger.info(f"검색 캐시 무효화: doc={document_id}, removed={removed}")
+        return removed
+
+    def cache_stats(self) -> dict:
+        """캐시 적중/미스 통계 반환"""
+        return {
+            "embedding": {**self.embedding_cache.stats.to_dict(), "size": len(self.embedding_cache)},
+            "result": {**self.result_cache.stats.to_dict(), "size": len(self.result_cache)},
+            "vector": {**self.vector_cache.stats.to_dict(), "size": len(self.vector_cache)},
+        }
+
+    # =========================================================================
+    # Internal Helpers
+    # =========================================================================
+    @property
+    def _can_search(self) -> bool:
+        return self.embedding_client is not None and (
+            self.vector_store is not None or self.client is not None
+        )
+
+    async def _query_model_id(self) -> str:
+        # 주석(시니어 개발자): 재임베딩 중에는 embedding 컬럼이 이전 모델 벡터이므로
+        # 쿼리도 활성 모델로 임베딩 (cutover 후 TTL 내에 새 모델로 전환, 캐시 키도 분리)
+        return await self.active_model.get() if self.active_model else self.embedding_model_id
+
+    async def _embed_query(self, query: str) -> list[float]:
+        """쿼리 임베딩 (임베딩 캐시 경유)"""
+        return (await self._embed_queries([query]))[0]
+
+    async def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """여러 쿼리 임베딩 (캐시 미스만 단일 배치 요청)"""
+        model_id = await self._query_model_id()
+        vectors: list[Optional[list[float]]] = [None] * len(queries)
+        missing: dict[tuple, list[int]] = {}
+        for i, query in enumerate(queries):
+            cache_key = (normalize_query(query), model_id)
+            vector = self.embedding_cache.get(cache_key)
+            if vector is not None:
+                vectors[i] = vector
+            else:
+                missing.setdefault(cache_key, []).append(i)
+
+        if missing:
+            response = await call_maybe_async(
+                self.embedding_client.embeddings.create,
+                model=model_id,
+                input=[queries[indices[0]] for indices in missing.values()]
+            )
+            for (cache_key, indices), item in zip(missing.items(), response.data):
+                vector = list(item.embedding)
+                self.embedding_cache.set(cache_key, vector)
+                for i in indices:
+                    vectors[i] = vector
+
+        return vectors
+
+    @staticmethod
+    def _result_cache_key(
+        query_vector: list[float],
+        user_id: Optional[str],
+        doc_ids: Optional[list[str]],
+        top_k: int,
+        threshold: float
+    ) -> tuple:
+        return (
+            user_id,
+            hash_vector(query_vector),
+            tuple(sorted(doc_ids)) if doc_ids else None,
+            top_k,
+            threshold,
+        )
+
+    def _store_result(
+        self,
+        cache_key: tuple,
+        chunks: list[dict],
+        user_id: Optional[str],
+        doc_ids: Optional[list[str]]
+    ) -> None:
+        """결과 캐시 저장 (문서 ID / 사용자 태그 부착)"""
+        tags = {("user", user_id)}
+        tags.update(("doc", doc_id) for doc_id in doc_ids or ())
+        tags.update(("doc", chunk.get("document_id")) for chunk in chunks)
+        self.result_cache.set(cache_key, [dict(chunk) for chunk in chunks], tags=tags)
+
+    @staticmethod
+    def _row_to_chunk(row: dict) -> dict:
+        """RPC 결과 행을 공통 청크 형태로 변환"""
+        return {
+            "id": row.get("chunk_id"),
+            "document_id": row.get("document_id"),
+            "content": row.get("content", ""),
+            "metadata": row.get("metadata") or {},
+            "similarity": row.get("similarity", 0.0),
+        }
+
+    async def _search_by_vector(
+        self,
+        query_vector: list[float],
+        user_id: Optional[str],
+        doc_ids: Optional[list[str]],
+        top_k: int,
+        threshold: float
+    ) -> list[dict]:
+        """Supabase search_similar_chunks RPC 호출 후 doc_ids/threshold 필터링"""
+        if self.vector_store is not None:
+            return await self.vector_store.search(query_vector, user_id, doc_ids, top_k, threshold)
+
+        # doc_ids 필터는 RPC가 지원하지 않으므로 여유 있게 가져와서 거름
+        match_count = top_k * 4 if doc_ids else top_k
+        response = await execute(self.client.rpc("search_similar_chunks", {
+            "query_embedding": query_vector,
+            "user_id_param": user_id,
+            "match_count": match_count,
+        }))
+
+        allowed = set(doc_ids) if doc_ids else None
+        chunks = []
+        for row in response.data or []:
+            if allowed is not None and row.get("document_id") not in allowed:
+                continue
+            if row.get("similarity", 0.0) < threshold:
+                continue
+            chunks.append(self._row_to_chunk(row))
+            if len(chunks) >= top_k:
+                break
+        return chunks
+
+    async def _search_by_vectors_many(
+        self,
+        query_vectors: list[list[float]],
+        user_id: Optional[str],
+        doc_ids: Optional[list[str]],
+        top_k: int,
+        threshold: float
+    ) -> list[list[dict]]:
+        """search_similar_chunks_many RPC 단일 호출 후 query_index로 그룹핑"""
+        if self.vector_store is not None:
+            return await self.vector_store.search_many(query_vectors, user_id, doc_ids, top_k, threshold)
+
+        response = await execute(self.client.rpc("search_similar_chunks_many", {
+            "query_embeddings": query_vectors,
+            "user_id_param": user_id,
+            "match_count": top_k,
+            "doc_ids_param": doc_ids or None,
+            "match_threshold": threshold,
+        }))
+
+        grouped: list[list[dict]] = [[] for _ in query_vectors]
+        for row in response.data or []:
+            grouped[row["query_index"]].append(self._row_to_chunk(row))
+        return grouped
+
+    async def _search_lexical(
+        self,
+        query: str,
+        user_id: Optional[str],
+        doc_ids: Optional[list[str]],
+        top_k: int
+    ) -> list[dict]:
+        """키워드(ts_rank) 검색: search_chunks_with_rank RPC 호출 후 doc_ids 필터링"""
+        if self.client is None or not query.strip():
+            return []
+
+        match_count = top_k * 4 if doc_ids else top_k
+        response = await execute(self.client.rpc("search_chunks_with_rank", {
+            "search_query": query,
+            "user_id_param": user_id,
+            "match_count": match_count,
+        }))
+
+        allowed = set(doc_ids) if doc_ids else None
+        chunks = []
+        for row in response.data or []:
+            if allowed is not None and row.get("document_id") not in allowed:
+                continue
+            chunks.append({
+                "id": row.get("id"),
+                "document_id": row.get("document_id"),
+                "content": row.get("content", ""),
+                "metadata": row.get("metadata") or {},
+                "lexical_score": row.get("rank", 0.0),
+            })
+            if len(chunks) >= top_k:
+                break
+        return chunks
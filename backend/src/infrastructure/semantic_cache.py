@@ -0,0 +1,303 @@
+# =============================================================================
+# PRISM Writer Backend - Semantic Outline Cache
+# =============================================================================
+# 파일: backend/src/infrastructure/semantic_cache.py
+# 역할: 주제 임베딩 유사도 기반 목차 캐시 ("AI 시대의 글쓰기 방법론" ≈ "AI 시대 글쓰기 방법")
+# 키 구성:
+#   - 파티션 = 문서 ID 집합 + 문서 버전 + max_depth + 프롬프트 버전 + 임베딩 모델 + 사용자 (정확히 일치해야 함)
+#   - 파티션 안에서 주제 임베딩 코사인 유사도 ≥ threshold 인 최근접 항목 사용
+# 특징:
+#   - 파티션별 정규화 벡터 행렬 → 조회는 행렬-벡터 곱 1회 (항목별 Python 루프 없음)
+#   - 전체 항목 수 기준 LRU 축출 + TTL, 문서 태그 무효화
+#   - 최근접 유사도 분포 / 임계값별 예상 적중률 / 최근 적중 주제 쌍 → 임계값 튜닝용
+# 사용: OUTLINE_SEMANTIC_CACHE=1 (opt-in), 임계값 OUTLINE_SEMANTIC_CACHE_THRESHOLD
+# =============================================================================
+
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from typing import Any, Iterable, Optional
+import hashlib
+import json
+import logging
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+
+# 유사도 분포 버킷 상한 (임계값 근처를 촘촘하게)
+SIMILARITY_BUCKETS = (0.5, 0.6, 0.7, 0.8, 0.85, 0.88, 0.9, 0.92, 0.94, 0.96, 0.98, 0.99, 1.0)
+
+# stats()에서 예상 적중률을 보여줄 후보 임계값
+CANDIDATE_THRESHOLDS = (0.85, 0.88, 0.9, 0.92, 0.94, 0.96, 0.98)
+
+
+class _Entry:
+    __slots__ = ("partition", "topic", "value", "expires_at", "doc_ids")
+
+    def __init__(self, partition: str, topic: str, value: Any, expires_at: Optional[float], doc_ids: tuple):
+        self.partition = partition
+        self.topic = topic
+        self.value = value
+        self.expires_at = expires_at
+        self.doc_ids = doc_ids
+
+
+class _Partition:
+    """같은 파티션 항목들의 정규화 벡터 행렬 (행 삭제는 마지막 행과 교체)"""
+
+    def __init__(self, dim: int, capacity: int = 16):
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.entry_ids: list[int] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.entry_ids)
+
+    def add(self, entry_id: int, vector: np.ndarray) -> None:
+        if self.size == self.vectors.shape[0]:
+            grown = np.zeros((self.vectors.shape[0] * 2, self.vectors.shape[1]), dtype=np.float32)
+            grown[:self.size] = self.vectors
+            self.vectors = grown
+        self.vectors[self.size] = vector
+        self.entry_ids.append(entry_id)
+
+    def remove(self, entry_id: int) -> None:
+        row = self.entry_ids.index(entry_id)
+        last = self.size - 1
+        if row != last:
+            self.vectors[row] = self.vectors[last]
+            self.entry_ids[row] = self.entry_ids[last]
+        self.entry_ids.pop()
+
+    def nearest(self, query: np.ndarray) -> tuple[int, float]:
+        """(항목 ID, 코사인 유사도) - 벡터는 저장 시 정규화되어 있음"""
+        similarities = self.vectors[:self.size] @ query
+        best = int(np.argmax(similarities))
+        return self.entry_ids[best], float(similarities[best])
+
+
+def _normalize(vector) -> Optional[np.ndarray]:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array))
+    return array / norm if norm > 0 else None
+
+
+class SemanticOutlineCache:
+    """
+    주제 임베딩 근접 검색 목차 캐시
+
+    임베딩은 호출자가 계산 (GenerateOutlineUseCase가 retriever.embed_query로 계산, 임베딩 캐시 공유)
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_size: int = 1024,
+        ttl_seconds: Optional[float] = 60 * 60,
+        sample_window: int = 2000
+    ):
+        """
+        Args:
+            threshold: 캐시 사용 최소 코사인 유사도
+            max_size: 전체 최대 항목 수 (LRU 축출)
+            ttl_seconds: 항목 TTL (초, None이면 만료 없음)
+            sample_window: 분포/예상 적중률 계산에 보관할 최근 조회 수
+        """
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._partitions: dict[str, _Partition] = {}
+        self._doc_index: dict[str, set[int]] = {}
+        self._next_id = 0
+
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+        self.expirations = 0
+        # 최근접 유사도 분포 (적중/미스별, 파티션이 비어 있던 조회는 empty로만 집계)
+        self.empty = 0
+        self._histogram = {"hit": [0] * (len(SIMILARITY_BUCKETS) + 1), "miss": [0] * (len(SIMILARITY_BUCKETS) + 1)}
+        self._recent_similarities: deque = deque(maxlen=sample_window)
+        self._recent_hits: deque = deque(maxlen=20)
+
+    @staticmethod
+    def partition_key(
+        doc_ids: Optional[Iterable[str]],
+        doc_versions: Optional[dict[str, str]],
+        max_depth: int,
+        prompt_version: str,
+        model_id: str,
+        user_id: Optional[str] = None
+    ) -> str:
+        """
+        주제를 제외한 정확 일치 조건의 해시 (OutlineResultCache.make_key와 같은 정규화)
+
+        주석(시니어 개발자): 임베딩 모델이 바뀌면 벡터 공간(차원)이 달라 비교할 수 없으므로 파티션 분리
+        """
+        doc_versions = doc_versions or {}
+        payload = {
+            "docs": [[doc_id, doc_versions.get(doc_id)] for doc_id in sorted(set(doc_ids or ()))],
+            "max_depth": max_depth,
+            "prompt": prompt_version,
+            "model": model_id,
+            "user": user_id,
+        }
+        encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    # -------------------------------------------------------------------------
+    # Lookup / Store
+    # -------------------------------------------------------------------------
+    def lookup(self, partition: str, vector, topic: str = "") -> Optional[Any]:
+        """
+        파티션 안 최근접 항목이 threshold 이상이면 값 반환 (없으면 None)
+
+        Args:
+            partition: partition_key() 결과
+            vector: 주제 임베딩
+            topic: 요청 주제 (적중 쌍 기록용)
+        """
+        self.lookups += 1
+        part = self._partitions.get(partition)
+        query = _normalize(vector)
+        if part is None or not part.size or query is None:
+            self.empty += 1
+            return None
+
+        entry_id, similarity = part.nearest(query)
+        entry = self._entries[entry_id]
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(entry_id)
+            self.expirations += 1
+            self.empty += 1
+            return None
+
+        hit = similarity >= self.threshold
+        self._record(similarity, hit)
+        if not hit:
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(entry_id)
+        logger.debug(f"시맨틱 목차 캐시 적중: '{topic}' ≈ '{entry.topic}' ({similarity:.3f})")
+        self._recent_hits.append({"topic": topic, "cached_topic": entry.topic, "similarity": round(similarity, 4)})
+        return entry.value
+
+    def store(
+        self,
+        partition: str,
+        vector,
+        value: Any,
+        topic: str = "",
+        doc_ids: Optional[Iterable[str]] = None
+    ) -> None:
+        """항목 저장 (value는 공유되므로 불변 값이어야 함)"""
+        query = _normalize(vector)
+        if query is None:
+            return
+        part = self._partitions.get(partition)
+        if part is None:
+            part = self._partitions[partition] = _Partition(query.shape[0])
+
+        entry_id = self._next_id
+        self._next_id += 1
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        doc_ids = tuple(sorted(set(doc_ids or ())))
+        self._entries[entry_id] = _Entry(partition, topic, value, expires_at, doc_ids)
+        part.add(entry_id, query)
+        for doc_id in doc_ids:
+            self._doc_index.setdefault(doc_id, set()).add(entry_id)
+
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate_document(self, document_id: str) -> int:
+        """문서 변경 시 해당 문서를 참조한 항목 제거"""
+        entry_ids = list(self._doc_index.get(document_id, ()))
+        for entry_id in entry_ids:
+            self._remove(entry_id)
+        return len(entry_ids)
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        part = self._partitions[entry.partition]
+        part.remove(entry_id)
+        if not part.size:
+            del self._partitions[entry.partition]
+        for doc_id in entry.doc_ids:
+            ids = self._doc_index.get(doc_id)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del self._doc_index[doc_id]
+
+    def _record(self, similarity: float, hit: bool) -> None:
+        self._histogram["hit" if hit else "miss"][bisect_left(SIMILARITY_BUCKETS, similarity)] += 1
+        self._recent_similarities.append(similarity)
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        """
+        적중률 + 최근접 유사도 분포
+
+        - would_hit: 최근 조회에 후보 임계값을 적용했을 때의 예상 적중률
+        - recent_hits: 최근 적중한 (요청 주제, 캐시 주제) 쌍 → 잘못된 적중 육안 점검
+        """
+        recent = np.asarray(self._recent_similarities, dtype=np.float32)
+        compared = len(recent)
+        return {
+            "size": len(self._entries),
+            "partitions": len(self._partitions),
+            "threshold": self.threshold,
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+            "empty_partition": self.empty,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "similarity_p50": round(float(np.percentile(recent, 50)), 4) if compared else None,
+            "similarity_p90": round(float(np.percentile(recent, 90)), 4) if compared else None,
+            "would_hit": {
+                f"{threshold:g}": round(float((recent >= threshold).mean()), 4) if compared else 0.0
+                for threshold in CANDIDATE_THRESHOLDS
+            },
+            "similarity_histogram": {
+                outcome: {
+                    **{f"{bound:g}": count for bound, count in zip(SIMILARITY_BUCKETS, counts)},
+                    "+Inf": counts[-1],
+                }
+                for outcome, counts in self._histogram.items()
+            },
+            "recent_hits": list(self._recent_hits),
+        }
+
+    def render_prometheus(self) -> list[str]:
+        """Prometheus 텍스트 포맷 라인 (/metrics 수집기)"""
+        name = "prism_outline_semantic_cache_similarity"
+        lines = [
+            f"# HELP {name} Nearest cached topic similarity per lookup.",
+            f"# TYPE {name} histogram",
+        ]
+        for outcome, counts in self._histogram.items():
+            cumulative = 0
+            for bound, count in zip(SIMILARITY_BUCKETS, counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{outcome="{outcome}",le="{bound:g}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'{name}_bucket{{outcome="{outcome}",le="+Inf"}} {cumulative}')
+            lines.append(f'{name}_count{{outcome="{outcome}"}} {cumulative}')
+        for metric, value, kind in (
+            ("prism_outline_semantic_cache_lookups_total", self.lookups, "counter"),
+            ("prism_outline_semantic_cache_hits_total", self.hits, "counter"),
+            ("prism_outline_semantic_cache_entries", len(self._entries), "gauge"),
+        ):
+            lines += [f"# TYPE {metric} {kind}", f"{metric} {value}"]
+        return lines
@@ -0,0 +1,343 @@
+# =============================================================================
+# PRISM Writer Backend - SQLite References Repository
+# =============================================================================
+# 파일: backend/src/infrastructure/sqlite_references.py
+# 역할: 노드 로컬 SQLite(WAL) 참조 저장소 - uvicorn --workers N 간 상태 공유
+#       (Supabase draft_references 연결 전까지 사용, 인터페이스는 다른 저장소와 동일)
+# 특징:
+#   - WAL + synchronous=NORMAL: 읽기는 쓰기를 기다리지 않고, 커밋마다 fsync 없음
+#   - 그룹 커밋: 동시에 들어온 쓰기를 한 트랜잭션으로 묶고 작업별 SAVEPOINT로 격리
+#     (한 요청의 중복 오류가 같은 배치의 다른 요청을 롤백하지 않음)
+#   - 연결 재사용: 쓰기 전용 스레드 1개 + 읽기 스레드 풀, 스레드마다 연결 1개
+#   - 글별 버전(draft_versions)을 같은 트랜잭션에서 증가 → 워커 간 응답 캐시/ETag 일관성
+# =============================================================================
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+import sqlite3
+import threading
+
+from src.infrastructure.references_repository import (
+    DraftNotFoundError,
+    DuplicateReferenceError,
+    _find_batch_duplicates,
+    _new_reference,
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS draft_references (
+    id TEXT PRIMARY KEY,
+    draft_id TEXT NOT NULL,
+    chunk_id TEXT NOT NULL,
+    paragraph_index INTEGER NOT NULL,
+    reference_type TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    UNIQUE (draft_id, chunk_id, paragraph_index)
+);
+
+-- 목록/페이지 조회 및 문단 범위 이동용 (migration 042의 idx_draft_references_paragraph와 동일 목적)
+CREATE INDEX IF NOT EXISTS idx_draft_references_paragraph
+    ON draft_references(draft_id, paragraph_index, id);
+
+CREATE TABLE IF NOT EXISTS draft_versions (
+    draft_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+COLUMNS = "id, draft_id, chunk_id, paragraph_index, reference_type, created_at"
+
+# 한 트랜잭션에 묶을 최대 쓰기 작업 수 (초과분은 다음 트랜잭션)
+MAX_BATCH_OPS = 256
+
+
+def _row_to_reference(row: tuple) -> dict:
+    return {
+        "id": row[0],
+        "draft_id": row[1],
+        "chunk_id": row[2],
+        "paragraph_index": row[3],
+        "reference_type": row[4],
+        "created_at": datetime.fromisoformat(row[5]),
+    }
+
+
+def _bump_version(conn: sqlite3.Connection, draft_id: str) -> None:
+    conn.execute(
+        "INSERT INTO draft_versions (draft_id, version) VALUES (?, 1) "
+        "ON CONFLICT (draft_id) DO UPDATE SET version = version + 1",
+        (draft_id,)
+    )
+
+
+def _require_draft(conn: sqlite3.Connection, draft_id: str) -> None:
+    if conn.execute("SELECT 1 FROM draft_versions WHERE draft_id = ?", (draft_id,)).fetchone() is None:
+        raise DraftNotFoundError(draft_id)
+
+
+class SQLiteReferencesRepository:
+    """
+    SQLite(WAL) 참조 저장소
+
+    같은 파일을 여는 모든 프로세스가 상태를 공유 (컨테이너/노드 단위)
+    """
+
+    def __init__(self, path: str, reader_threads: int = 2, busy_timeout: float = 5.0):
+        """
+        Args:
+            path: DB 파일 경로 (워커들이 같은 경로를 사용해야 함)
+            reader_threads: 읽기 스레드(=읽기 연결) 수
+            busy_timeout: 다른 프로세스가 쓰기 잠금을 잡고 있을 때 기다리는 시간 (초)
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # 주석(시니어 개발자): sqlite3 연결의 with는 트랜잭션만 끝내고 닫지 않으므로 closing으로 명시적 종료
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA_SQL)
+
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-refs-writer")
+        self._readers = ThreadPoolExecutor(max_workers=reader_threads, thread_name_prefix="sqlite-refs-reader")
+        self._pending: list[tuple[Callable[[sqlite3.Connection], Any], asyncio.Future]] = []
+        self._drain_task: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.writes = 0
+
+    # -------------------------------------------------------------------------
+    # Connections
+    # -------------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        # isolation_level=None → 트랜잭션을 BEGIN/COMMIT으로 직접 제어
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """현재 스레드 전용 연결 (스레드당 1회 생성 후 재사용)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+    # -------------------------------------------------------------------------
+    # Read / Write Execution
+    # -------------------------------------------------------------------------
+    async def _read(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, lambda: fn(self._thread_connection()))
+
+    async def _write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """쓰기 작업 등록 → 진행 중인 배치가 끝나면 다음 그룹 커밋에 포함"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((fn, future))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = loop.create_task(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            batch, self._pending = self._pending[:MAX_BATCH_OPS], self._pending[MAX_BATCH_OPS:]
+            try:
+                results = await loop.run_in_executor(self._writer, self._run_batch, [fn for fn, _ in batch])
+            except Exception as e:
+                results = [(False, e)] * len(batch)
+            for (_, future), (ok, value) in zip(batch, results):
+                if future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+    def _run_batch(self, fns: list[Callable[[sqlite3.Connection], Any]]) -> list[tuple[bool, Any]]:
+        """쓰기 스레드: 배치 전체를 한 트랜잭션으로, 작업마다 SAVEPOINT"""
+        conn = self._thread_connection()
+        results: list[tuple[bool, Any]] = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for fn in fns:
+                conn.execute("SAVEPOINT op")
+                try:
+                    results.append((True, fn(conn)))
+                except Exception as e:
+                    conn.execute("ROLLBACK TO op")
+                    results.append((False, e))
+                conn.execute("RELEASE op")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self.batches += 1
+        self.writes += len(fns)
+        return results
+
+    # -------------------------------------------------------------------------
+    # Repository Interface
+    # -------------------------------------------------------------------------
+    async def list_for_draft(self, draft_id: str) -> list[dict]:
+        return await self.list_page(draft_id)
+
+    async def list_page(
+        self,
+        draft_id: str,
+        after: Optional[tuple[int, str]] = None,
+        limit: Optional[int] = None
+    ) -> list[dict]:
+        """(paragraph_index, id) 키셋 페이지 조회"""
+        def query(conn: sqlite3.Connection) -> list[dict]:
+            sql = f"SELECT {COLUMNS} FROM draft_references WHERE draft_id = ?"
+            params: list = [draft_id]
+            if after is not None:
+                sql += " AND (paragraph_index, id) > (?, ?)"
+                params += list(after)
+            sql += " ORDER BY paragraph_index, id"
+            if limit is not None:
+                sql += " LIMIT ?"
+                params.append(limit)
+            return [_row_to_reference(row) for row in conn.execute(sql, params)]
+
+        return await self._read(query)
+
+    async def version(self, draft_id: str) -> Optional[str]:
+        """글 참조 목록 버전 (모든 워커에서 동일)"""
+        def query(conn: sqlite3.Connection) -> str:
+            row = conn.execute("SELECT version FROM draft_versions WHERE draft_id = ?", (draft_id,)).fetchone()
+            return str(row[0]) if row else "0"
+
+        return await self._read(query)
+
+    async def create(self, draft_id: str, item: dict) -> dict:
+        return (await self.create_many(draft_id, [item]))[0]
+
+    async def create_many(self, draft_id: str, items: list[dict]) -> list[dict]:
+        """
+        일괄 생성 (전부 성공 또는 전부 실패)
+
+        Raises:
+            DuplicateReferenceError: 기존 참조 또는 배치 내부와 중복
+        """
+        duplicates = _find_batch_duplicates(items)
+        if duplicates:
+            raise DuplicateReferenceError(duplicates)
+        created = [_new_reference(draft_id, item) for item in items]
+
+        def insert(conn: sqlite3.Connection) -> list[dict]:
+            try:
+                conn.executemany(
+                    f"INSERT INTO draft_references ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (r["id"], r["draft_id"], r["chunk_id"], r["paragraph_index"],
+                         r["reference_type"], r["created_at"].isoformat())
+                        for r in created
+                    ]
+                )
+            except sqlite3.IntegrityError:
+                slots = {(item["chunk_id"], item["paragraph_index"]) for item in items}
+                existing = conn.execute(
+                    "SELECT chunk_id, paragraph_index FROM draft_references WHERE draft_id = ?", (draft_id,)
+                ).fetchall()
+                raise DuplicateReferenceError([slot for slot in map(tuple, existing) if slot in slots])
+            _bump_version(conn, draft_id)
+            return created
+
+        return await self._write(insert)
+
+    async def delete(self, draft_id: str, reference_id: str) -> bool:
+        """
+        Raises:
+            DraftNotFoundError: 글이 존재하지 않음
+        """
+        return (await self.delete_many(draft_id, [reference_id])) == 1
+
+    async def delete_many(self, draft_id: str, reference_ids: list[str]) -> int:
+        """일괄 삭제, 실제 삭제된 수 반환"""
+        ids = list(set(reference_ids))
+
+        def delete(conn: sqlite3.Connection) -> int:
+            _require_draft(conn, draft_id)
+            deleted = 0
+            # SQLite 바인딩 변수 수 제한(기본 32766) 안에서 나눠 삭제
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                deleted += conn.execute(
+                    f"DELETE FROM draft_references WHERE draft_id = ? AND id IN ({','.join('?' * len(chunk))})",
+                    [draft_id, *chunk]
+                ).rowcount
+            if deleted:
+                _bump_version(conn, draft_id)
+            return deleted
+
+        return await self._write(delete)
+
+    async def shift_paragraphs(
+        self,
+        draft_id: str,
+        start_index: int,
+        delete_count: int = 0,
+        insert_count: int = 0
+    ) -> dict:
+        """
+        문단 삽입/삭제 편집 반영 (범위 DELETE + UPDATE, 단일 트랜잭션)
+
+        Returns:
+            {"deleted": 삭제된 참조 수, "shifted": 이동된 참조 수}
+        """
+        delta = insert_count - delete_count
+        end_index = start_index + delete_count
+
+        def shift(conn: sqlite3.Connection) -> dict:
+            _require_draft(conn, draft_id)
+            deleted = conn.execute(
+                "DELETE FROM draft_references WHERE draft_id = ? AND paragraph_index >= ? AND paragraph_index < ?",
+                (draft_id, start_index, end_index)
+            ).rowcount
+            shifted = 0
+            if delta:
+                # 주석(시니어 개발자): SQLite는 UNIQUE를 행 단위로 즉시 검사 → 이동 중 일시 충돌 방지를 위해
+                # 음수 영역으로 옮겼다가(-(새 인덱스) - 1) 다시 뒤집는 2단계 UPDATE
+                shifted = conn.execute(
+                    "UPDATE draft_references SET paragraph_index = -(paragraph_index + ?) - 1 "
+                    "WHERE draft_id = ? AND paragraph_index >= ?",
+                    (delta, draft_id, end_index)
+                ).rowcount
+                conn.execute(
+                    "UPDATE draft_references SET paragraph_index = -paragraph_index - 1 "
+                    "WHERE draft_id = ? AND paragraph_index < 0",
+                    (draft_id,)
+                )
+            if deleted or shifted:
+                _bump_version(conn, draft_id)
+            return {"deleted": deleted, "shifted": shifted}
+
+        return await self._write(shift)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "writes": self.writes,
+            "ops_per_batch": round(self.writes / self.batches, 2) if self.batches else 0.0,
+        }
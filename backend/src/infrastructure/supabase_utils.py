@@ -0,0 +1,64 @@
+# =============================================================================
+# PRISM Writer Backend - Supabase Client Utilities
+# =============================================================================
+# 파일: backend/src/infrastructure/supabase_utils.py
+# 역할: 동기/비동기 Supabase 클라이언트 공통 실행 헬퍼
+# =============================================================================
+
+from functools import lru_cache
+import asyncio
+import inspect
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+async def maybe_await(value):
+    """동기/비동기 클라이언트 모두 지원하기 위한 헬퍼"""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def call_maybe_async(func, *args, **kwargs):
+    """
+    동기/비동기 클라이언트 메서드 호출 (예: embeddings.create)
+
+    주석(시니어 개발자): maybe_await(func(...))는 동기 클라이언트면 호출 자체가 이벤트 루프를 막아
+    gather로 함께 띄운 다른 작업(키워드 검색 등)이 그동안 시작도 못 함 → 동기 메서드는 스레드에서 실행
+    """
+    if inspect.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await maybe_await(await asyncio.to_thread(func, *args, **kwargs))
+
+
+async def execute(request):
+    """
+    Supabase 요청 실행
+
+    비동기 클라이언트는 그대로 await, 동기 클라이언트는 스레드에서 실행하여
+    이벤트 루프를 막지 않음 (동시 실행되는 검색이 서로를 기다리지 않도록)
+    """
+    if inspect.iscoroutinefunction(request.execute):
+        return await request.execute()
+    return await asyncio.to_thread(request.execute)
+
+
+@lru_cache(maxsize=1)
+def get_supabase_client():
+    """
+    프로세스 공유 Supabase 클라이언트 (SUPABASE_URL + 서비스 키, 미설정 시 None)
+
+    주석(시니어 개발자): supabase 패키지는 import 비용이 커서 첫 사용 시점에 생성
+    (tests/test_import_budget.py), 서비스 키는 RLS를 우회하므로 호출부에서 user_id 조건 필수
+    """
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
+    if not (url and key):
+        logger.warning("SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY 미설정: Supabase 연동 비활성")
+        return None
+
+    from supabase import create_client
+
+    return create_client(url, key)
@@ -0,0 +1,366 @@
+# =============================================================================
+# PRISM Writer Backend - Telemetry (Spans / Histograms / Batched Writer)
+# =============================================================================
+# 파일: backend/src/infrastructure/telemetry.py
+# 역할: 단계별 지연시간 측정 (span) → 메모리 히스토그램 + telemetry_logs 일괄 저장
+# 특징:
+#   - span 종료 시 히스토그램 갱신 + 버퍼 append만 수행 (요청 경로에서 I/O 없음)
+#   - 백그라운드 태스크가 flush_interval마다 또는 batch_size 도달 시 일괄 insert
+#     (asyncpg COPY 우선, 없으면 Supabase insert(list))
+#   - 버퍼가 가득 차면 새 span을 버림 (DB 장애가 메모리 증가로 번지지 않도록)
+#   - 같은 히스토그램을 Prometheus 텍스트 포맷으로 노출 (/metrics)
+# 스키마: telemetry_logs (migration 019, run_type은 032)
+# =============================================================================
+
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import astuple, dataclass, fields
+from typing import Callable, Iterator, Optional
+import asyncio
+import logging
+import time
+import uuid
+
+from src.infrastructure.supabase_utils import maybe_await
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 상한 (초) - 검색(수~수십 ms)부터 LLM 호출(수~수십 초)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_NAME = "prism_span_duration_seconds"
+
+# 현재 요청(run)의 ID - 라우터 span이 설정하고 하위 span이 상속
+_current_run_id: ContextVar[Optional[str]] = ContextVar("telemetry_run_id", default=None)
+
+
+def current_run_id() -> Optional[str]:
+    """현재 컨텍스트의 run_id (span 밖이면 None)"""
+    return _current_run_id.get()
+
+
+def bind_run_id(run_id: Optional[str]) -> Token:
+    """이후 span이 상속할 run_id 설정 (unbind_run_id로 되돌림)"""
+    return _current_run_id.set(run_id)
+
+
+def unbind_run_id(token: Token) -> None:
+    try:
+        _current_run_id.reset(token)
+    except ValueError:
+        # 비동기 제너레이터가 다른 컨텍스트에서 종료된 경우
+        _current_run_id.set(None)
+
+
+# =============================================================================
+# Span
+# =============================================================================
+class Span:
+    """진행 중인 span (with 블록 안에서 모델/토큰 정보 추가 가능)"""
+
+    __slots__ = ("step", "run_id", "user_id", "model_id", "tokens_in", "tokens_out", "error_code")
+
+    def __init__(self, step: str, run_id: str, user_id: Optional[str] = None, model_id: Optional[str] = None):
+        self.step = step
+        self.run_id = run_id
+        self.user_id = user_id
+        self.model_id = model_id
+        self.tokens_in: Optional[int] = None
+        self.tokens_out: Optional[int] = None
+        # 예외 없이 끝났지만 실패로 기록할 때 설정 (예: HTTP 5xx)
+        self.error_code: Optional[str] = None
+
+
+@dataclass
+class SpanRecord:
+    """telemetry_logs 한 행 (필드 순서 = TELEMETRY_COLUMNS)"""
+    run_id: str
+    user_id: Optional[str]
+    step: str
+    start_time: int   # epoch ms
+    end_time: int     # epoch ms
+    latency_ms: int
+    model_id: Optional[str]
+    tokens_in: Optional[int]
+    tokens_out: Optional[int]
+    success: bool
+    error_code: Optional[str]
+    # 주석(시니어 개발자): 컬럼 기본값이 'judge'라 생략하면 평가 로그로 섞임 → 명시적으로 NULL
+    run_type: Optional[str] = None
+
+    def to_row(self) -> dict:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+TELEMETRY_COLUMNS = tuple(field.name for field in fields(SpanRecord))
+
+
+# =============================================================================
+# Histogram
+# =============================================================================
+class LatencyHistogram:
+    """(step, status)별 누적 히스토그램 (Prometheus histogram 의미론)"""
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # key → [버킷별 개수..., +Inf 개수], 합계, 총 개수
+        self._counts: dict[tuple[str, str], list[int]] = {}
+        self._sums: dict[tuple[str, str], float] = {}
+
+    def observe(self, step: str, seconds: float, success: bool = True) -> None:
+        key = (step, "ok" if success else "error")
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect_left(self.buckets, seconds)] += 1
+        self._sums[key] += seconds
+
+    def snapshot(self) -> dict:
+        """{"step|status": {"count", "sum"}} (디버깅/테스트용)"""
+        return {
+            f"{step}|{status}": {"count": sum(counts), "sum": round(self._sums[(step, status)], 6)}
+            for (step, status), counts in self._counts.items()
+        }
+
+    def render(self, name: str = METRIC_NAME) -> list[str]:
+        """Prometheus 텍스트 포맷 라인"""
+        lines = [
+            f"# HELP {name} Latency of instrumented stages (spans).",
+            f"# TYPE {name} histogram",
+        ]
+        for (step, status), counts in sorted(self._counts.items()):
+            labels = f'step="{_escape(step)}",status="{status}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {self._sums[(step, status)]:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# =============================================================================
+# Telemetry
+# =============================================================================
+class Telemetry:
+    """
+    span 수집기 + telemetry_logs 일괄 저장기
+
+    사용:
+        with telemetry.span("outline.llm", model_id=model) as span:
+            ...
+            span.tokens_out = n
+
+    - start() 전(또는 저장소 없음)에는 히스토그램만 갱신하고 행은 버퍼에 쌓지 않음
+    - 저장 실패한 배치는 재시도 없이 버림 (failed 카운트)
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+        buckets: tuple = DEFAULT_BUCKETS
+    ):
+        """
+        Args:
+            buffer_size: 저장 대기 span 최대 개수 (초과분은 버림)
+            batch_size: insert 1회당 최대 행 수 (도달 시 즉시 flush 깨움)
+            flush_interval: 주기적 flush 간격 (초)
+            buckets: 히스토그램 버킷 상한 (초)
+        """
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.histogram = LatencyHistogram(buckets)
+
+        self.pool = None
+        self.client = None
+        self._buffer: deque[SpanRecord] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        # /metrics에 덧붙일 외부 지표 (각각 Prometheus 텍스트 라인 리스트 반환)
+        self._collectors: list[Callable[[], list[str]]] = []
+
+    # -------------------------------------------------------------------------
+    # Span API
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def span(
+        self,
+        step: str,
+        user_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        run_id: Optional[str] = None
+    ) -> Iterator[Span]:
+        """
+        단계 소요 시간 측정 (동기/비동기 코드 모두 with 문으로 사용)
+
+        run_id가 없고 상위 span도 없으면 새 run을 시작하고 하위 span에 전파
+        """
+        parent_run_id = _current_run_id.get()
+        root = run_id is None and parent_run_id is None
+        span = Span(step, run_id or parent_run_id or uuid.uuid4().hex, user_id, model_id)
+        token = bind_run_id(span.run_id) if root else None
+
+        start_time = time.time()
+        started = time.perf_counter()
+        error_code = None
+        try:
+            yield span
+        except BaseException as e:
+            error_code = type(e).__name__
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            if token is not None:
+                unbind_run_id(token)
+            self.record(span, start_time, elapsed, error_code or span.error_code)
+
+    def record(self, span: Span, start_time: float, elapsed: float, error_code: Optional[str] = None) -> None:
+        """종료된 span 반영 (히스토그램 + 저장 버퍼)"""
+        success = error_code is None
+        self.histogram.observe(span.step, elapsed, success)
+
+        if self._task is None:
+            return
+        if len(self._buffer) >= self.buffer_size:
+            self.dropped += 1
+            return
+
+        start_ms = int(start_time * 1000)
+        latency_ms = int(elapsed * 1000)
+        self._buffer.append(SpanRecord(
+            run_id=span.run_id,
+            user_id=span.user_id,
+            step=span.step,
+            start_time=start_ms,
+            end_time=start_ms + latency_ms,
+            latency_ms=latency_ms,
+            model_id=span.model_id,
+            tokens_in=span.tokens_in,
+            tokens_out=span.tokens_out,
+            success=success,
+            error_code=error_code,
+        ))
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    # -------------------------------------------------------------------------
+    # Background Writer
+    # -------------------------------------------------------------------------
+    def start(self, pool=None, supabase_client=None) -> None:
+        """
+        백그라운드 저장 태스크 시작 (실행 중인 이벤트 루프 안에서 호출)
+
+        Args:
+            pool: asyncpg 커넥션 풀 (COPY로 저장, 우선 사용)
+            supabase_client: service role Supabase 클라이언트 (RLS insert 정책 우회 필요)
+        """
+        if self._task is not None or (pool is None and supabase_client is None):
+            return
+        self.pool = pool
+        self.client = supabase_client
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """저장 태스크 종료 (남은 버퍼 flush)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush()
+        self._buffer.clear()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """버퍼의 span을 batch_size 단위로 저장 (저장된 행 수 반환)"""
+        written = 0
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            try:
+                await self._write(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                logger.warning(f"telemetry 저장 실패 ({len(batch)}건 버림): {e}")
+                continue
+            written += len(batch)
+        self.written += written
+        return written
+
+    async def _write(self, batch: list[SpanRecord]) -> None:
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                await conn.copy_records_to_table(
+                    "telemetry_logs",
+                    records=[astuple(record) for record in batch],
+                    columns=TELEMETRY_COLUMNS,
+                    schema_name="public"
+                )
+            return
+        request = self.client.table("telemetry_logs").insert([record.to_row() for record in batch])
+        await maybe_await(request.execute())
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "buffered": len(self._buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "running": self._task is not None,
+        }
+
+    def add_collector(self, collector: Callable[[], list[str]]) -> None:
+        """render_prometheus()에 포함할 지표 수집 함수 등록 (예: 시맨틱 목차 캐시)"""
+        self._collectors.append(collector)
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 포맷 (span 히스토그램 + 저장기 카운터 + 등록된 수집기)"""
+        lines = self.histogram.render()
+        for name, value, help_text in (
+            ("prism_telemetry_written_total", self.written, "Spans written to telemetry_logs."),
+            ("prism_telemetry_dropped_total", self.dropped, "Spans dropped because the buffer was full."),
+            ("prism_telemetry_failed_total", self.failed, "Spans lost to failed batch inserts."),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter", f"{name} {value}"]
+        lines += [
+            "# HELP prism_telemetry_buffered Spans waiting to be written.",
+            "# TYPE prism_telemetry_buffered gauge",
+            f"prism_telemetry_buffered {len(self._buffer)}",
+        ]
+        for collector in self._collectors:
+            lines += collector()
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 단위 공유 인스턴스 (라우터 / 유스케이스 / main.py에서 사용)
+telemetry = Telemetry()
@@ -0,0 +1,82 @@
+# =============================================================================
+# PRISM Writer Backend - Tokenizer Utility
+# =============================================================================
+# 파일: backend/src/infrastructure/tokenizer.py
+# 역할: tiktoken 기반 토큰 계산/분할 (frontend/src/lib/rag/tokenizer.ts와 동일 기준)
+# 주의: 인코딩 로드 실패(오프라인 등) 시 문자 수 기반 보수적 추정으로 대체
+# =============================================================================
+
+from functools import lru_cache
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+# 기본 인코딩 (OpenAI text-embedding-3-small, GPT-3.5/4 호환)
+DEFAULT_ENCODING = "cl100k_base"
+
+# tiktoken 사용 불가 시 문자/토큰 비율 (한글/영어 혼합 기준 보수적 추정)
+FALLBACK_CHARS_PER_TOKEN = 2.5
+
+
+@lru_cache(maxsize=4)
+def get_encoding(encoding_name: str = DEFAULT_ENCODING):
+    """인코딩 인스턴스 (프로세스당 1회 로드, 실패 시 None)"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(f"tiktoken 인코딩 로드 실패 ({encoding_name}), 추정치 사용: {e}")
+        return None
+
+
+def count_tokens(text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+    """텍스트 토큰 수 (tiktoken 불가 시 추정)"""
+    if not text:
+        return 0
+    encoding = get_encoding(encoding_name)
+    if encoding is None:
+        return math.ceil(len(text) / FALLBACK_CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def split_by_tokens(
+    text: str,
+    max_tokens: int,
+    overlap: int = 0,
+    encoding_name: str = DEFAULT_ENCODING
+) -> list[str]:
+    """
+    텍스트를 max_tokens 단위 조각으로 분할 (문장 경계가 없는 긴 텍스트용)
+
+    Args:
+        text: 분할할 텍스트
+        max_tokens: 조각당 최대 토큰 수
+        overlap: 인접 조각 간 겹치는 토큰 수
+    """
+    if max_tokens <= overlap:
+        raise ValueError("max_tokens는 overlap보다 커야 합니다.")
+
+    encoding = get_encoding(encoding_name)
+    step = max_tokens - overlap
+    if encoding is None:
+        size = int(max_tokens * FALLBACK_CHARS_PER_TOKEN)
+        stride = int(step * FALLBACK_CHARS_PER_TOKEN)
+        return [text[i:i + size] for i in range(0, max(len(text) - size, 0) + stride, stride)]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    return [
+        encoding.decode(tokens[i:i + max_tokens])
+        for i in range(0, max(len(tokens) - max_tokens, 0) + step, step)
+    ]
+
+
+def truncate_to_tokens(
+    text: str,
+    max_tokens: int,
+    encoding_name: str = DEFAULT_ENCODING
+) -> str:
+    """max_tokens 이하로 자른 텍스트 (이미 이하이면 그대로)"""
+    if count_tokens(text, encoding_name) <= max_tokens:
+        return text
+    return split_by_tokens(text, max_tokens, encoding_name=encoding_name)[0]
@@ -0,0 +1,104 @@
+# =============================================================================
+# PRISM Writer Backend - Background Warmup
+# =============================================================================
+# 파일: backend/src/infrastructure/warmup.py
+# 역할: 무거운 의존성(numpy, asyncpg, openai, tiktoken BPE, 수집 파이프라인)을
+#       서버가 /health에 응답하기 시작한 뒤 백그라운드 스레드에서 미리 로드
+# 원칙:
+#   - main.py import 경로에는 HEAVY_MODULES를 두지 않음 (tests/test_import_budget.py가 검사)
+#   - 예열 전 첫 요청은 기존처럼 사용 시점 import로 동작 (예열은 지연만 앞당김)
+# =============================================================================
+
+from typing import Optional
+import asyncio
+import importlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# main.py import 시 로드되면 안 되는 서드파티 모듈 (requirements.txt의 무거운 의존성)
+HEAVY_MODULES = (
+    "asyncpg",
+    "langchain",
+    "langchain_community",
+    "langchain_openai",
+    "numpy",
+    "openai",
+    "pypdf",
+    "supabase",
+    "tiktoken",
+    "unstructured",
+)
+
+# 예열 대상 (요청 경로에서 처음 쓰이는 순서대로, 설치되지 않은 모듈은 건너뜀)
+WARMUP_MODULES = (
+    "numpy",
+    "src.infrastructure.mmr",
+    "src.infrastructure.pg_vector_store",
+    "src.infrastructure.local_vector_index",
+    "openai",
+)
+
+
+def warm_modules(modules: tuple[str, ...] = WARMUP_MODULES) -> dict[str, Optional[float]]:
+    """
+    모듈 import + 토크나이저 인코딩 로드 (동기, 스레드에서 실행)
+
+    Returns:
+        {모듈명: 소요 ms (설치되지 않았으면 None)}
+    """
+    from src.infrastructure.tokenizer import get_encoding
+
+    timings: dict[str, Optional[float]] = {}
+    for module in modules:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            logger.info(f"예열 건너뜀 ({module}): {e}")
+            timings[module] = None
+            continue
+        timings[module] = round((time.perf_counter() - started) * 1000, 3)
+
+    started = time.perf_counter()
+    get_encoding()
+    timings["tokenizer.encoding"] = round((time.perf_counter() - started) * 1000, 3)
+    return timings
+
+
+class BackgroundWarmup:
+    """
+    startup 이벤트에서 start() → 서버 기동을 막지 않고 예열
+
+    상태: pending → running → done (/health에 노출)
+    """
+
+    def __init__(self, modules: tuple[str, ...] = WARMUP_MODULES):
+        self.modules = modules
+        self.state = "pending"
+        self.timings: dict[str, Optional[float]] = {}
+        self.elapsed_ms: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        self.state = "running"
+        started = time.perf_counter()
+        try:
+            self.timings = await asyncio.to_thread(warm_modules, self.modules)
+        except Exception as e:
+            logger.warning(f"백그라운드 예열 실패: {e}")
+        self.elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+        self.state = "done"
+        logger.info(f"백그라운드 예열 완료: {self.elapsed_ms}ms {self.timings}")
+
+    async def wait(self) -> None:
+        if self._task is not None:
+            await self._task
+
+    def to_dict(self) -> dict:
+        return {"state": self.state, "elapsed_ms": self.elapsed_ms, "modules": self.timings}
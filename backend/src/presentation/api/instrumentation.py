@@ -0,0 +1,66 @@
+# =============================================================================
+# PRISM Writer Backend - Router Instrumentation
+# =============================================================================
+# 파일: backend/src/presentation/api/instrumentation.py
+# 역할: 라우터 핸들러 전체를 telemetry span("http.<라우트명>")으로 감싸는 APIRoute
+# 사용: router = APIRouter(route_class=TelemetryRoute)
+# =============================================================================
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+import uuid
+
+from src.infrastructure.telemetry import bind_run_id, telemetry, unbind_run_id
+
+
+class TelemetryRoute(APIRoute):
+    """
+    핸들러 span 측정 라우트
+
+    - 요청마다 새 run_id를 바인딩 → 유스케이스 span이 같은 run_id를 상속
+    - 5xx 응답은 예외가 없어도 실패(error_code="http_5xx")로 기록
+    - StreamingResponse는 본문 전송이 끝날 때 span 종료 (핸들러 반환 시점은 의미 없음)
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        step = f"http.{self.name}"
+
+        async def instrumented(request: Request) -> Response:
+            run_id = uuid.uuid4().hex
+            span_cm = telemetry.span(step, run_id=run_id)
+            span = span_cm.__enter__()
+            token = bind_run_id(run_id)
+            try:
+                response = await handler(request)
+            except BaseException as e:
+                span_cm.__exit__(type(e), e, e.__traceback__)
+                raise
+            finally:
+                unbind_run_id(token)
+
+            if response.status_code >= 500:
+                span.error_code = f"http_{response.status_code}"
+            if isinstance(response, StreamingResponse):
+                response.body_iterator = _finish_after(response.body_iterator, span_cm, run_id)
+            else:
+                span_cm.__exit__(None, None, None)
+            return response
+
+        return instrumented
+
+
+async def _finish_after(body_iterator, span_cm, run_id: str):
+    """스트리밍 본문을 그대로 전달하고 끝나면 span 종료 (본문 생성 중에도 run_id 유지)"""
+    token = bind_run_id(run_id)
+    try:
+        async for chunk in body_iterator:
+            yield chunk
+    except BaseException as e:
+        span_cm.__exit__(type(e), e, e.__traceback__)
+        raise
+    else:
+        span_cm.__exit__(None, None, None)
+    finally:
+        unbind_run_id(token)
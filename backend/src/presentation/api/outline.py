@@ -6,10 +6,26 @@
 # 경로: POST /v1/outline/generate
 # =============================================================================
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional
+import json
 import logging
+import os
+
+from src.application.use_cases.generate_outline import GenerateOutlineUseCase
+from src.infrastructure.admission import DEFAULT_TIER
+from src.infrastructure.cache import document_invalidation
+from src.infrastructure.context_packer import ContextPacker
+from src.infrastructure.heading_index import HeadingIndex
+from src.infrastructure.llm_gateway import LLMGateway
+from src.infrastructure.outline_cache import DocumentVersionLookup, OutlineResultCache
+from src.infrastructure.retriever import ChunkRetriever
+from src.infrastructure.supabase_utils import get_supabase_client
+from src.presentation.api.instrumentation import TelemetryRoute
+from src.infrastructure.telemetry import telemetry
+from src.presentation.api.responses import EncodedJSON, json_response
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -17,7 +33,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 # Router Definition
 # =============================================================================
-router = APIRouter()
+router = APIRouter(route_class=TelemetryRoute)
 
 # =============================================================================
 # Request/Response Models
@@ -51,6 +67,142 @@ class OutlineGenerateResponse(BaseModel):
     sources_used: int = Field(default=0, description="참조된 문서 수")
 
 
+# =============================================================================
+# Dependencies
+# =============================================================================
+# 프로세스 단위로 공유되는 목차 결과 캐시 (요청 간 재사용 + 동시 요청 병합)
+_outline_result_cache = OutlineResultCache()
+document_invalidation.register(
+    "outline_result", lambda document_id, _: _outline_result_cache.invalidate_document(document_id)
+)
+
+# 참고 자료 토큰 수 캐시를 요청 간 공유
+_context_packer = ContextPacker()
+
+# 캐시 키의 문서 버전 조회 (Supabase 클라이언트는 첫 요청에서 생성)
+_document_versions: Optional[DocumentVersionLookup] = None
+
+# 모든 목차 요청이 공유하는 LLM 게이트웨이 (동시성 상한 / tier별 속도 제한 / 서킷 브레이커)
+# 주석(시니어 개발자): 요청마다 게이트웨이를 만들면 세마포어·버킷·서킷이 요청 1건만 보게 되어 무의미
+_llm_gateway: Optional[LLMGateway] = None
+
+# 목차 요청이 공유하는 검색기 (주제 임베딩 캐시 → 시맨틱 캐시 조회, 참조 문서 구조 검색)
+_retriever: Optional[ChunkRetriever] = None
+
+
+def _create_semantic_cache():
+    """
+    유사 주제 목차 캐시 (OUTLINE_SEMANTIC_CACHE=1 일 때만, 기본 비활성)
+
+    주석(시니어 개발자): numpy를 쓰는 모듈이라 활성화된 경우에만 import (tests/test_import_budget.py)
+    """
+    if os.getenv("OUTLINE_SEMANTIC_CACHE", "0") != "1":
+        return None
+    from src.infrastructure.semantic_cache import DEFAULT_SIMILARITY_THRESHOLD, SemanticOutlineCache
+
+    cache = SemanticOutlineCache(
+        threshold=float(os.getenv("OUTLINE_SEMANTIC_CACHE_THRESHOLD", str(DEFAULT_SIMILARITY_THRESHOLD))),
+        max_size=int(os.getenv("OUTLINE_SEMANTIC_CACHE_SIZE", "1024"))
+    )
+    telemetry.add_collector(cache.render_prometheus)
+    document_invalidation.register("outline_semantic", lambda document_id, _: cache.invalidate_document(document_id))
+    return cache
+
+
+_semantic_outline_cache = _create_semantic_cache()
+
+
+def semantic_cache_stats() -> Optional[dict]:
+    """시맨틱 목차 캐시 적중률 / 유사도 분포 (비활성이면 None, /health용)"""
+    return _semantic_outline_cache.stats() if _semantic_outline_cache is not None else None
+
+
+def get_document_versions() -> DocumentVersionLookup:
+    """문서 버전 조회기 (문서가 바뀌면 목차 캐시 키가 바뀌도록)"""
+    global _document_versions
+    if _document_versions is None:
+        _document_versions = DocumentVersionLookup(get_supabase_client())
+    return _document_versions
+
+
+def get_llm_gateway() -> Optional[LLMGateway]:
+    """프로세스 공유 LLM 게이트웨이 (OPENAI_API_KEY 미설정 시 None → 기본 목차)"""
+    global _llm_gateway
+    if _llm_gateway is None and os.getenv("OPENAI_API_KEY"):
+        # openai는 import 비용이 커서 첫 요청에서 로드 (tests/test_import_budget.py)
+        from openai import AsyncOpenAI
+
+        _llm_gateway = LLMGateway(
+            AsyncOpenAI(),
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+        )
+    return _llm_gateway
+
+
+def _create_retriever(gateway: LLMGateway, vector_store=None) -> ChunkRetriever:
+    """검색기 생성 (asyncpg 검색 백엔드가 있으면 벡터/헤딩 조회를 풀로, 없으면 Supabase HTTP로)"""
+    client = get_supabase_client()
+    if vector_store is not None:
+        # asyncpg는 import 비용이 커서 풀이 있을 때만 로드 (tests/test_import_budget.py)
+        from src.infrastructure.pg_vector_store import AsyncpgHeadingIndex
+        heading_index = AsyncpgHeadingIndex(vector_store)
+    else:
+        heading_index = HeadingIndex(client) if client is not None else None
+    return ChunkRetriever(
+        supabase_client=client,
+        embedding_client=gateway.client,
+        vector_store=vector_store,
+        heading_index=heading_index
+    )
+
+
+def get_retriever(request: Request) -> Optional[ChunkRetriever]:
+    """
+    프로세스 공유 검색기 (LLM 게이트웨이의 OpenAI 클라이언트로 주제 임베딩, 게이트웨이가 없으면 None)
+
+    주석(시니어 개발자): 시맨틱 목차 캐시는 retriever.embed_query()로 주제를 임베딩하므로
+    검색기가 주입되지 않으면 조회도 저장도 하지 않음.
+    DATABASE_URL이 설정되면 main.py가 기동 시 만든 app.state.vector_store(AsyncpgVectorStore)를 사용하고,
+    풀이 바뀌면(기동/종료) 검색기를 다시 만듦
+    """
+    global _retriever
+    gateway = get_llm_gateway()
+    if gateway is None:
+        return None
+    vector_store = getattr(request.app.state, "vector_store", None)
+    if _retriever is None or _retriever.vector_store is not vector_store:
+        _retriever = _create_retriever(gateway, vector_store)
+        document_invalidation.register("outline_retriever", _retriever.invalidate_document)
+    return _retriever
+
+
+def get_generate_outline_use_case(
+    retriever: Optional[ChunkRetriever] = Depends(get_retriever)
+) -> GenerateOutlineUseCase:
+    """목차 생성 유스케이스 의존성 (retriever / LLM 클라이언트 주입 지점)"""
+    return GenerateOutlineUseCase(
+        retriever=retriever,
+        result_cache=_outline_result_cache,
+        document_versions=get_document_versions(),
+        llm_gateway=get_llm_gateway(),
+        context_packer=_context_packer,
+        semantic_cache=_semantic_outline_cache
+    )
+
+
+def _request_identity(request: Request) -> tuple[int, Optional[str]]:
+    """AdmissionMiddleware가 확인한 (tier, user_id) - 신뢰할 수 없는 요청은 (DEFAULT_TIER, None)"""
+    return (
+        getattr(request.state, "user_tier", DEFAULT_TIER),
+        getattr(request.state, "user_id", None),
+    )
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Server-Sent Events 형식 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 # =============================================================================
 # API Endpoints
 # =============================================================================
@@ -60,41 +212,35 @@ class OutlineGenerateResponse(BaseModel):
     summary="목차 생성",
     description="주제와 참조 문서를 기반으로 AI가 목차를 생성합니다."
 )
-async def generate_outline(request: OutlineGenerateRequest):
+async def generate_outline(
+    request: OutlineGenerateRequest,
+    http_request: Request,
+    use_case: GenerateOutlineUseCase = Depends(get_generate_outline_use_case)
+):
     """
     목차 생성 API 엔드포인트
     
-    1. 입력 주제 검증
+    1. 결과 캐시 조회 (동일 요청 재사용 + 동시 요청 병합, 선택적으로 유사 주제 캐시)
     2. (선택) 참조 문서에서 구조 정보 검색
     3. LLM을 통한 목차 생성
     4. 결과 반환
     """
     try:
         logger.info(f"목차 생성 요청: topic='{request.topic}', docs={len(request.document_ids)}")
-        
-        # ---------------------------------------------------------------------
-        # TODO: 실제 RAG + LLM 연동 (Phase 3에서 구현)
-        # 현재는 더미 데이터 반환
-        # ---------------------------------------------------------------------
-        
-        # 더미 목차 생성 (주제 기반)
-        dummy_outline = [
-            OutlineItem(title="서론", depth=1),
-            OutlineItem(title="배경 및 목적", depth=2),
-            OutlineItem(title="연구 범위", depth=2),
-            OutlineItem(title="본론", depth=1),
-            OutlineItem(title=f"{request.topic}의 핵심 개념", depth=2),
-            OutlineItem(title="주요 방법론", depth=2),
-            OutlineItem(title="사례 분석", depth=2),
-            OutlineItem(title="결론", depth=1),
-            OutlineItem(title="요약", depth=2),
-            OutlineItem(title="향후 전망", depth=2),
-        ]
-        
-        # max_depth 필터링
+
+        tier, user_id = _request_identity(http_request)
+        items = await use_case.execute(
+            topic=request.topic,
+            doc_ids=request.document_ids,
+            max_depth=request.max_depth,
+            tier=tier,
+            user_id=user_id
+        )
+
+        # max_depth 필터링 (LLM이 요청보다 깊은 항목을 만들 수 있음)
         filtered_outline = [
-            item for item in dummy_outline 
-            if item.depth <= request.max_depth
+            OutlineItem(**item.to_dict()) for item in items
+            if 1 <= item.depth <= request.max_depth
         ]
         
         logger.info(f"목차 생성 완료: {len(filtered_outline)}개 항목")
@@ -113,50 +259,113 @@ async def generate_outline(request: OutlineGenerateRequest):
         )
 
 
+@router.post(
+    "/generate/stream",
+    summary="목차 생성 (스트리밍)",
+    description=(
+        "목차 항목이 생성되는 즉시 Server-Sent Events로 전송합니다. "
+        "이벤트: item(목차 항목), done(요약), error(오류)"
+    ),
+    response_class=StreamingResponse
+)
+async def generate_outline_stream(
+    request: OutlineGenerateRequest,
+    http_request: Request,
+    use_case: GenerateOutlineUseCase = Depends(get_generate_outline_use_case)
+):
+    """
+    목차 생성 스트리밍 API 엔드포인트
+
+    1. LLM 토큰을 증분 JSON 파서로 처리
+    2. 항목 객체가 닫히는 즉시 item 이벤트 전송 (max_depth 필터 동일 적용)
+    3. 마지막에 done 이벤트로 요약 전송
+    """
+    logger.info(f"목차 스트리밍 요청: topic='{request.topic}', docs={len(request.document_ids)}")
+
+    tier, user_id = _request_identity(http_request)
+
+    async def event_stream():
+        count = 0
+        try:
+            async for item in use_case.execute_stream(
+                topic=request.topic,
+                doc_ids=request.document_ids,
+                max_depth=request.max_depth,
+                tier=tier,
+                user_id=user_id
+            ):
+                count += 1
+                yield _sse_event("item", item.to_dict())
+
+            yield _sse_event("done", {
+                "topic": request.topic,
+                "count": count,
+                "sources_used": len(request.document_ids),
+            })
+            logger.info(f"목차 스트리밍 완료: {count}개 항목")
+
+        except Exception as e:
+            logger.error(f"목차 스트리밍 실패: {str(e)}")
+            yield _sse_event("error", {"detail": f"목차 생성 중 오류가 발생했습니다: {str(e)}"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# =============================================================================
+# Outline Templates (정적 데이터 - 프로세스 시작 시 1회 인코딩)
+# =============================================================================
+OUTLINE_TEMPLATES = [
+    {
+        "id": "academic",
+        "name": "학술 논문",
+        "outline": [
+            {"title": "서론", "depth": 1},
+            {"title": "문헌 검토", "depth": 1},
+            {"title": "연구 방법", "depth": 1},
+            {"title": "결과", "depth": 1},
+            {"title": "논의", "depth": 1},
+            {"title": "결론", "depth": 1},
+        ]
+    },
+    {
+        "id": "blog",
+        "name": "블로그 포스트",
+        "outline": [
+            {"title": "도입부", "depth": 1},
+            {"title": "핵심 내용", "depth": 1},
+            {"title": "예시/사례", "depth": 2},
+            {"title": "마무리", "depth": 1},
+        ]
+    },
+    {
+        "id": "report",
+        "name": "보고서",
+        "outline": [
+            {"title": "개요", "depth": 1},
+            {"title": "현황 분석", "depth": 1},
+            {"title": "문제점 및 과제", "depth": 1},
+            {"title": "해결 방안", "depth": 1},
+            {"title": "기대 효과", "depth": 1},
+            {"title": "결론", "depth": 1},
+        ]
+    },
+]
+
+_templates_json = EncodedJSON.encode({"templates": OUTLINE_TEMPLATES})
+
+
 @router.get(
     "/templates",
     summary="목차 템플릿 목록",
-    description="사전 정의된 목차 템플릿 목록을 반환합니다."
+    description="사전 정의된 목차 템플릿 목록을 반환합니다. ETag / If-None-Match를 지원합니다 (변경 없으면 304).",
+    responses={304: {"description": "변경 없음 (If-None-Match 일치)"}}
 )
-async def get_outline_templates():
+async def get_outline_templates(request: Request):
     """
-    목차 템플릿 목록 조회
+    목차 템플릿 목록 조회 (미리 인코딩된 본문 그대로 반환)
     """
-    templates = [
-        {
-            "id": "academic",
-            "name": "학술 논문",
-            "outline": [
-                {"title": "서론", "depth": 1},
-                {"title": "문헌 검토", "depth": 1},
-                {"title": "연구 방법", "depth": 1},
-                {"title": "결과", "depth": 1},
-                {"title": "논의", "depth": 1},
-                {"title": "결론", "depth": 1},
-            ]
-        },
-        {
-            "id": "blog",
-            "name": "블로그 포스트",
-            "outline": [
-                {"title": "도입부", "depth": 1},
-                {"title": "핵심 내용", "depth": 1},
-                {"title": "예시/사례", "depth": 2},
-                {"title": "마무리", "depth": 1},
-            ]
-        },
-        {
-            "id": "report",
-            "name": "보고서",
-            "outline": [
-                {"title": "개요", "depth": 1},
-                {"title": "현황 분석", "depth": 1},
-                {"title": "문제점 및 과제", "depth": 1},
-                {"title": "해결 방안", "depth": 1},
-                {"title": "기대 효과", "depth": 1},
-                {"title": "결론", "depth": 1},
-            ]
-        },
-    ]
-    
-    return {"templates": templates}
+    return json_response(request, _templates_json, cache_control="public, max-age=300")
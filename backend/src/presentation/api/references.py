@@ -6,12 +6,29 @@
 # 경로: /v1/drafts/{draft_id}/references
 # =============================================================================
 
-from fastapi import APIRouter, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 import logging
-import uuid
+import os
+
+from src.infrastructure.cache import LRUCache, document_invalidation
+from src.infrastructure.chunk_content import ChunkContentLoader
+from src.infrastructure.references_repository import (
+    DraftNotFoundError,
+    DuplicateReferenceError,
+    create_references_repository,
+)
+from src.infrastructure.supabase_utils import get_supabase_client
+from src.presentation.api.instrumentation import TelemetryRoute
+from src.presentation.api.responses import (
+    EncodedJSON,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    json_response,
+)
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -19,7 +36,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 # Router Definition
 # =============================================================================
-router = APIRouter()
+router = APIRouter(route_class=TelemetryRoute)
 
 # =============================================================================
 # Request/Response Models
@@ -59,11 +76,108 @@ class ReferenceWithContentResponse(ReferenceResponse):
     chunk_source: Optional[str] = Field(None, description="청크 출처 문서명")
 
 
+class ReferenceBatchCreateRequest(BaseModel):
+    """참조 일괄 생성 요청 모델"""
+    references: list[ReferenceCreateRequest] = Field(
+        ..., min_length=1, max_length=500, description="생성할 참조 리스트"
+    )
+
+
+class ReferenceBatchDeleteRequest(BaseModel):
+    """참조 일괄 삭제 요청 모델"""
+    reference_ids: list[str] = Field(
+        ..., min_length=1, max_length=500, description="삭제할 참조 ID 리스트"
+    )
+
+
+class ReferenceBatchDeleteResponse(BaseModel):
+    """참조 일괄 삭제 응답 모델"""
+    deleted: int = Field(..., description="삭제된 참조 수")
+
+
+class ParagraphShiftRequest(BaseModel):
+    """문단 편집(삽입/삭제) 반영 요청 모델"""
+    start_index: int = Field(..., ge=0, description="편집 시작 문단 인덱스")
+    delete_count: int = Field(default=0, ge=0, description="start_index부터 삭제된 문단 수")
+    insert_count: int = Field(default=0, ge=0, description="start_index에 삽입된 문단 수")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "start_index": 2,
+                "delete_count": 0,
+                "insert_count": 1
+            }
+        }
+
+
+class ParagraphShiftResponse(BaseModel):
+    """문단 편집 반영 응답 모델"""
+    deleted: int = Field(..., description="삭제된 문단에 있던 참조 수")
+    shifted: int = Field(..., description="위치가 이동된 참조 수")
+
+
 # =============================================================================
-# In-memory Storage (임시 - 추후 DB 연동)
+# Repository (REFERENCES_BACKEND: sqlite(기본) / memory / supabase)
 # =============================================================================
-# 실제 구현에서는 Supabase의 draft_references 테이블 사용
-_references_store: dict[str, list[dict]] = {}
+# 주석(시니어 개발자): SQLite 파일은 import 시점이 아니라 첫 요청에서 열도록 지연 생성
+_references_repository = None
+
+
+# 청크 내용 조회기 (Supabase 클라이언트와 함께 첫 요청에서 생성, 캐시는 프로세스 공유)
+_chunk_content_loader: Optional[ChunkContentLoader] = None
+
+MISSING_CHUNK_CONTENT = "[청크 내용을 찾을 수 없습니다]"
+
+# 참조 목록 페이지 응답 캐시: (draft_id, 저장소 버전, cursor, limit, user_id) → (EncodedJSON, 다음 커서)
+# (청크 내용은 요청자 소유 문서만 채우므로 같은 글이라도 요청자별로 따로 보관)
+# 버전이 키에 포함되므로 참조 변경 시 자동으로 새 키 / TTL은 청크 캐시와 같은 이유(본문·출처 변경 반영 상한)
+# 주석(시니어 개발자): 편집기 폴링 대부분은 이 캐시 + If-None-Match로 청크 조회·직렬화 없이 304
+_reference_pages = LRUCache(max_size=2048, ttl_seconds=60)
+
+
+def _invalidate_document(document_id: str, user_id: Optional[str] = None) -> int:
+    """재수집된 문서의 청크 내용 캐시 + 그 청크를 담은 참조 페이지 제거"""
+    removed = _reference_pages.invalidate_tag(("doc", document_id))
+    if _chunk_content_loader is not None:
+        removed += _chunk_content_loader.invalidate_document(document_id)
+    return removed
+
+
+document_invalidation.register("references", _invalidate_document)
+
+
+def get_references_repository():
+    """참조 저장소 의존성 (프로세스당 1개, 연결 재사용)"""
+    global _references_repository
+    if _references_repository is None:
+        backend = os.getenv("REFERENCES_BACKEND", "sqlite")
+        # supabase 패키지 import 비용이 있으므로 supabase 백엔드일 때만 클라이언트 생성
+        supabase_client = get_supabase_client() if backend == "supabase" else None
+        _references_repository = create_references_repository(backend, supabase_client=supabase_client)
+    return _references_repository
+
+
+def check_references_backend() -> None:
+    """
+    기동 시 참조 저장소 설정 확인 (main.py startup)
+
+    sqlite는 첫 요청에서 파일을 열도록 그대로 두고, 그 외 백엔드는 미리 생성하여
+    잘못된 REFERENCES_BACKEND / Supabase 설정 누락을 요청마다 500이 아니라 기동 실패로 드러냄
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드 / supabase 백엔드인데 클라이언트 설정 없음
+    """
+    if os.getenv("REFERENCES_BACKEND", "sqlite") != "sqlite":
+        get_references_repository()
+
+
+def get_chunk_content_loader() -> ChunkContentLoader:
+    """청크 내용 조회기 의존성 (프로세스당 1개, 청크 캐시 공유)"""
+    global _chunk_content_loader
+    if _chunk_content_loader is None:
+        _chunk_content_loader = ChunkContentLoader(get_supabase_client())
+    return _chunk_content_loader
 
 # =============================================================================
 # API Endpoints
@@ -77,76 +191,164 @@ _references_store: dict[str, list[dict]] = {}
 )
 async def create_reference(
     draft_id: str = Path(..., description="글 ID"),
-    request: ReferenceCreateRequest = None
+    request: ReferenceCreateRequest = None,
+    repository=Depends(get_references_repository)
 ):
     """
     참조 추가 API
     
-    1. 중복 체크 (같은 청크 + 같은 문단)
+    1. 중복 체크 (같은 청크 + 같은 문단, 해시 인덱스 O(1))
     2. 참조 생성 및 저장
     3. 결과 반환
     """
     logger.info(f"참조 추가: draft={draft_id}, chunk={request.chunk_id}, para={request.paragraph_index}")
     
-    # 초기화
-    if draft_id not in _references_store:
-        _references_store[draft_id] = []
-    
-    # 중복 체크
-    existing = [
-        ref for ref in _references_store[draft_id]
-        if ref["chunk_id"] == request.chunk_id 
-        and ref["paragraph_index"] == request.paragraph_index
-    ]
-    if existing:
+    try:
+        new_reference = await repository.create(draft_id, request.model_dump())
+    except DuplicateReferenceError:
         raise HTTPException(
             status_code=409,
             detail="해당 문단에 이미 동일한 참조가 존재합니다."
         )
     
-    # 참조 생성
-    new_reference = {
-        "id": str(uuid.uuid4()),
-        "draft_id": draft_id,
-        "chunk_id": request.chunk_id,
-        "paragraph_index": request.paragraph_index,
-        "reference_type": request.reference_type,
-        "created_at": datetime.now()
-    }
-    
-    _references_store[draft_id].append(new_reference)
-    
     logger.info(f"참조 추가 완료: id={new_reference['id']}")
     
     return ReferenceResponse(**new_reference)
 
 
+@router.post(
+    "/drafts/{draft_id}/references/batch",
+    response_model=list[ReferenceResponse],
+    status_code=201,
+    summary="참조 일괄 추가",
+    description="여러 참조를 한 번의 요청으로 추가합니다. 하나라도 중복이면 전체가 취소됩니다."
+)
+async def create_references_batch(
+    draft_id: str = Path(..., description="글 ID"),
+    request: ReferenceBatchCreateRequest = None,
+    repository=Depends(get_references_repository)
+):
+    """
+    참조 일괄 추가 API (DB에서는 단일 multi-row INSERT)
+    """
+    logger.info(f"참조 일괄 추가: draft={draft_id}, count={len(request.references)}")
+    
+    try:
+        created = await repository.create_many(
+            draft_id, [item.model_dump() for item in request.references]
+        )
+    except DuplicateReferenceError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "message": "이미 동일한 참조가 존재하는 문단이 있습니다.",
+                "conflicts": [
+                    {"chunk_id": chunk_id, "paragraph_index": paragraph_index}
+                    for chunk_id, paragraph_index in e.conflicts
+                ],
+            }
+        )
+    
+    return [ReferenceResponse(**reference) for reference in created]
+
+
 @router.get(
     "/drafts/{draft_id}/references",
     response_model=list[ReferenceWithContentResponse],
     summary="참조 목록 조회",
-    description="글에 연결된 모든 참조 목록을 조회합니다."
+    description=(
+        "글에 연결된 참조 목록을 문단 순서로 조회합니다. "
+        "limit을 주면 페이지 단위로 반환하고 다음 페이지 커서를 X-Next-Cursor 헤더로 전달합니다. "
+        "ETag / If-None-Match를 지원합니다 (변경 없으면 304)."
+    ),
+    responses={304: {"description": "변경 없음 (If-None-Match 일치)"}}
 )
 async def get_references(
-    draft_id: str = Path(..., description="글 ID")
+    request: Request,
+    draft_id: str = Path(..., description="글 ID"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="페이지 크기 (없으면 전체)"),
+    repository=Depends(get_references_repository),
+    chunk_loader=Depends(get_chunk_content_loader)
 ):
     """
     참조 목록 조회 API
-    """
-    logger.info(f"참조 목록 조회: draft={draft_id}")
     
-    references = _references_store.get(draft_id, [])
-    
-    # 청크 내용 추가 (실제로는 DB에서 조회)
+    1. 저장소 버전이 같으면 캐시된 인코딩 본문 재사용 (청크 조회/직렬화 생략)
+    2. 참조된 청크 내용은 고유 chunk_id 기준 단일 쿼리(+ 청크 캐시)로 조회
+    3. 응답 모델 생성 없이 바로 JSON 인코딩, 본문 해시 ETag
+    """
+    after = None
+    if cursor is not None:
+        try:
+            paragraph_index, reference_id = decode_cursor(cursor)
+            after = (int(paragraph_index), str(reference_id))
+        except (InvalidCursorError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
+    user_id = getattr(request.state, "user_id", None)
+    version = await repository.version(draft_id)
+    cache_key = (draft_id, version, cursor, limit, user_id)
+    cached = _reference_pages.get(cache_key) if version is not None else None
+    if cached is None:
+        encoded, next_cursor, document_ids = await _build_reference_page(
+            repository, chunk_loader, draft_id, after, limit, user_id
+        )
+        cached = (encoded, next_cursor)
+        if version is not None:
+            # 문서 태그: 재수집 시 해당 문서 청크를 담은 페이지만 제거
+            _reference_pages.set(cache_key, cached, tags=[("doc", doc_id) for doc_id in document_ids])
+
+    encoded, next_cursor = cached
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return json_response(request, encoded, headers=headers)
+
+
+async def _build_reference_page(
+    repository,
+    chunk_loader,
+    draft_id: str,
+    after: Optional[tuple[int, str]],
+    limit: Optional[int],
+    user_id: Optional[str]
+) -> tuple[EncodedJSON, Optional[str], set[str]]:
+    """
+    참조 페이지 + 청크 내용 조회 후 인코딩 (다음 페이지 유무는 limit + 1개 조회로 판단)
+
+    청크 내용은 user_id 소유 문서의 것만 채움 (그 외/익명 요청은 MISSING_CHUNK_CONTENT)
+
+    Returns:
+        (인코딩 본문, 다음 커서, 페이지에 포함된 청크의 문서 ID 집합)
+    """
+    logger.info(f"참조 목록 조회: draft={draft_id}, limit={limit}")
+
+    references = await repository.list_page(draft_id, after, None if limit is None else limit + 1)
+    next_cursor = None
+    if limit is not None and len(references) > limit:
+        references = references[:limit]
+        last = references[-1]
+        next_cursor = encode_cursor([last["paragraph_index"], last["id"]])
+
+    try:
+        chunks = await chunk_loader.get_many((ref["chunk_id"] for ref in references), user_id)
+    except Exception as e:
+        logger.error(f"청크 내용 조회 실패: draft={draft_id}, error={e}")
+        raise HTTPException(status_code=503, detail="청크 내용 조회 중 오류가 발생했습니다.")
     result = []
     for ref in references:
-        result.append(ReferenceWithContentResponse(
-            **ref,
-            chunk_content="[청크 내용 - DB 연동 후 실제 내용으로 대체됨]",
-            chunk_source="문서명.pdf (p.12)"
-        ))
-    
-    return result
+        chunk = chunks.get(ref["chunk_id"])
+        result.append({
+            "id": ref["id"],
+            "draft_id": ref["draft_id"],
+            "chunk_id": ref["chunk_id"],
+            "paragraph_index": ref["paragraph_index"],
+            "reference_type": ref["reference_type"],
+            "created_at": ref["created_at"],
+            "chunk_content": chunk["content"] if chunk else MISSING_CHUNK_CONTENT,
+            "chunk_source": chunk["source"] if chunk else None,
+        })
+    document_ids = {chunk["document_id"] for chunk in chunks.values() if chunk.get("document_id")}
+    return EncodedJSON.encode(result), next_cursor, document_ids
 
 
 @router.delete(
@@ -157,23 +359,73 @@ async def get_references(
 )
 async def delete_reference(
     draft_id: str = Path(..., description="글 ID"),
-    reference_id: str = Path(..., description="참조 ID")
+    reference_id: str = Path(..., description="참조 ID"),
+    repository=Depends(get_references_repository)
 ):
     """
     참조 삭제 API
     """
     logger.info(f"참조 삭제: draft={draft_id}, ref={reference_id}")
     
-    if draft_id not in _references_store:
+    try:
+        deleted = await repository.delete(draft_id, reference_id)
+    except DraftNotFoundError:
         raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
     
-    original_len = len(_references_store[draft_id])
-    _references_store[draft_id] = [
-        ref for ref in _references_store[draft_id]
-        if ref["id"] != reference_id
-    ]
-    
-    if len(_references_store[draft_id]) == original_len:
+    if not deleted:
         raise HTTPException(status_code=404, detail="참조를 찾을 수 없습니다.")
     
     return None
+
+
+@router.post(
+    "/drafts/{draft_id}/references/batch-delete",
+    response_model=ReferenceBatchDeleteResponse,
+    summary="참조 일괄 삭제",
+    description="여러 참조를 한 번의 요청으로 삭제합니다. 존재하지 않는 ID는 무시됩니다."
+)
+async def delete_references_batch(
+    draft_id: str = Path(..., description="글 ID"),
+    request: ReferenceBatchDeleteRequest = None,
+    repository=Depends(get_references_repository)
+):
+    """
+    참조 일괄 삭제 API (DB에서는 단일 DELETE ... IN)
+    """
+    logger.info(f"참조 일괄 삭제: draft={draft_id}, count={len(request.reference_ids)}")
+    
+    try:
+        deleted = await repository.delete_many(draft_id, request.reference_ids)
+    except DraftNotFoundError:
+        raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
+    
+    return ReferenceBatchDeleteResponse(deleted=deleted)
+
+
+@router.post(
+    "/drafts/{draft_id}/references/shift",
+    response_model=ParagraphShiftResponse,
+    summary="문단 편집 반영",
+    description="문단 삽입/삭제에 맞춰 이후 참조의 문단 인덱스를 한 번에 이동합니다. 삭제된 문단의 참조는 함께 삭제됩니다."
+)
+async def shift_paragraphs(
+    draft_id: str = Path(..., description="글 ID"),
+    request: ParagraphShiftRequest = None,
+    repository=Depends(get_references_repository)
+):
+    """
+    문단 이동 API (DB에서는 shift_draft_paragraphs 범위 UPDATE 1회)
+    """
+    logger.info(
+        f"문단 편집 반영: draft={draft_id}, start={request.start_index}, "
+        f"delete={request.delete_count}, insert={request.insert_count}"
+    )
+    
+    try:
+        result = await repository.shift_paragraphs(
+            draft_id, request.start_index, request.delete_count, request.insert_count
+        )
+    except DraftNotFoundError:
+        raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
+    
+    return ParagraphShiftResponse(**result)
@@ -0,0 +1,120 @@
+# =============================================================================
+# PRISM Writer Backend - Fast JSON / ETag Responses
+# =============================================================================
+# 파일: backend/src/presentation/api/responses.py
+# 역할: 폴링이 잦은 조회 API용 응답 헬퍼
+#   - orjson 직렬화 (미설치 시 표준 json으로 대체), Pydantic 모델 생성 생략
+#   - 본문 해시 기반 강한 ETag + If-None-Match → 304
+#   - 한 번 인코딩한 정적 본문(bytes) 재사용
+# =============================================================================
+
+from functools import lru_cache
+from typing import Any, Optional
+import base64
+import binascii
+import hashlib
+import json
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+@lru_cache(maxsize=1)
+def _orjson():
+    """orjson 모듈 (미설치 시 None)"""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
+
+
+def _default(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입입니다: {type(value).__name__}")
+
+
+def dumps(payload: Any) -> bytes:
+    """JSON 직렬화 (UTF-8 bytes, datetime은 ISO 8601)"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+
+def strong_etag(body: bytes) -> str:
+    """본문 바이트 기준 강한 ETag"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (RFC 9110 약한 비교: W/ 접두사 무시, "*" 허용)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+class EncodedJSON:
+    """직렬화된 본문 + ETag (요청마다 다시 인코딩하지 않도록 보관)"""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = strong_etag(body)
+
+    @classmethod
+    def encode(cls, payload: Any) -> "EncodedJSON":
+        return cls(dumps(payload))
+
+
+def json_response(
+    request: Request,
+    encoded: EncodedJSON,
+    cache_control: str = "no-cache",
+    headers: Optional[dict] = None
+) -> Response:
+    """
+    ETag 응답 (If-None-Match 일치 시 본문 없는 304)
+
+    Args:
+        cache_control: 기본 no-cache = 캐시하되 매번 재검증 (폴링 시 304)
+        headers: 추가 응답 헤더
+    """
+    response_headers = {"ETag": encoded.etag, "Cache-Control": cache_control, **(headers or {})}
+    if etag_matches(request.headers.get("if-none-match"), encoded.etag):
+        return Response(status_code=304, headers=response_headers)
+    return Response(encoded.body, media_type="application/json", headers=response_headers)
+
+
+# =============================================================================
+# Cursor
+# =============================================================================
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 페이지 커서"""
+
+
+def encode_cursor(values: list) -> str:
+    """키셋 값 → 불투명 커서 (URL-safe base64)"""
+    return base64.urlsafe_b64encode(dumps(values)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """
+    Raises:
+        InvalidCursorError: 형식이 잘못된 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursorError(cursor) from e
+    if not isinstance(values, list):
+        raise InvalidCursorError(cursor)
+    return values
@@ -0,0 +1,142 @@
+# =============================================================================
+# PRISM Writer Backend - Admission Lane Tests
+# =============================================================================
+# 파일: backend/tests/test_admission.py
+# 역할: AdmissionLane 슬롯 인계(FIFO), 대기열/마감 거절, 대기 중 취소 시
+#       슬롯이 새거나 취소된 요청에 넘어가지 않는지 검증
+# =============================================================================
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.admission import AdmissionLane, AdmissionRejected
+
+
+def _lane(capacity: int = 1, max_queue: int = 8, service_seconds: float = 0.001) -> AdmissionLane:
+    return AdmissionLane(capacity, max_queue, service_seconds)
+
+
+def test_release_hands_slot_to_waiters_in_fifo_order():
+    lane = _lane()
+    order = []
+
+    async def worker(name: str):
+        await lane.acquire(deadline=1.0)
+        order.append(name)
+        await asyncio.sleep(0.005)
+        lane.release(0.005)
+
+    async def scenario():
+        await lane.acquire(deadline=1.0)
+        tasks = [asyncio.ensure_future(worker(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        assert lane.queued == 3 and lane.in_flight == 1
+
+        lane.release(None)
+        # 인계 중에는 in_flight가 줄지 않음 (새 요청이 끼어들 수 없음)
+        assert lane.in_flight == 1
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    assert order == ["a", "b", "c"]
+    assert lane.in_flight == 0 and lane.queued == 0
+    assert lane.admitted == 4
+
+
+def test_rejects_when_queue_is_full():
+    lane = _lane(max_queue=1)
+
+    async def scenario():
+        await lane.acquire(deadline=1.0)
+        waiting = asyncio.ensure_future(lane.acquire(deadline=1.0))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected):
+            await lane.acquire(deadline=1.0)
+
+        lane.release(None)
+        await waiting
+        lane.release(None)
+
+    asyncio.run(scenario())
+    assert lane.rejected == 1
+    assert lane.in_flight == 0
+
+
+def test_rejects_when_expected_wait_exceeds_deadline():
+    lane = _lane(service_seconds=10.0)
+
+    async def scenario():
+        await lane.acquire(deadline=1.0)
+        with pytest.raises(AdmissionRejected):
+            await lane.acquire(deadline=1.0)
+
+    asyncio.run(scenario())
+    assert lane.queued == 0 and lane.rejected == 1
+
+
+def test_deadline_expiry_removes_waiter():
+    lane = _lane()
+
+    async def scenario():
+        await lane.acquire(deadline=1.0)
+        with pytest.raises(AdmissionRejected):
+            await lane.acquire(deadline=0.02)
+        assert lane.queued == 0
+
+        lane.release(None)
+
+    asyncio.run(scenario())
+    assert lane.in_flight == 0
+
+
+def test_cancelled_waiter_is_skipped():
+    lane = _lane()
+
+    async def scenario():
+        await lane.acquire(deadline=1.0)
+        cancelled = asyncio.ensure_future(lane.acquire(deadline=1.0))
+        survivor = asyncio.ensure_future(lane.acquire(deadline=1.0))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert lane.queued == 1
+
+        lane.release(None)
+        await survivor
+        assert lane.in_flight == 1
+        lane.release(None)
+
+    asyncio.run(scenario())
+    assert lane.in_flight == 0
+
+
+def test_cancel_after_hand_off_does_not_leak_slot():
+    lane = _lane()
+    acquired = []
+
+    async def worker(name: str):
+        await lane.acquire(deadline=1.0)
+        acquired.append(name)
+        try:
+            await asyncio.sleep(0.005)
+        finally:
+            lane.release(None)
+
+    async def scenario():
+        await lane.acquire(deadline=1.0)
+        first = asyncio.ensure_future(worker("first"))
+        second = asyncio.ensure_future(worker("second"))
+        await asyncio.sleep(0)
+
+        # 슬롯을 넘겨받은 직후(재개 전) 취소 → 슬롯은 반환되거나 정상 사용 후 반환되어야 함
+        lane.release(None)
+        first.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert "second" in acquired
+    assert lane.in_flight == 0 and lane.queued == 0
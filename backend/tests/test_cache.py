@@ -0,0 +1,177 @@
+# =============================================================================
+# PRISM Writer Backend - In-process Cache Tests
+# =============================================================================
+# 파일: backend/tests/test_cache.py
+# 역할: LRUCache(축출/TTL/태그 무효화), SingleFlight(병합/예외 공유/취소 격리),
+#       DocumentInvalidation(등록된 캐시 일괄 무효화) 동작 검증
+# =============================================================================
+
+import asyncio
+
+import pytest
+
+from src.infrastructure import cache as cache_module
+from src.infrastructure.cache import DocumentInvalidation, LRUCache, SingleFlight
+
+
+# =============================================================================
+# LRUCache
+# =============================================================================
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_lru_expires_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(max_size=10, ttl_seconds=5)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl_seconds=1)
+
+    now[0] += 2
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+
+    now[0] += 5
+    assert cache.get("default", "missing") == "missing"
+    assert cache.stats.expirations == 2
+    assert len(cache) == 0
+
+
+def test_lru_invalidate_tag_removes_only_tagged_entries():
+    cache = LRUCache(max_size=10)
+    cache.set("x", 1, tags=[("doc", "d1")])
+    cache.set("y", 2, tags=[("doc", "d1"), ("doc", "d2")])
+    cache.set("z", 3, tags=[("doc", "d2")])
+
+    assert cache.invalidate_tag(("doc", "d1")) == 2
+    assert "x" not in cache and "y" not in cache
+    assert cache.get("z") == 3
+    # y의 d2 태그 인덱스도 정리되어 z만 남음
+    assert cache.invalidate_tag(("doc", "d2")) == 1
+    assert cache.invalidate_tag(("doc", "unknown")) == 0
+
+
+def test_lru_overwrite_replaces_tags():
+    cache = LRUCache(max_size=10)
+    cache.set("k", 1, tags=["old"])
+    cache.set("k", 2, tags=["new"])
+
+    assert cache.invalidate_tag("old") == 0
+    assert cache.get("k") == 2
+    assert cache.invalidate_tag("new") == 1
+
+
+def test_lru_stats_count_hits_and_misses():
+    cache = LRUCache(max_size=10)
+    cache.set("k", 1)
+    cache.get("k")
+    cache.get("missing")
+    assert "k" in cache  # __contains__는 통계에 반영하지 않음
+
+    stats = cache.stats.to_dict()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_lru_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0)
+
+
+# =============================================================================
+# SingleFlight
+# =============================================================================
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def scenario():
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(10)))
+        assert results == ["result"] * 10
+        assert flight.inflight == 0
+        # 완료 후에는 새 작업 시작
+        assert await flight.do("key", work) == "result"
+
+    asyncio.run(scenario())
+    assert calls == 2
+    assert (flight.started, flight.coalesced) == (2, 9)
+
+
+def test_single_flight_shares_exception_and_forgets_key():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def scenario():
+        results = await asyncio.gather(*(flight.do("key", fail) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.inflight == 0
+
+    asyncio.run(scenario())
+    assert flight.started == 1
+
+
+def test_single_flight_cancelled_caller_does_not_cancel_others():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return 42
+
+    async def scenario():
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 42
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(scenario())
+
+
+# =============================================================================
+# DocumentInvalidation
+# =============================================================================
+def test_document_invalidation_runs_all_handlers():
+    registry = DocumentInvalidation()
+    cache = LRUCache(max_size=10)
+    cache.set("page", "v1", tags=[("doc", "d1")])
+    seen = []
+
+    async def async_handler(document_id, user_id):
+        seen.append((document_id, user_id))
+        return 3
+
+    def failing_handler(document_id, user_id):
+        raise RuntimeError("boom")
+
+    registry.register("pages", lambda document_id, user_id: cache.invalidate_tag(("doc", document_id)))
+    registry.register("async", async_handler)
+    registry.register("broken", failing_handler)
+    registry.register("removed", async_handler)
+    registry.unregister("removed")
+
+    removed = asyncio.run(registry.notify("d1", "u1"))
+
+    assert removed == {"pages": 1, "async": 3}
+    assert seen == [("d1", "u1")]
+    assert "page" not in cache
@@ -0,0 +1,263 @@
+# =============================================================================
+# PRISM Writer Backend - Chunk Classifier Parity Tests
+# =============================================================================
+# 파일: backend/tests/test_chunk_classifier.py
+# 역할: 파이썬 분류기(chunk_classifier)가 SQL detect_chunk_type()(migration 030)과
+#       같은 결과를 내는지 검증
+# 실제 DB 비교: DATABASE_URL이 설정되어 있으면 같은 사례/무작위 코퍼스를
+#              PostgreSQL의 detect_chunk_type()으로도 분류 (미설정 시 skip)
+# =============================================================================
+
+import asyncio
+import os
+import random
+import re
+
+import pytest
+
+from src.infrastructure.chunk_classifier import (
+    _PG_SPACE,
+    classify_chunk_type,
+    classify_chunk_types,
+)
+from src.infrastructure.chunk_type_backfill import JOB_NAME, ChunkTypeBackfill
+
+
+# =============================================================================
+# SQL 기준 구현 (migration 030의 패턴을 연산자 단위로 그대로 옮김)
+# =============================================================================
+# (패턴, 대소문자 무시 여부) - SQL ~ 는 False, ~* 는 True
+SQL_RULE_PATTERNS = [
+    (r"해야\s*(합니다|한다|함)", False),
+    (r"하지\s*(마|말아야|않아야)", False),
+    (r"금지|원칙|규칙|필수|반드시", True),
+    (r"should\s+(always|never)", True),
+    (r"must\s+(be|have|not)", True),
+    (r"do\s+not|avoid", True),
+]
+
+SQL_EXAMPLE_PATTERNS = [
+    (r"예를\s*들어|예시|사례", False),
+    (r'"[^"]{10,}"', False),
+    (r"before\s*[:/]|after\s*[:/]", True),
+    (r"good\s*example|bad\s*example|for\s*example|e\.g\.", True),
+    (r"다음과\s*같", False),
+]
+
+
+def _compile_sql(pattern: str, icase: bool):
+    flags = re.ASCII | (re.IGNORECASE if icase else 0)
+    return re.compile(pattern.replace(r"\s", _PG_SPACE), flags)
+
+
+_SQL_RULES = [_compile_sql(p, i) for p, i in SQL_RULE_PATTERNS]
+_SQL_EXAMPLES = [_compile_sql(p, i) for p, i in SQL_EXAMPLE_PATTERNS]
+
+
+def sql_detect_chunk_type(content: str) -> str:
+    if any(p.search(content) for p in _SQL_RULES):
+        return "rule"
+    if any(p.search(content) for p in _SQL_EXAMPLES):
+        return "example"
+    return "general"
+
+
+# =============================================================================
+# 고정 사례 (SQL 결과 기준)
+# =============================================================================
+CASES = [
+    # 규칙
+    ("사용자는 반드시 로그인을 해야 한다.", "rule"),
+    ("비밀번호를 공유하지 마라.", "rule"),
+    ("글은 간결하게 작성해야 합니다.", "rule"),
+    ("작성해야함", "rule"),
+    ("이 규칙을 따르세요", "rule"),
+    ("You should always cite sources.", "rule"),
+    ("You SHOULD\tNEVER do that", "rule"),
+    ("Tables must be aligned", "rule"),
+    ("Please AVOID jargon", "rule"),
+    ("Do not repeat yourself", "rule"),
+    ("do\u3000not", "rule"),                 # U+3000 전각 공백 = PostgreSQL \s
+    # 예시
+    ("예를 들어, 사과와 같은 과일이 있다.", "example"),
+    ("예를들어", "example"),
+    ('"이것은 인용문입니다."', "example"),
+    ('"01234\n56789"', "example"),                # [^"]는 줄바꿈도 포함
+    ("Before: messy / After: clean", "example"),
+    ("BEFORE/after", "example"),
+    ("For example, this is a test.", "example"),
+    ("see e.g. the appendix", "example"),
+    ("다음과 같이 작성한다", "example"),
+    # 일반
+    ("이것은 일반적인 문장입니다.", "general"),
+    ("안녕하세요.", "general"),
+    ('"short"', "general"),
+    ("", "general"),
+    ("e.g without dot", "general"),
+    ("do\u00a0not", "general"),                 # NBSP는 PostgreSQL \s 아님
+    ("\u017fhould always", "general"),       # U+017F: PostgreSQL ~*는 ASCII만 대소문자 동일시
+    # 우선순위 (규칙 > 예시)
+    ("예를 들어, 비밀번호는 반드시 변경해야 한다.", "rule"),
+]
+
+
+@pytest.mark.parametrize("content,expected", CASES)
+def test_matches_sql_cases(content, expected):
+    assert sql_detect_chunk_type(content) == expected
+    assert classify_chunk_type(content) == expected
+
+
+# =============================================================================
+# 무작위 조합 비교 (결합 패턴 vs 패턴별 SQL 구현)
+# =============================================================================
+FRAGMENTS = [
+    "해야", "합니다", "한다", "함", "하지", "마", "말아야", "않아야", "금지", "원칙", "규칙",
+    "필수", "반드시", "should", "SHOULD", "always", "Never", "must", "MUST", "be", "have",
+    "not", "do", "Do", "avoid", "Avoid", "예를", "들어", "예시", "사례", "before", "After",
+    ":", "/", "good", "bad", "example", "EXAMPLE", "for", "e.g.", "E.G.", "e.g", "다음과", "같",
+    '"', "0123456789", "문장", "text", "\u017f", "\u212a", "\n",
+]
+SEPARATORS = ["", " ", "  ", "\t", "\n", "\u00a0", "\u3000", "\x1c", "\u2007", "\u2028"]
+
+
+def _random_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(1, 12)):
+        parts.append(rng.choice(FRAGMENTS))
+        parts.append(rng.choice(SEPARATORS))
+    return "".join(parts)
+
+
+def test_matches_sql_on_random_text():
+    rng = random.Random(20251225)
+    texts = [_random_text(rng) for _ in range(20000)]
+    for text in texts:
+        assert classify_chunk_type(text) == sql_detect_chunk_type(text), repr(text)
+
+
+def test_batch_matches_single():
+    rng = random.Random(7)
+    texts = [_random_text(rng) for _ in range(500)] + [None]
+    assert classify_chunk_types(texts) == [classify_chunk_type(t or "") for t in texts]
+
+
+# =============================================================================
+# 실제 PostgreSQL 비교 (opt-in)
+# =============================================================================
+# 주석(시니어 개발자): 위 SQL 기준 구현은 분류기와 같은 가정(_PG_SPACE, ASCII 대소문자)을 공유하므로
+# 실제 정규식 엔진과 달라지는 경우는 DB에 직접 물어봐야 잡힘 (migration 030 적용된 DB 필요)
+DETECT_MANY_SQL = """
+SELECT detect_chunk_type(u.content)::text AS chunk_type
+FROM unnest($1::text[]) WITH ORDINALITY AS u(content, ord)
+ORDER BY u.ord
+"""
+
+
+def _pg_detect_chunk_types(texts: list[str]) -> list[str]:
+    asyncpg = pytest.importorskip("asyncpg")
+
+    async def run() -> list[str]:
+        conn = await asyncpg.connect(os.environ["DATABASE_URL"])
+        try:
+            exists = await conn.fetchval("SELECT to_regprocedure('detect_chunk_type(text)') IS NOT NULL")
+            if not exists:
+                pytest.skip("detect_chunk_type(text) 없음 (migration 030 미적용 DB)")
+            rows = await conn.fetch(DETECT_MANY_SQL, texts)
+            return [row["chunk_type"] for row in rows]
+        finally:
+            await conn.close()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.skipif(not os.getenv("DATABASE_URL"), reason="DATABASE_URL 미설정 (실제 PostgreSQL 비교 생략)")
+def test_matches_postgres_detect_chunk_type():
+    rng = random.Random(20251225)
+    texts = [content for content, _ in CASES] + [_random_text(rng) for _ in range(20000)]
+
+    expected = _pg_detect_chunk_types(texts)
+
+    mismatches = [
+        (text, sql, classify_chunk_type(text))
+        for text, sql in zip(texts, expected)
+        if classify_chunk_type(text) != sql
+    ]
+    assert not mismatches, f"{len(mismatches)}건 불일치 (text, postgres, python): {mismatches[:10]!r}"
+    assert expected[:len(CASES)] == [label for _, label in CASES]
+
+
+# =============================================================================
+# 백필 (keyset 페이지네이션 / 체크포인트 재개)
+# =============================================================================
+class _FakeConn:
+    """SELECT_BATCH / UPDATE_BATCH / 체크포인트 SQL만 흉내내는 인메모리 커넥션"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def transaction(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def fetch(self, sql, last_id, limit):
+        rows = sorted(self.db["chunks"].items())
+        return [
+            {"id": chunk_id, "content": content, "chunk_type": chunk_type}
+            for chunk_id, (content, chunk_type) in rows
+            if last_id is None or chunk_id > last_id
+        ][:limit]
+
+    async def fetchrow(self, sql, job_name):
+        return self.db["checkpoints"].get(job_name)
+
+    async def execute(self, sql, *args):
+        if "UPDATE public.rag_chunks" in sql:
+            for chunk_id, chunk_type in zip(*args):
+                content, _ = self.db["chunks"][chunk_id]
+                self.db["chunks"][chunk_id] = (content, chunk_type)
+        elif "INSERT INTO public.job_checkpoints" in sql:
+            job_name, last_key, processed, updated, _ = args
+            previous = self.db["checkpoints"].get(job_name) or {"processed": 0, "updated": 0}
+            self.db["checkpoints"][job_name] = {
+                "last_key": last_key,
+                "processed": previous["processed"] + processed,
+                "updated": previous["updated"] + updated,
+            }
+        elif "DELETE FROM public.job_checkpoints" in sql:
+            self.db["checkpoints"].pop(args[0], None)
+
+
+class _FakePool:
+    def __init__(self, db):
+        self.db = db
+
+    def acquire(self):
+        return _FakeConn(self.db)
+
+
+def test_backfill_resumes_and_keeps_manual_types():
+    rng = random.Random(3)
+    chunks = {f"{i:04d}": (_random_text(rng), None) for i in range(95)}
+    chunks["0010"] = ("반드시 지켜야 하는 정의", "definition")
+    db = {"chunks": chunks, "checkpoints": {}}
+    backfill = ChunkTypeBackfill(_FakePool(db), batch_size=20)
+
+    first = asyncio.run(backfill.run(max_batches=2))
+    assert first["processed"] == 40 and not first["completed"]
+    assert db["checkpoints"][JOB_NAME]["last_key"] == "0039"
+    assert db["chunks"]["0050"][1] is None
+
+    second = asyncio.run(backfill.run())
+    assert second["processed"] == 55 and second["completed"]
+    assert db["checkpoints"][JOB_NAME]["processed"] == 95
+
+    for chunk_id, (content, chunk_type) in db["chunks"].items():
+        if chunk_id == "0010":
+            assert chunk_type == "definition"
+        else:
+            assert chunk_type == sql_detect_chunk_type(content)
@@ -0,0 +1,90 @@
+# =============================================================================
+# PRISM Writer Backend - Chunk Content Loader Tests
+# =============================================================================
+# 파일: backend/tests/test_chunk_content.py
+# 역할: 청크 내용 조회가 요청자 소유 문서로 한정되는지, 캐시가 사용자별로 분리되는지 검증
+#       (서비스 키 클라이언트는 RLS를 우회하므로 쿼리 조건이 유일한 경계)
+# =============================================================================
+
+import asyncio
+from types import SimpleNamespace
+
+from src.infrastructure.chunk_content import ChunkContentLoader
+
+ROWS = {
+    "c-alice": {
+        "id": "c-alice", "document_id": "d-alice", "content": "앨리스 청크", "metadata": {"page": 3},
+        "rag_documents": {"title": "앨리스 문서", "user_id": "alice"},
+    },
+    "c-bob": {
+        "id": "c-bob", "document_id": "d-bob", "content": "밥 청크", "metadata": {},
+        "rag_documents": {"title": "밥 문서", "user_id": "bob"},
+    },
+}
+
+
+class _Query:
+    def __init__(self, client):
+        self.client = client
+        self.ids = []
+        self.filters = {}
+
+    def select(self, columns):
+        self.client.selects.append(columns)
+        return self
+
+    def in_(self, column, values):
+        self.ids = list(values)
+        return self
+
+    def eq(self, column, value):
+        self.filters[column] = value
+        return self
+
+    async def execute(self):
+        self.client.queries += 1
+        owner = self.filters.get("rag_documents.user_id")
+        return SimpleNamespace(data=[
+            ROWS[i] for i in self.ids if i in ROWS and ROWS[i]["rag_documents"]["user_id"] == owner
+        ])
+
+
+class _Client:
+    def __init__(self):
+        self.queries = 0
+        self.selects = []
+
+    def table(self, name):
+        assert name == "rag_chunks"
+        return _Query(self)
+
+
+def test_only_owned_chunks_are_returned():
+    client = _Client()
+    loader = ChunkContentLoader(client)
+
+    found = asyncio.run(loader.get_many(["c-alice", "c-bob"], "alice"))
+
+    assert list(found) == ["c-alice"]
+    assert found["c-alice"]["source"] == "앨리스 문서 (p.3)"
+    assert "rag_documents!inner" in client.selects[0]
+
+
+def test_cache_is_partitioned_by_user():
+    client = _Client()
+    loader = ChunkContentLoader(client)
+
+    asyncio.run(loader.get_many(["c-alice"], "alice"))
+    assert asyncio.run(loader.get_many(["c-alice"], "bob")) == {}
+    assert client.queries == 2
+
+    assert "c-alice" in asyncio.run(loader.get_many(["c-alice"], "alice"))
+    assert client.queries == 2
+
+
+def test_anonymous_requests_get_nothing():
+    client = _Client()
+    loader = ChunkContentLoader(client)
+
+    assert asyncio.run(loader.get_many(["c-alice"], None)) == {}
+    assert client.queries == 0
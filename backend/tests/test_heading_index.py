@@ -0,0 +1,78 @@
+# =============================================================================
+# PRISM Writer Backend - Heading Index Tests
+# =============================================================================
+# 파일: backend/tests/test_heading_index.py
+# 역할: Supabase 헤딩 조회가 요청자 소유 문서로 한정되는지 검증
+#       (서비스 키 클라이언트는 RLS를 우회하므로 쿼리 조건이 유일한 경계)
+# =============================================================================
+
+import asyncio
+from types import SimpleNamespace
+
+from src.infrastructure.heading_index import HeadingIndex
+
+HEADINGS = [
+    {"document_id": "d-alice", "chunk_id": "c1", "title": "서론", "level": 1, "position": 0,
+     "parent_position": None, "rag_documents": {"user_id": "alice"}},
+    {"document_id": "d-bob", "chunk_id": "c2", "title": "비밀 계획", "level": 1, "position": 0,
+     "parent_position": None, "rag_documents": {"user_id": "bob"}},
+]
+
+
+class _Query:
+    def __init__(self, client):
+        self.client = client
+        self.doc_ids = []
+        self.owner = None
+
+    def select(self, columns):
+        self.client.selects.append(columns)
+        return self
+
+    def in_(self, column, values):
+        self.doc_ids = list(values)
+        return self
+
+    def eq(self, column, value):
+        assert column == "rag_documents.user_id"
+        self.owner = value
+        return self
+
+    def order(self, column):
+        return self
+
+    async def execute(self):
+        self.client.queries += 1
+        return SimpleNamespace(data=[
+            {**row, "rag_documents": dict(row["rag_documents"])}
+            for row in HEADINGS
+            if row["document_id"] in self.doc_ids and row["rag_documents"]["user_id"] == self.owner
+        ])
+
+
+class _Client:
+    def __init__(self):
+        self.queries = 0
+        self.selects = []
+
+    def table(self, name):
+        return _Query(self)
+
+
+def test_headings_are_scoped_to_owner():
+    client = _Client()
+    index = HeadingIndex(client)
+
+    headings = asyncio.run(index.get_headings(["d-alice", "d-bob"], user_id="alice"))
+
+    assert [h["title"] for h in headings] == ["서론"]
+    assert "rag_documents" not in headings[0]
+    assert "rag_documents!inner" in client.selects[0]
+
+
+def test_anonymous_lookup_returns_nothing():
+    client = _Client()
+    index = HeadingIndex(client)
+
+    assert asyncio.run(index.retrieve_structure(["d-alice"], topic="서론")) == []
+    assert client.queries == 0
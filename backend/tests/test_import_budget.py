@@ -0,0 +1,40 @@
+# =============================================================================
+# PRISM Writer Backend - Import Time Budget Tests
+# =============================================================================
+# 파일: backend/tests/test_import_budget.py
+# 역할: main.py 콜드 import 시간이 예산을 넘거나 무거운 의존성을 즉시 로드하면 실패
+#       (컨테이너 오토스케일링 / 카나리 배포 기동 시간 회귀 방지, docs/CANARY_DEPLOYMENT.md)
+# 예산 조정: IMPORT_BUDGET_MS 환경 변수 (느린 CI 러너 등)
+# =============================================================================
+
+import json
+import os
+import subprocess
+import sys
+
+from src.infrastructure.import_profile import BACKEND_ROOT, cumulative_ms, profile_imports
+from src.infrastructure.warmup import HEAVY_MODULES
+
+# 현재 약 0.45초 (대부분 fastapi/pydantic) - 무거운 의존성 하나만 붙어도 초과하도록 여유를 작게 둠
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1500"))
+
+
+def test_main_import_within_budget():
+    # 첫 측정은 .pyc 생성 비용이 포함될 수 있어 두 번 측정한 값 중 작은 값 사용
+    elapsed = min(cumulative_ms(profile_imports("import main"), "main") for _ in range(2))
+    assert elapsed <= IMPORT_BUDGET_MS, (
+        f"main.py import {elapsed:.0f}ms > 예산 {IMPORT_BUDGET_MS:.0f}ms "
+        f"(python -m src.infrastructure.import_profile 로 원인 확인)"
+    )
+
+
+def test_main_does_not_import_heavy_modules():
+    code = (
+        "import json, sys, main\n"
+        f"print(json.dumps(sorted(m for m in {list(HEAVY_MODULES)!r} if m in sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_ROOT, capture_output=True, text=True, check=True
+    )
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    assert loaded == [], f"main.py import 시 무거운 모듈 로드: {loaded} (사용 시점 import 또는 warmup으로 이동)"
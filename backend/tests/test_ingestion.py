@@ -0,0 +1,138 @@
+# =============================================================================
+# PRISM Writer Backend - Ingestion Pipeline Tests
+# =============================================================================
+# 파일: backend/tests/test_ingestion.py
+# 역할: PDF/일반 텍스트 헤딩 추정, 임베딩 동안 DB 커넥션을 잡지 않는지,
+#       스풀된 청크가 한 트랜잭션에서 빠짐없이 적재되는지 검증
+# =============================================================================
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.ingestion.chunking import _plain_heading, chunk_pages
+from src.infrastructure.ingestion.embedder import BatchEmbedder
+from src.infrastructure.ingestion.pipeline import IngestionPipeline
+from src.infrastructure.ingestion.writer import CREATE_STAGING_SQL
+
+
+# =============================================================================
+# 헤딩 추정
+# =============================================================================
+@pytest.mark.parametrize("line, expected", [
+    ("제1장 서론", ("제1장 서론", 1)),
+    ("제 2 절 연구 방법", ("제 2 절 연구 방법", 2)),
+    ("Chapter 3", ("Chapter 3", 1)),
+    ("1. 서론", ("1. 서론", 1)),
+    ("2.3 실험 결과", ("2.3 실험 결과", 2)),
+    ("2.3.1 데이터셋", ("2.3.1 데이터셋", 3)),
+    ("IV. 결론", ("IV. 결론", 1)),
+    ("2024 연차 보고서", None),
+    ("12", None),
+    ("1. 먼저 재료를 준비한다.", None),
+    ("3 " + "가" * 80, None),
+    ("평범한 본문 문장", None),
+])
+def test_plain_heading(line, expected):
+    assert _plain_heading(line) == expected
+
+
+def test_plain_headings_only_when_enabled():
+    pages = [(1, "1. 서론\n연구 배경을 설명한다.\n\n2. 방법\n실험 설계를 설명한다.")]
+
+    plain = chunk_pages(pages, plain_headings=True)
+    markdown = chunk_pages(pages)
+
+    assert [(c["metadata"].get("header"), c["metadata"].get("header_level")) for c in plain] == [
+        ("1. 서론", 1), ("2. 방법", 1)
+    ]
+    assert all("header" not in c["metadata"] for c in markdown)
+
+
+def test_markdown_headers_still_win_in_plain_mode():
+    chunks = chunk_pages([(1, "## 배경\n본문")], plain_headings=True)
+    assert chunks[0]["metadata"]["header"] == "배경"
+    assert chunks[0]["metadata"]["header_level"] == 2
+
+
+# =============================================================================
+# 파이프라인: 임베딩은 트랜잭션 밖에서
+# =============================================================================
+class _FakeConn:
+    def __init__(self, pool):
+        self.pool = pool
+        self.copied: list[tuple] = []
+        self.executed: list[str] = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.pool.in_transaction = True
+        try:
+            yield
+        finally:
+            self.pool.in_transaction = False
+
+    async def fetch(self, sql, *args):
+        return []
+
+    async def execute(self, sql, *args):
+        self.executed.append(sql)
+
+    async def copy_records_to_table(self, table, records, columns, schema_name=None):
+        if table == "ingest_chunks_staging":
+            assert self.pool.in_transaction
+            self.copied.extend(records)
+
+
+class _FakePool:
+    def __init__(self):
+        self.held = 0
+        self.in_transaction = False
+        self.conn = _FakeConn(self)
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.held += 1
+        try:
+            yield self.conn
+        finally:
+            self.held -= 1
+
+
+class _FakeEmbeddings:
+    def __init__(self, pool):
+        self.pool = pool
+        self.calls = 0
+
+    async def create(self, model, input, **kwargs):
+        assert self.pool.held == 0, "임베딩 중 풀 커넥션 점유"
+        self.calls += 1
+        await asyncio.sleep(0)
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(i)] * 4) for i in range(len(input))
+        ])
+
+
+def test_ingest_embeds_outside_transaction(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text(
+        "\n\n".join(f"{i}. 절 {i}\n본문 {i} " + "내용 " * 40 for i in range(1, 31)),
+        encoding="utf-8",
+    )
+    pool = _FakePool()
+    embeddings = _FakeEmbeddings(pool)
+    embedder = BatchEmbedder(SimpleNamespace(embeddings=embeddings), batch_size=4, max_concurrency=2)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pipeline = IngestionPipeline(pool, embedder, executor=executor, pages_per_task=1)
+        stats = asyncio.run(pipeline.ingest("doc-1", "user-1", str(path), "text/plain"))
+
+    assert embeddings.calls > 1
+    assert stats["chunks"] == len(pool.conn.copied) > 0
+    assert sorted(record[1] for record in pool.conn.copied) == list(range(stats["chunks"]))
+    assert stats["headings"] == 30
+    assert pool.conn.executed.count(CREATE_STAGING_SQL) == 1
+    assert pool.held == 0 and not pool.in_transaction
@@ -0,0 +1,68 @@
+# =============================================================================
+# PRISM Writer Backend - LLM Gateway Tests
+# =============================================================================
+# 파일: backend/tests/test_llm_gateway.py
+# 역할: 서킷 브레이커 half-open 시험 호출이 취소되어도 브레이커가 영구히 열린 채로 남지 않는지 검증
+# =============================================================================
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.llm_gateway import CircuitOpenError, LLMGateway
+
+
+def _gateway() -> LLMGateway:
+    return LLMGateway(max_retries=0, failure_threshold=1, reset_timeout=0.02)
+
+
+async def _fail():
+    raise RuntimeError("LLM 오류")
+
+
+async def _ok():
+    return "ok"
+
+
+def test_cancelled_trial_releases_half_open_slot():
+    gateway = _gateway()
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await gateway.run(_fail)
+        assert gateway.breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await gateway.run(_ok)
+
+        await asyncio.sleep(0.03)
+        trial = asyncio.ensure_future(gateway.run(lambda: asyncio.sleep(10)))
+        await asyncio.sleep(0)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        # 취소는 실패로 세지 않음 → 여전히 half-open, 다음 호출이 시험 호출
+        assert gateway.breaker.state == "half-open"
+        assert await gateway.run(_ok) == "ok"
+        assert gateway.breaker.state == "closed"
+
+    asyncio.run(scenario())
+    assert gateway.metrics.in_flight == 0
+
+
+def test_only_one_trial_in_half_open():
+    gateway = _gateway()
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await gateway.run(_fail)
+        await asyncio.sleep(0.03)
+
+        trial = asyncio.ensure_future(gateway.run(lambda: asyncio.sleep(0.01, "trial")))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await gateway.run(_ok)
+        assert await trial == "trial"
+        assert gateway.breaker.state == "closed"
+
+    asyncio.run(scenario())
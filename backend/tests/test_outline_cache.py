@@ -0,0 +1,66 @@
+# =============================================================================
+# PRISM Writer Backend - Outline Result Cache Tests
+# =============================================================================
+# 파일: backend/tests/test_outline_cache.py
+# 역할: 빈 목차(LLM 출력 파싱 실패)나 기본 목차가 캐시되어 재시도까지 같은 결과를 받는 일이 없는지 검증
+# =============================================================================
+
+import asyncio
+
+from src.application.use_cases.generate_outline import GenerateOutlineUseCase
+from src.infrastructure.outline_cache import OutlineResultCache
+
+
+class _ScriptedGateway:
+    """chat() 호출마다 준비된 응답을 순서대로 반환"""
+
+    client = None
+
+    def __init__(self, responses: list[str]):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def chat(self, messages, model, tier=1, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_get_or_compute_skips_empty_results():
+    cache = OutlineResultCache()
+    results = iter([(), ({"title": "서론", "depth": 1},)])
+
+    async def compute():
+        return next(results)
+
+    async def scenario():
+        assert await cache.get_or_compute("key", compute) == ()
+        assert len(cache.cache) == 0
+        assert await cache.get_or_compute("key", compute) == ({"title": "서론", "depth": 1},)
+        assert await cache.get_or_compute("key", compute) == ({"title": "서론", "depth": 1},)
+
+    asyncio.run(scenario())
+
+
+def test_parse_failure_is_not_served_from_cache():
+    gateway = _ScriptedGateway(["목차를 만들 수 없습니다", '[{"title": "서론", "depth": 1}]'])
+    use_case = GenerateOutlineUseCase(llm_gateway=gateway, result_cache=OutlineResultCache())
+
+    async def scenario():
+        assert await use_case.execute("주제", max_depth=3) == []
+        retried = await use_case.execute("주제", max_depth=3)
+        assert [item.title for item in retried] == ["서론"]
+        # 성공 결과는 캐시에서 재사용
+        assert [item.title for item in await use_case.execute("주제", max_depth=3)] == ["서론"]
+
+    asyncio.run(scenario())
+    assert gateway.calls == 2
+
+
+def test_default_outline_without_llm_is_not_cached():
+    cache = OutlineResultCache()
+    use_case = GenerateOutlineUseCase(result_cache=cache)
+
+    items = asyncio.run(use_case.execute("주제", max_depth=2))
+
+    assert items
+    assert len(cache.cache) == 0
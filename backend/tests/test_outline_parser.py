@@ -0,0 +1,66 @@
+# =============================================================================
+# PRISM Writer Backend - Incremental Outline Parser Tests
+# =============================================================================
+# 파일: backend/tests/test_outline_parser.py
+# 역할: 스트리밍 LLM 출력을 어떤 단위로 잘라 넣어도
+#       IncrementalOutlineParser가 한 번에 파싱한 것과 같은 객체를 내는지 검증
+# =============================================================================
+
+import json
+import random
+
+import pytest
+
+from src.application.use_cases.generate_outline import IncrementalOutlineParser
+
+ITEMS = [
+    {"title": "서론", "depth": 1},
+    {"title": "배경 {중괄호} 포함", "depth": 2},
+    {"title": "따옴표 \"인용\" 과 역슬래시 \\", "depth": 2},
+    {"title": "중첩", "depth": 1, "meta": {"source": ["a", "b"], "extra": {"x": 1}}},
+    {"title": "결론 ]", "depth": 1},
+]
+
+OUTPUT = "다음은 목차입니다.\n```json\n" + json.dumps(ITEMS, ensure_ascii=False, indent=2) + "\n```\n끝 [무시]"
+
+
+def _feed_in_pieces(text: str, sizes) -> list[dict]:
+    parser = IncrementalOutlineParser()
+    items, start = [], 0
+    for size in sizes:
+        items.extend(parser.feed(text[start:start + size]))
+        start += size
+    items.extend(parser.feed(text[start:]))
+    return items
+
+
+def test_parses_whole_output():
+    assert IncrementalOutlineParser().feed(OUTPUT) == ITEMS
+
+
+def test_character_by_character_matches_whole():
+    assert _feed_in_pieces(OUTPUT, [1] * len(OUTPUT)) == ITEMS
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_split_matches_whole(seed):
+    rng = random.Random(seed)
+    sizes = [rng.randint(1, 12) for _ in range(len(OUTPUT))]
+    assert _feed_in_pieces(OUTPUT, sizes) == ITEMS
+
+
+def test_objects_are_emitted_as_soon_as_they_close():
+    parser = IncrementalOutlineParser()
+    assert parser.feed('[{"title": "A", "depth": 1}, {"title": "B"') == [{"title": "A", "depth": 1}]
+    assert parser.feed(', "depth": 2}') == [{"title": "B", "depth": 2}]
+
+
+def test_ignores_everything_after_array_end():
+    parser = IncrementalOutlineParser()
+    assert parser.feed('[{"title": "A"}] [{"title": "B"}]') == [{"title": "A"}]
+    assert parser.feed('{"title": "C"}') == []
+
+
+def test_skips_malformed_object_and_continues():
+    parser = IncrementalOutlineParser()
+    assert parser.feed('[{"title": }, {"title": "ok", "depth": 1}]') == [{"title": "ok", "depth": 1}]
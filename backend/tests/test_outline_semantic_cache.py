@@ -0,0 +1,149 @@
+# =============================================================================
+# PRISM Writer Backend - Outline Semantic Cache Wiring Tests
+# =============================================================================
+# 파일: backend/tests/test_outline_semantic_cache.py
+# 역할: 목차 라우터가 주제 임베딩 검색기를 유스케이스에 주입해
+#       OUTLINE_SEMANTIC_CACHE=1 일 때 유사 주제 요청이 LLM 호출 없이 캐시에서 응답되는지,
+#       DATABASE_URL 기동 시 만든 app.state.vector_store가 검색기에 연결되는지 검증
+# =============================================================================
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.llm_gateway import LLMGateway
+from src.infrastructure.outline_cache import OutlineResultCache
+from src.infrastructure.semantic_cache import SemanticOutlineCache
+from src.presentation.api import outline
+
+# 주제별 임베딩 (앞의 두 주제는 코사인 유사도 ≈ 0.995, 세 번째는 직교)
+TOPIC_VECTORS = {
+    "AI 시대의 글쓰기 방법론": [1.0, 0.0, 0.0],
+    "AI 시대 글쓰기 방법론": [0.995, 0.1, 0.0],
+    "양자 컴퓨팅 입문": [0.0, 0.0, 1.0],
+}
+
+OUTLINE_JSON = '[{"title": "서론", "depth": 1}, {"title": "본론", "depth": 1}]'
+
+
+class _FakeOpenAI:
+    """chat.completions.create / embeddings.create 만 흉내내는 클라이언트"""
+
+    def __init__(self):
+        self.chat_calls = 0
+        self.prompts = []
+        self.embedded = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._complete))
+        self.embeddings = SimpleNamespace(create=self._embed)
+
+    async def _complete(self, model, messages, **kwargs):
+        self.chat_calls += 1
+        self.prompts.append(messages[-1]["content"])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=OUTLINE_JSON))])
+
+    async def _embed(self, model, input):
+        self.embedded.extend(input)
+        return SimpleNamespace(data=[SimpleNamespace(embedding=TOPIC_VECTORS[text]) for text in input])
+
+
+class _FakeConnection:
+    def __init__(self, store):
+        self.store = store
+
+    async def fetch(self, sql, doc_ids, user_id):
+        self.store.queries.append((list(doc_ids), user_id))
+        return [
+            {"document_id": "d1", "chunk_id": "c1", "title": "풀에서 읽은 헤딩", "level": 1,
+             "position": 0, "parent_position": None}
+        ]
+
+
+class _FakeAcquire:
+    def __init__(self, store):
+        self.store = store
+
+    async def __aenter__(self):
+        return _FakeConnection(self.store)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeVectorStore:
+    """AsyncpgVectorStore 대역 (헤딩 조회에 쓰는 acquire()만 제공)"""
+
+    def __init__(self):
+        self.queries = []
+
+    def acquire(self):
+        return _FakeAcquire(self)
+
+
+@pytest.fixture
+def outline_client(monkeypatch):
+    openai_client = _FakeOpenAI()
+    semantic_cache = SemanticOutlineCache(threshold=0.92)
+    monkeypatch.setattr(outline, "get_supabase_client", lambda: None)
+    monkeypatch.setattr(outline, "_document_versions", None)
+    monkeypatch.setattr(outline, "_llm_gateway", LLMGateway(openai_client))
+    monkeypatch.setattr(outline, "_retriever", None)
+    monkeypatch.setattr(outline, "_outline_result_cache", OutlineResultCache())
+    monkeypatch.setattr(outline, "_semantic_outline_cache", semantic_cache)
+    app = FastAPI()
+    app.include_router(outline.router, prefix="/v1/outline")
+    app.state.vector_store = None
+
+    @app.middleware("http")
+    async def identify(request, call_next):
+        # AdmissionMiddleware가 내부 토큰을 확인한 뒤 설정하는 값
+        request.state.user_id = "u1"
+        return await call_next(request)
+
+    return TestClient(app), openai_client, semantic_cache
+
+
+def _generate(client: TestClient, topic: str) -> dict:
+    response = client.post("/v1/outline/generate", json={"topic": topic, "max_depth": 2})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_near_duplicate_topic_hits_semantic_cache(outline_client):
+    client, openai_client, semantic_cache = outline_client
+
+    first = _generate(client, "AI 시대의 글쓰기 방법론")
+    second = _generate(client, "AI 시대 글쓰기 방법론")
+
+    assert [item["title"] for item in second["outline"]] == [item["title"] for item in first["outline"]]
+    assert second["topic"] == "AI 시대 글쓰기 방법론"
+    assert openai_client.chat_calls == 1
+    assert openai_client.embedded == ["AI 시대의 글쓰기 방법론", "AI 시대 글쓰기 방법론"]
+    assert semantic_cache.stats()["hits"] == 1
+
+
+def test_unrelated_topic_misses_semantic_cache(outline_client):
+    client, openai_client, semantic_cache = outline_client
+
+    _generate(client, "AI 시대의 글쓰기 방법론")
+    _generate(client, "양자 컴퓨팅 입문")
+
+    assert openai_client.chat_calls == 2
+    assert semantic_cache.stats()["hits"] == 0
+
+
+def test_router_retriever_uses_pool_vector_store(outline_client):
+    client, openai_client, _ = outline_client
+    store = _FakeVectorStore()
+    client.app.state.vector_store = store
+
+    response = client.post(
+        "/v1/outline/generate",
+        json={"topic": "AI 시대의 글쓰기 방법론", "document_ids": ["d1"], "max_depth": 2}
+    )
+
+    assert response.status_code == 200
+    assert outline._retriever.vector_store is store
+    assert store.queries == [(["d1"], "u1")]
+    assert "풀에서 읽은 헤딩" in openai_client.prompts[0]
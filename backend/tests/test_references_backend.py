@@ -0,0 +1,76 @@
+# =============================================================================
+# PRISM Writer Backend - References Backend Selection Tests
+# =============================================================================
+# 파일: backend/tests/test_references_backend.py
+# 역할: REFERENCES_BACKEND=supabase일 때 라우터가 Supabase 클라이언트로 저장소를 만들고,
+#       클라이언트 설정이 없으면 요청마다 500이 아니라 기동 시점에 실패하는지 검증
+# =============================================================================
+
+from types import SimpleNamespace
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.references_repository import SupabaseReferencesRepository
+from src.presentation.api import references
+
+
+class _FakeInsert:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute(self):
+        return SimpleNamespace(data=[
+            {"id": str(uuid.uuid4()), "created_at": "2026-01-01T00:00:00+00:00", **row} for row in self.rows
+        ])
+
+
+class _FakeSupabase:
+    def __init__(self):
+        self.inserted = []
+
+    def table(self, name):
+        assert name == "draft_references"
+        return SimpleNamespace(insert=lambda rows: self.inserted.extend(rows) or _FakeInsert(rows))
+
+
+@pytest.fixture
+def supabase_backend(monkeypatch):
+    monkeypatch.setenv("REFERENCES_BACKEND", "supabase")
+    monkeypatch.setattr(references, "_references_repository", None)
+
+
+def test_supabase_backend_uses_shared_client(supabase_backend, monkeypatch):
+    client = _FakeSupabase()
+    monkeypatch.setattr(references, "get_supabase_client", lambda: client)
+    app = FastAPI()
+    app.include_router(references.router, prefix="/v1")
+
+    response = TestClient(app).post(
+        "/v1/drafts/d1/references", json={"chunk_id": "c1", "paragraph_index": 0}
+    )
+
+    assert response.status_code == 201
+    assert response.json()["chunk_id"] == "c1"
+    assert client.inserted == [
+        {"draft_id": "d1", "chunk_id": "c1", "paragraph_index": 0, "reference_type": "citation"}
+    ]
+    assert isinstance(references.get_references_repository(), SupabaseReferencesRepository)
+
+
+def test_missing_supabase_client_fails_at_startup(supabase_backend, monkeypatch):
+    monkeypatch.setattr(references, "get_supabase_client", lambda: None)
+
+    with pytest.raises(ValueError, match="SUPABASE_URL"):
+        references.check_references_backend()
+
+
+def test_sqlite_backend_stays_lazy(monkeypatch):
+    monkeypatch.setenv("REFERENCES_BACKEND", "sqlite")
+    monkeypatch.setattr(references, "_references_repository", None)
+
+    references.check_references_backend()
+
+    assert references._references_repository is None
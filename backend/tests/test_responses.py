@@ -0,0 +1,87 @@
+# =============================================================================
+# PRISM Writer Backend - ETag / Cursor Response Helper Tests
+# =============================================================================
+# 파일: backend/tests/test_responses.py
+# 역할: If-None-Match 비교, ETag 304 응답, 키셋 커서 인코딩 왕복 검증
+# =============================================================================
+
+import base64
+
+import pytest
+from starlette.requests import Request
+
+from src.presentation.api.responses import (
+    EncodedJSON,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    etag_matches,
+    json_response,
+)
+
+ETAG = '"0123456789abcdef"'
+
+
+@pytest.mark.parametrize("if_none_match, expected", [
+    (None, False),
+    ("", False),
+    (ETAG, True),
+    (f"W/{ETAG}", True),
+    (f'"other", {ETAG}', True),
+    (f' "other" ,W/{ETAG} ', True),
+    ("*", True),
+    (' * ', True),
+    ('"other"', False),
+    (ETAG.strip('"'), False),
+])
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, ETAG) is expected
+
+
+def _request(headers: dict) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def test_json_response_returns_304_for_matching_etag():
+    encoded = EncodedJSON.encode({"items": [1, 2, 3], "title": "서론"})
+
+    full = json_response(_request({}), encoded)
+    not_modified = json_response(_request({"If-None-Match": encoded.etag}), encoded)
+
+    assert full.status_code == 200 and full.body == encoded.body
+    assert not_modified.status_code == 304 and not_modified.body == b""
+    assert not_modified.headers["etag"] == full.headers["etag"] == encoded.etag
+
+
+def test_etag_depends_only_on_body():
+    assert EncodedJSON.encode({"a": 1}).etag == EncodedJSON.encode({"a": 1}).etag
+    assert EncodedJSON.encode({"a": 1}).etag != EncodedJSON.encode({"a": 2}).etag
+
+
+@pytest.mark.parametrize("values", [
+    [0, "00000000-0000-0000-0000-000000000000"],
+    [12, "참조-id"],
+    [],
+    [None, 1.5, True, "a/b+c="],
+])
+def test_cursor_round_trip(values):
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor) == values
+
+
+@pytest.mark.parametrize("cursor", [
+    "!!!not-base64!!!",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    base64.urlsafe_b64encode(b'{"paragraph_index": 1}').decode(),
+    "a",
+])
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
@@ -0,0 +1,132 @@
+# =============================================================================
+# PRISM Writer Backend - SQLite References Repository Tests
+# =============================================================================
+# 파일: backend/tests/test_sqlite_references.py
+# 역할: SQLite 저장소가 인메모리 저장소와 같은 결과를 내는지,
+#       같은 파일을 여는 다른 인스턴스(= 다른 워커)와 상태를 공유하는지 검증
+# =============================================================================
+
+import asyncio
+import random
+
+import pytest
+
+from src.infrastructure.references_repository import (
+    DraftNotFoundError,
+    DuplicateReferenceError,
+    InMemoryReferencesRepository,
+    create_references_repository,
+)
+from src.infrastructure.sqlite_references import SQLiteReferencesRepository
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "references.sqlite3")
+
+
+def _slots(references: list[dict]) -> list[tuple]:
+    return sorted((r["chunk_id"], r["paragraph_index"], r["reference_type"]) for r in references)
+
+
+def test_matches_in_memory_repository(db_path):
+    sqlite_repo = SQLiteReferencesRepository(db_path)
+    memory_repo = InMemoryReferencesRepository()
+    rng = random.Random(7)
+
+    async def apply(repo, op, *args):
+        try:
+            return await getattr(repo, op)(*args)
+        except (DuplicateReferenceError, DraftNotFoundError) as e:
+            return type(e).__name__
+
+    async def ids_for(repo, draft_id: str, slots: set) -> list[str]:
+        return [
+            r["id"] for r in await repo.list_for_draft(draft_id)
+            if (r["chunk_id"], r["paragraph_index"]) in slots
+        ]
+
+    async def scenario():
+        for _ in range(300):
+            draft_id = f"d{rng.randint(0, 2)}"
+            kind = rng.random()
+            if kind < 0.5:
+                items = [
+                    {"chunk_id": f"c{rng.randint(0, 20)}", "paragraph_index": rng.randint(0, 15)}
+                    for _ in range(rng.randint(1, 4))
+                ]
+                expected = await apply(memory_repo, "create_many", draft_id, items)
+                result = await apply(sqlite_repo, "create_many", draft_id, items)
+                if isinstance(expected, list):
+                    assert _slots(result) == _slots(expected)
+                else:
+                    assert result == expected
+            elif kind < 0.8:
+                args = (draft_id, rng.randint(0, 15), rng.randint(0, 3), rng.randint(0, 3))
+                assert await apply(sqlite_repo, "shift_paragraphs", *args) == \
+                    await apply(memory_repo, "shift_paragraphs", *args)
+            else:
+                existing = await memory_repo.list_for_draft(draft_id)
+                slots = {(r["chunk_id"], r["paragraph_index"]) for r in rng.sample(existing, min(2, len(existing)))}
+                expected = await apply(memory_repo, "delete_many", draft_id, await ids_for(memory_repo, draft_id, slots))
+                result = await apply(sqlite_repo, "delete_many", draft_id, await ids_for(sqlite_repo, draft_id, slots))
+                assert result == expected
+
+            assert _slots(await sqlite_repo.list_for_draft(draft_id)) == _slots(
+                await memory_repo.list_for_draft(draft_id)
+            )
+
+    asyncio.run(scenario())
+    sqlite_repo.close()
+
+
+def test_state_shared_between_instances(db_path):
+    """같은 파일을 여는 두 인스턴스 = uvicorn 워커 2개"""
+    worker_a = SQLiteReferencesRepository(db_path)
+    worker_b = SQLiteReferencesRepository(db_path)
+
+    async def scenario():
+        created = await worker_a.create("draft", {"chunk_id": "c1", "paragraph_index": 3})
+        assert [r["id"] for r in await worker_b.list_for_draft("draft")] == [created["id"]]
+        assert await worker_b.version("draft") == await worker_a.version("draft") == "1"
+
+        with pytest.raises(DuplicateReferenceError):
+            await worker_b.create("draft", {"chunk_id": "c1", "paragraph_index": 3})
+
+        assert await worker_b.shift_paragraphs("draft", 0, insert_count=2) == {"deleted": 0, "shifted": 1}
+        assert (await worker_a.list_for_draft("draft"))[0]["paragraph_index"] == 5
+        assert await worker_a.version("draft") == "2"
+
+    asyncio.run(scenario())
+    worker_a.close()
+    worker_b.close()
+
+
+def test_concurrent_writes_are_group_committed(db_path):
+    repo = SQLiteReferencesRepository(db_path)
+
+    async def scenario():
+        # 같은 슬롯 요청 1건이 중복으로 실패해도 같은 배치의 다른 요청은 커밋됨
+        tasks = [
+            repo.create("draft", {"chunk_id": f"c{i}", "paragraph_index": i})
+            for i in range(200)
+        ] + [repo.create("draft", {"chunk_id": "c0", "paragraph_index": 0})]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert sum(isinstance(r, DuplicateReferenceError) for r in results) == 1
+        assert len(await repo.list_for_draft("draft")) == 200
+
+        page = await repo.list_page("draft", after=(99, "\uffff"), limit=10)
+        assert [r["paragraph_index"] for r in page] == list(range(100, 110))
+
+    asyncio.run(scenario())
+    assert repo.stats()["batches"] < 201
+    repo.close()
+
+
+def test_factory_uses_configured_path(db_path, monkeypatch):
+    monkeypatch.setenv("REFERENCES_SQLITE_PATH", db_path)
+    repo = create_references_repository("sqlite")
+
+    assert repo.path == db_path
+    repo.close()